@@ -1,5 +1,9 @@
 """The building blocks for making devices."""
 
+from typing import TYPE_CHECKING
+
+from ._binary_settings import BinarySettingsProvider
+from ._chunking import ChunkPolicy, ReadPattern
 from ._command import (
     NO_ARG_VOID_SIGNATURE,
     Command,
@@ -34,6 +38,7 @@ from ._detector import (
     TriggerInfo,
 )
 from ._device import (
+    ConnectScheduler,
     Device,
     DeviceConnector,
     DeviceMock,
@@ -80,6 +85,7 @@ from ._path_providers import (
     FilenameProvider,
     PathInfo,
     PathProvider,
+    ReservingPathProvider,
     StaticFilenameProvider,
     StaticPathProvider,
     UUIDFilenameProvider,
@@ -100,9 +106,18 @@ from ._readable import (
     StandardReadable,
     StandardReadableFormat,
 )
-from ._settings import Settings, SettingsProvider
+from ._settings import (
+    ApplyAfter,
+    Settings,
+    SettingsProvider,
+    settings_hash,
+)
 from ._signal import (
+    ConnectionMonitor,
     Ignore,
+    ObserveOverflow,
+    ObserveQueue,
+    OnChange,
     Signal,
     SignalConnector,
     SignalDict,
@@ -111,11 +126,14 @@ from ._signal import (
     SignalW,
     SignalX,
     observe_signals_value,
+    observe_signals_value_batches,
     observe_value,
     set_and_wait_for_other_value,
     set_and_wait_for_value,
     soft_signal_r_and_setter,
     soft_signal_rw,
+    wait_for_all,
+    wait_for_any,
     wait_for_value,
     walk_config_signals,
     walk_devices,
@@ -130,7 +148,7 @@ from ._signal_backend import (
     SignalMetadata,
     make_datakey,
 )
-from ._soft_signal_backend import SoftSignalBackend
+from ._soft_signal_backend import PollStatistics, SoftSignalBackend
 from ._status import AsyncStatus, WatchableAsyncStatus, completed_status
 from ._utils import (
     CALCULATE_TIMEOUT,
@@ -154,13 +172,27 @@ from ._utils import (
     non_zero,
     wait_for_connection,
 )
-from ._yaml_settings import YamlSettingsProvider
+
+if TYPE_CHECKING:
+    from ._yaml_settings import YamlSettingsProvider
+
+# Members of rarely used modules with slow imports, imported on first access
+_lazy_imports = {
+    "YamlSettingsProvider": "._yaml_settings",
+}
 
 
-# Back compat - delete before 1.0
 def __getattr__(name):
     import warnings
 
+    if module_name := _lazy_imports.get(name):
+        import importlib
+
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    # Back compat - delete before 1.0
     renames = {
         "NotConnected": NotConnectedError,
     }
@@ -184,6 +216,7 @@ __all__ = [
     "DeviceAnnotation",
     "DeviceVector",
     "DeviceProcessor",
+    "ConnectScheduler",
     "init_devices",
     # Movable
     "MovableLogic",
@@ -225,6 +258,7 @@ __all__ = [
     "Primitive",
     # Soft signal
     "SoftSignalBackend",
+    "PollStatistics",
     "soft_signal_r_and_setter",
     "soft_signal_rw",
     # Mock signal
@@ -247,7 +281,13 @@ __all__ = [
     # Signal utilities
     "observe_value",
     "observe_signals_value",
+    "observe_signals_value_batches",
+    "ObserveQueue",
+    "ObserveOverflow",
+    "OnChange",
     "wait_for_value",
+    "wait_for_all",
+    "wait_for_any",
     "set_and_wait_for_value",
     "set_and_wait_for_other_value",
     "walk_rw_signals",
@@ -255,6 +295,7 @@ __all__ = [
     "walk_devices",
     "walk_signal_sources",
     "SignalDict",
+    "ConnectionMonitor",
     # Readable
     "StandardReadable",
     "StandardReadableFormat",
@@ -275,6 +316,7 @@ __all__ = [
     "StaticFilenameProvider",
     "AutoIncrementFilenameProvider",
     "AutoMaxIncrementingPathProvider",
+    "ReservingPathProvider",
     "UUIDFilenameProvider",
     # Data Providers
     "ReadableDataProvider",
@@ -282,6 +324,8 @@ __all__ = [
     "SignalDataProvider",
     "StreamResourceInfo",
     "StreamResourceDataProvider",
+    "ChunkPolicy",
+    "ReadPattern",
     # Flyer
     "StandardFlyer",
     "FlyMotorInfo",
@@ -289,7 +333,10 @@ __all__ = [
     # Settings
     "Settings",
     "SettingsProvider",
+    "settings_hash",
+    "ApplyAfter",
     "YamlSettingsProvider",
+    "BinarySettingsProvider",
     # Utils
     "config_ophyd_async_logging",
     "CALCULATE_TIMEOUT",
@@ -0,0 +1,172 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ._settings import SettingsProvider
+from ._utils import ConfinedModel
+
+# Array data is aligned in the data file so it can be viewed without copying
+_ALIGNMENT = 64
+# Only arrays of these kinds can be memory mapped, others are stored in the index
+_MAPPABLE_KINDS = "biufc"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, np.ndarray):
+        return value.tolist()
+    elif isinstance(value, ConfinedModel):
+        return value.model_dump(mode="python")
+    raise TypeError(f"Cannot serialize {value!r} of type {type(value)}")
+
+
+class _DataWriter:
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.nbytes = 0
+
+    def add(self, array: np.ndarray) -> dict[str, Any]:
+        padding = -self.nbytes % _ALIGNMENT
+        if padding:
+            self.chunks.append(bytes(padding))
+            self.nbytes += padding
+        entry = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": self.nbytes,
+        }
+        data = np.ascontiguousarray(array).tobytes()
+        self.chunks.append(data)
+        self.nbytes += len(data)
+        return entry
+
+    def encode(self, value: Any) -> dict[str, Any]:
+        if isinstance(value, ConfinedModel):
+            value = value.model_dump(mode="python")
+        if isinstance(value, dict):
+            return {"dict": {k: self.encode(v) for k, v in value.items()}}
+        elif isinstance(value, np.ndarray) and value.dtype.kind in _MAPPABLE_KINDS:
+            return {"array": self.add(value)}
+        else:
+            return {"value": value}
+
+
+def _decode(entry: dict[str, Any], data: np.ndarray) -> Any:
+    if "dict" in entry:
+        return {k: _decode(v, data) for k, v in entry["dict"].items()}
+    elif "array" in entry:
+        info = entry["array"]
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        start = info["offset"]
+        stop = start + dtype.itemsize * int(np.prod(shape))
+        return data[start:stop].view(dtype).reshape(shape)
+    else:
+        return entry["value"]
+
+
+def _replace(path: Path, contents: bytes | list[bytes]):
+    # Write to a temporary file then rename, so readers never see a partial file
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name, suffix=".tmp", delete=False
+    ) as file:
+        if isinstance(contents, bytes):
+            file.write(contents)
+        else:
+            file.writelines(contents)
+    try:
+        os.replace(file.name, path)
+    except OSError:
+        os.unlink(file.name)
+        raise
+
+
+class BinarySettingsProvider(SettingsProvider):
+    """For providing settings from a binary file with a JSON index to signals.
+
+    Numeric arrays, including the columns of a `Table`, are stored natively in a
+    ``<name>-<hash>.bin`` file and memory mapped when retrieved, so large arrays are
+    neither converted to text nor copied. Everything else is stored in a small
+    ``<name>.json`` index alongside it. The retrieved data is the same as that
+    from `YamlSettingsProvider`, with arrays returned as read-only views.
+
+    The data file is named after a hash of its contents by the index, so replacing
+    the index is the only step that changes the stored settings, and a data file
+    is never overwritten while it may be memory mapped.
+    """
+
+    def __init__(self, directory: Path | str):
+        self._directory = Path(directory)
+
+    def _index_path(self, name: str) -> Path:
+        return self._directory / (name + ".json")
+
+    def _read_index(self, name: str) -> dict[str, Any]:
+        with open(self._index_path(name), "rb") as file:
+            return json.load(file)
+
+    def _map_data(self, data_file: str | None) -> np.ndarray:
+        if data_file is None:
+            # No arrays were stored, and an empty file can't be memory mapped
+            return np.empty(0, dtype=np.uint8)
+        mapped = np.memmap(self._directory / data_file, dtype=np.uint8, mode="r")
+        return mapped.view(np.ndarray)
+
+    def _store(self, name: str, data: dict[str, Any]):
+        writer = _DataWriter()
+        settings = {k: writer.encode(v) for k, v in data.items()}
+        data_file = None
+        if writer.nbytes:
+            digest = hashlib.sha256()
+            for chunk in writer.chunks:
+                digest.update(chunk)
+            data_file = f"{name}-{digest.hexdigest()[:16]}.bin"
+            data_path = self._directory / data_file
+            if not data_path.exists():
+                _replace(data_path, writer.chunks)
+        try:
+            previous = self._read_index(name)["data"]
+        except (OSError, ValueError, KeyError):
+            previous = None
+        _replace(
+            self._index_path(name),
+            json.dumps(
+                {"data": data_file, "settings": settings}, default=_json_default
+            ).encode(),
+        )
+        if previous and previous != data_file:
+            # On Windows this fails if the old data is still memory mapped, so
+            # leave it behind
+            with contextlib.suppress(OSError):
+                (self._directory / previous).unlink()
+
+    def _retrieve(self, name: str) -> dict[str, Any]:
+        index = self._read_index(name)
+        try:
+            data = self._map_data(index["data"])
+        except FileNotFoundError:
+            # A store removed the data file since we read the index, so the
+            # index it replaced it with will name one that exists
+            index = self._read_index(name)
+            data = self._map_data(index["data"])
+        return {k: _decode(v, data) for k, v in index["settings"].items()}
+
+    async def store(self, name: str, data: dict[str, Any]):
+        # Do file I/O in a thread so we don't block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._store, name, data)
+
+    async def retrieve(self, name: str) -> dict[str, Any]:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._retrieve, name
+        )
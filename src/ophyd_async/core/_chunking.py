@@ -0,0 +1,102 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._utils import StrictEnum
+
+
+class ReadPattern(StrictEnum):
+    """How the frames in a dataset are expected to be read back."""
+
+    FRAMES = "frames"
+    """Whole frames at a time, like images viewed one by one"""
+
+    TIME_SERIES = "time_series"
+    """A few elements from many frames at a time, like a pixel plotted against time"""
+
+
+@dataclass
+class ChunkPolicy:
+    """Decide how the datasets a detector writes should be chunked and compressed.
+
+    Pass one to a data logic that supports it, and it will be used to configure the
+    file writer and describe the chunks in the StreamResource. Subclass and override
+    `ChunkPolicy.chunk_shape` and `ChunkPolicy.frames_per_chunk` to use a different
+    strategy.
+
+    :param target_chunk_bytes: The uncompressed size to aim for in each chunk.
+    :param max_fill_time:
+        The longest a chunk should take to fill in seconds, as readers may have to
+        wait for a chunk to be complete. This is ignored if the data logic doesn't
+        know the frame rate and passes None for it.
+    :param read_pattern: How array datasets are expected to be read back.
+    :param time_series_frames:
+        For `ReadPattern.TIME_SERIES`, split frames into tiles until this many
+        frames fit in a chunk of the target size.
+    :param compression:
+        The compression the writer should use, in its own naming, e.g. ``BSLZ4``.
+        None means leave it as the data logic's default.
+    """
+
+    target_chunk_bytes: int = 1024 * 1024
+    max_fill_time: float = 1.0
+    read_pattern: ReadPattern = ReadPattern.FRAMES
+    time_series_frames: int = 128
+    compression: str | None = None
+
+    def _max_frames(self, frame_rate: float | None) -> int | None:
+        if frame_rate:
+            return max(1, math.floor(frame_rate * self.max_fill_time))
+        return None
+
+    def _frames_that_fit(
+        self, frame_shape: Sequence[int], itemsize: int, max_frames: int | None
+    ) -> int:
+        frames = max(1, self.target_chunk_bytes // (math.prod(frame_shape) * itemsize))
+        return min(frames, max_frames) if max_frames else frames
+
+    def chunk_shape(
+        self,
+        frame_shape: Sequence[int],
+        dtype_numpy: str,
+        frame_rate: float | None = None,
+    ) -> tuple[int, ...]:
+        """Return the chunk shape for a dataset of frames.
+
+        :param frame_shape: The shape of a single frame, () for scalars.
+        :param dtype_numpy: The numpy dtype of the dataset, e.g. ``<u2``.
+        :param frame_rate: How many frames are written per second, if known.
+        :return: The chunk shape, with the number of frames first.
+        """
+        tile = [max(dim, 1) for dim in frame_shape]
+        itemsize = np.dtype(dtype_numpy).itemsize
+        max_frames = self._max_frames(frame_rate)
+        if self.read_pattern == ReadPattern.TIME_SERIES:
+            wanted = min(self.time_series_frames, max_frames or self.time_series_frames)
+            # Halve the largest dimension of the tile until enough frames fit
+            while self._frames_that_fit(tile, itemsize, None) < wanted and any(
+                dim > 1 for dim in tile
+            ):
+                largest = tile.index(max(tile))
+                tile[largest] = math.ceil(tile[largest] / 2)
+        return (self._frames_that_fit(tile, itemsize, max_frames), *tile)
+
+    def frames_per_chunk(
+        self,
+        frame_shape: Sequence[int],
+        dtype_numpy: str,
+        frame_rate: float | None = None,
+    ) -> int:
+        """Return the number of frames per chunk for writers that chunk whole frames.
+
+        :param frame_shape: The shape of a single frame, () for scalars.
+        :param dtype_numpy: The numpy dtype of the dataset, e.g. ``<u2``.
+        :param frame_rate: How many frames are written per second, if known.
+        """
+        return self._frames_that_fit(
+            [max(dim, 1) for dim in frame_shape],
+            np.dtype(dtype_numpy).itemsize,
+            self._max_frames(frame_rate),
+        )
@@ -8,7 +8,7 @@ from functools import cached_property
 from typing import Generic, cast
 from unittest.mock import AsyncMock
 
-from ._device import Device, DeviceConnector, LazyMock
+from ._device import ConnectScheduler, Device, DeviceConnector, LazyMock
 from ._soft_signal_backend import SoftConverter, make_converter
 from ._status import AsyncStatus
 from ._utils import (
@@ -69,7 +69,9 @@ class CommandConnector(DeviceConnector, Generic[P, T]):
         """Connect the backend to real hardware."""
         self.backend = self._init_backend
         device.log.debug(f"Connecting to {self.backend.source(device.name)}")
-        await self.backend.connect(timeout)
+        await ConnectScheduler.connect_leaf(
+            device, lambda: self.backend.connect(timeout)
+        )
 
 
 class Command(Device, Generic[P, T]):
@@ -1,3 +1,4 @@
+import asyncio
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
@@ -98,12 +99,14 @@ class StreamResourceDataProvider(StreamableDataProvider):
         resources: Sequence[StreamResourceInfo],
         mimetype: str,
         collections_written_signal: SignalR[int],
-        flush_signal: SignalW[bool] | None = None,
+        flush_signal: SignalW[bool] | Sequence[SignalW[bool]] | None = None,
     ) -> None:
         self.uri = uri
         self.resources = list(resources)
         self.collections_written_signal = collections_written_signal
-        self.flush_signal = flush_signal
+        if isinstance(flush_signal, SignalW):
+            flush_signal = [flush_signal]
+        self.flush_signals = list(flush_signal or [])
         self.last_emitted = 0
         bundler_composer = ComposeStreamResource()
         self.bundles = [
@@ -139,8 +142,8 @@ class StreamResourceDataProvider(StreamableDataProvider):
     async def make_stream_docs(
         self, collections_written: int, collections_per_event: int
     ) -> AsyncIterator[StreamAsset]:
-        if self.flush_signal:
-            await self.flush_signal.set(True)
+        if self.flush_signals:
+            await asyncio.gather(*[signal.set(True) for signal in self.flush_signals])
         # TODO: fail if we get dropped frames
         indices_written = collections_written // collections_per_event
         if indices_written and not self.last_emitted:
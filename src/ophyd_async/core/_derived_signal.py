@@ -11,7 +11,9 @@ from typing import (
     is_typeddict,
 )
 
+import numpy as np
 from bluesky.protocols import Locatable
+from numpy.typing import ArrayLike
 
 from ._derived_signal_backend import (
     DerivedSignalBackend,
@@ -212,6 +214,31 @@ class DerivedSignalFactory(Generic[TransformT]):
         """Return an instance of `transform_cls` with all the parameters filled in."""
         return await self._transformer.get_transform()
 
+    async def raw_to_derived_batch(self, **raw: ArrayLike) -> dict[str, np.ndarray]:
+        """Map arrays of raw values to derived values with the current Transform.
+
+        Useful for converting a whole scan path at once, e.g. when planning a
+        trajectory. The arrays are broadcast against each other, and any raw
+        values not given are taken from the current values of their Devices.
+        If `transform_cls.raw_to_derived` uses numpy operations then it is
+        evaluated in a single vectorised call.
+
+        :param raw: Arrays of values for the arguments of `raw_to_derived`.
+        :return: A dict mapping derived signal names to arrays of values.
+        """
+        return await self._transformer.raw_to_derived_batch(**raw)
+
+    async def derived_to_raw_batch(self, **derived: ArrayLike) -> dict[str, np.ndarray]:
+        """Map arrays of derived values to raw values with the current Transform.
+
+        The inverse of `raw_to_derived_batch`, where any derived values not
+        given are taken from the current values of the derived signals.
+
+        :param derived: Arrays of values for the arguments of `derived_to_raw`.
+        :return: A dict mapping raw argument names to arrays of values.
+        """
+        return await self._transformer.derived_to_raw_batch(**derived)
+
 
 def _get_return_datatype(func: Callable[..., SignalDatatypeT]) -> type[SignalDatatypeT]:
     # Do not call the cached version as functions may hold strong references to
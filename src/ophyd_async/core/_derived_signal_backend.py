@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 from collections.abc import Awaitable, Callable, Mapping
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+import numpy as np
 from bluesky.protocols import Location, Reading, Subscribable
 from event_model import DataKey
 
@@ -14,6 +16,7 @@ from ._utils import (
     Callback,
     ConfinedModel,
     T,
+    _values_equal,
     error_if_none,
     gather_dict,
     merge_gathered_dicts,
@@ -67,6 +70,52 @@ class Transform(ConfinedModel, Generic[RawT, DerivedT]):
 TransformT = TypeVar("TransformT", bound=Transform)
 
 
+def evaluate_batch(
+    func: Callable[..., Mapping[str, Any]],
+    arrays: Mapping[str, Any],
+    constants: Mapping[str, Any] | None = None,
+) -> dict[str, np.ndarray]:
+    """Evaluate a Transform method over arrays of its arguments.
+
+    The arrays are broadcast against each other and passed to `func` in a single
+    call, so a method written with numpy operations is evaluated vectorised. If
+    `func` can't take arrays (e.g. it uses `math` functions) then fall back to
+    calling it once per point. Any error from the vectorised attempt, like the
+    ``ValueError`` numpy raises when an array is used in an ``if`` statement,
+    causes this fallback, so errors for individual points are still raised.
+
+    :param func: A bound method like `transform.raw_to_derived`.
+    :param arrays: Array-like arguments to `func`.
+    :param constants: Scalar arguments to pass to `func` unchanged.
+    :return: A dict mapping each output of `func` to an array of its values.
+    """
+    constants = constants or {}
+    broadcast = dict(zip(arrays, np.broadcast_arrays(*arrays.values()), strict=True))
+    shape = next(iter(broadcast.values())).shape if broadcast else ()
+    try:
+        outputs = func(**constants, **broadcast)
+    except Exception:
+        outputs = None
+    if outputs is not None and all(
+        np.shape(output) in (shape, ()) for output in outputs.values()
+    ):
+        return {
+            name: np.broadcast_to(np.asarray(output), shape).copy()
+            for name, output in outputs.items()
+        }
+    # Doesn't support arrays, so evaluate point by point
+    points = [
+        func(**constants, **{k: v[index] for k, v in broadcast.items()})
+        for index in np.ndindex(shape)
+    ]
+    if not points:
+        return {}
+    return {
+        name: np.array([point[name] for point in points]).reshape(shape)
+        for name in points[0]
+    }
+
+
 def validate_by_type(raw_devices: Mapping[str, Any], type_: type[T]) -> dict[str, T]:
     filtered_devices: dict[str, T] = {}
     for name, device in raw_devices.items():
@@ -77,6 +126,12 @@ def validate_by_type(raw_devices: Mapping[str, Any], type_: type[T]) -> dict[str
     return filtered_devices
 
 
+def _readings_equal(a: Reading, b: Reading) -> bool:
+    return a.get("alarm_severity", 0) == b.get("alarm_severity", 0) and _values_equal(
+        a["value"], b["value"]
+    )
+
+
 class SignalTransformer(Generic[TransformT]):
     def __init__(
         self,
@@ -99,6 +154,15 @@ class SignalTransformer(Generic[TransformT]):
 
         self._derived_callbacks: dict[str, Callback[Reading]] = {}
         self._cached_readings: dict[str, Reading] | None = None
+        # The last derived readings sent to the callbacks
+        self._emitted_readings: dict[str, Reading] = {}
+        # Handle for the emit of derived readings scheduled by raw updates
+        self._pending_emit: asyncio.Handle | None = None
+        # The last transform made, and the args it was made from
+        self._transform: TransformT | None = None
+        self._transform_args: dict[str, Any] = {}
+        # The read of all the raw and transform devices started in this loop iteration
+        self._pending_read: asyncio.Task[dict[str, Reading]] | None = None
 
     @cached_property
     def raw_locatables(self) -> dict[str, AsyncLocatable]:
@@ -135,7 +199,15 @@ class SignalTransformer(Generic[TransformT]):
             k: transform_readings[sig.name]["value"]
             for k, sig in self.transform_readables.items()
         }
-        return self._transform_cls(**(transform_args | self._transform_constants))
+        # Constructing the model is expensive, so only do it if the args changed
+        if self._transform is None or not all(
+            _values_equal(v, self._transform_args[k]) for k, v in transform_args.items()
+        ):
+            self._transform = self._transform_cls(
+                **(transform_args | self._transform_constants)
+            )
+            self._transform_args = transform_args
+        return self._transform
 
     def _make_derived_readings(
         self, raw_and_transform_readings: dict[str, Reading]
@@ -181,15 +253,65 @@ class SignalTransformer(Generic[TransformT]):
 
     async def get_derived_readings(self) -> dict[str, Reading]:
         if not (raw_and_transform_readings := self._complete_cached_reading()):
-            raw_and_transform_readings = await merge_gathered_dicts(
-                device.read() for device in self.raw_and_transform_readables.values()
-            )
+            raw_and_transform_readings = await self._read_raw_and_transform()
         return self._make_derived_readings(raw_and_transform_readings)
 
+    async def _read_raw_and_transform(self) -> dict[str, Reading]:
+        # Derived signals of the same transformer are often read together, e.g.
+        # from StandardReadable.read(), so share a single read of the devices
+        # between all of them rather than reading every device for each one
+        if self._pending_read is None:
+            self._pending_read = asyncio.create_task(
+                merge_gathered_dicts(
+                    device.read()
+                    for device in self.raw_and_transform_readables.values()
+                )
+            )
+            self._pending_read.add_done_callback(self._finish_read)
+            # Only share it with reads started in this iteration of the event
+            # loop, as a later one may follow a set and must see its result
+            asyncio.get_running_loop().call_soon(
+                self._stop_sharing_read, self._pending_read
+            )
+        # Shield so one reader being cancelled doesn't cancel the others
+        return await asyncio.shield(self._pending_read)
+
+    def _stop_sharing_read(self, task: asyncio.Task[dict[str, Reading]]):
+        if self._pending_read is task:
+            self._pending_read = None
+
+    def _finish_read(self, task: asyncio.Task[dict[str, Reading]]):
+        if not task.cancelled():
+            # Mark the exception as retrieved in case all the readers were cancelled
+            task.exception()
+
     async def get_derived_values(self) -> dict[str, Any]:
         derived_readings = await self.get_derived_readings()
         return {k: v["value"] for k, v in derived_readings.items()}
 
+    async def raw_to_derived_batch(self, **raw: Any) -> dict[str, np.ndarray]:
+        if missing := set(self._raw_devices) - set(raw):
+            # Fill in the raw values that weren't given with their current values
+            readings = await merge_gathered_dicts(
+                self.raw_and_transform_readables[k].read() for k in missing
+            )
+            raw |= {k: readings[self._raw_devices[k].name]["value"] for k in missing}
+        transform = await self.get_transform()
+        return evaluate_batch(transform.raw_to_derived, raw, self._raw_constants)
+
+    async def derived_to_raw_batch(self, **derived: Any) -> dict[str, np.ndarray]:
+        transform = await self.get_transform()
+        parameters = inspect.signature(transform.derived_to_raw).parameters
+        if missing := [
+            k
+            for k, parameter in parameters.items()
+            if k not in derived and parameter.kind == parameter.KEYWORD_ONLY
+        ]:
+            # Fill in the derived values that weren't given with their current values
+            current = await self.get_derived_values()
+            derived |= {k: current[k] for k in missing}
+        return evaluate_batch(transform.derived_to_raw, derived)
+
     def _update_cached_reading(self, value: dict[str, Reading]):
         _cached_readings = error_if_none(
             self._cached_readings,
@@ -197,11 +319,33 @@ class SignalTransformer(Generic[TransformT]):
         )
 
         _cached_readings.update(value)
-        if self._complete_cached_reading():
-            # We've got a complete set of values, callback on them
-            derived_readings = self._make_derived_readings(_cached_readings)
-            for name, callback in self._derived_callbacks.items():
-                callback(derived_readings[name])
+        if self._pending_emit is None and self._complete_cached_reading():
+            # We've got a complete set of values, but other raw signals may be
+            # updating in this tick too, so calculate the derived readings once
+            # they have all arrived
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._emit_derived_readings()
+            else:
+                self._pending_emit = loop.call_soon(self._emit_derived_readings)
+
+    def _emit_derived_readings(self):
+        self._pending_emit = None
+        if not (raw_and_transform_readings := self._complete_cached_reading()):
+            # We were unsubscribed before we got here
+            return
+        derived_readings = self._make_derived_readings(raw_and_transform_readings)
+        last_readings, self._emitted_readings = (
+            self._emitted_readings,
+            derived_readings,
+        )
+        # Only callback on the derived readings that have changed
+        for name, callback in list(self._derived_callbacks.items()):
+            reading = derived_readings[name]
+            last_reading = last_readings.get(name)
+            if last_reading is None or not _readings_equal(reading, last_reading):
+                callback(reading)
 
     def set_callback(self, name: str, callback: Callback[Reading] | None) -> None:
         if callback is None:
@@ -212,6 +356,10 @@ class SignalTransformer(Generic[TransformT]):
                     raw.clear_sub(self._update_cached_reading)
                 # and clear the cached readings that will now be stale
                 self._cached_readings = None
+                self._emitted_readings = {}
+                if self._pending_emit:
+                    self._pending_emit.cancel()
+                    self._pending_emit = None
         else:
             if name in self._derived_callbacks:
                 msg = f"Callback already set for {name}"
@@ -224,10 +372,9 @@ class SignalTransformer(Generic[TransformT]):
                 for raw in self.raw_and_transform_subscribables.values():
                     # can remove type: ignore when Subscribable protocol updated
                     raw.subscribe_reading(self._update_cached_reading)  # type: ignore
-            elif self._complete_cached_reading():
-                # Callback on the last complete set of readings
-                derived_readings = self._make_derived_readings(self._cached_readings)
-                callback(derived_readings[name])
+            elif name in self._emitted_readings:
+                # Callback on the last derived reading that was emitted
+                callback(self._emitted_readings[name])
 
     async def get_locations(self) -> dict[str, Location]:
         locations, transform = await asyncio.gather(
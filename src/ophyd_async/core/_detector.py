@@ -503,6 +503,19 @@ class StandardDetector(
                 asyncio.gather(*streamable_coros),
                 asyncio.gather(*readable_coros),
             )
+            # Each data key must only be streamed by one data logic
+            datakeys = await asyncio.gather(
+                *[
+                    dp.make_datakeys(trigger_info.collections_per_event)
+                    for dp in streamable_data_providers
+                ]
+            )
+            names = [name for keys in datakeys for name in keys]
+            if duplicates := sorted({name for name in names if names.count(name) > 1}):
+                raise ValueError(
+                    f"Data keys {duplicates} are streamed by more than one data "
+                    f"logic of {self.name}"
+                )
         # Stash the prepare context so we can use it in trigger/kickoff
         self._prepare_ctx = _PrepareCtx(
             trigger_info=trigger_info,
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import random
 import sys
-from collections.abc import Awaitable, Callable, Iterator, Mapping, MutableMapping
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from functools import cached_property
 from logging import LoggerAdapter, getLogger
 from typing import Any, Generic, TypeVar
@@ -71,6 +84,158 @@ class DeviceMock(Generic[DeviceT]):
 LazyMock = DeviceMock
 
 
+class ConnectScheduler:
+    """Bounds, orders and retries the leaf connects of a Device tree.
+
+    Used around [](#Device.connect) so that a large reconnect, e.g. with
+    `force_reconnect=True` after an IOC reboot, doesn't start every Signal
+    connect at once. It is inherited by all the children connected as part
+    of that call.
+
+    :example:
+    ```python
+    with ConnectScheduler(max_concurrent=50).use():
+        await device.connect(force_reconnect=True)
+    ```
+
+    :param max_concurrent:
+        The maximum number of leaf connects (e.g. Signal backend connects) that
+        can be in flight at the same time.
+    :param max_attempts:
+        How many times to try a leaf connect that fails with a
+        `NotConnectedError` before giving up.
+    :param backoff:
+        The delay before the first retry, doubled on each subsequent retry.
+    :param max_backoff: The upper limit on the retry delay.
+    :param jitter:
+        Fraction of the retry delay to randomly add or subtract so that
+        retries from many Signals are spread out.
+    :param priority:
+        Devices whose leaves should be connected before any others, highest
+        priority first, e.g. the Devices used by the current plan.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 100,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        jitter: float = 0.5,
+        priority: Iterable[Device] = (),
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+        self.max_concurrent = max_concurrent
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.priority = list(priority)
+        self.in_flight = 0
+        self.retries = 0
+        # Heap of (rank, order, future) for connects waiting for a free slot
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    @classmethod
+    def current(cls) -> ConnectScheduler | None:
+        """Return the scheduler of the connect that is currently running."""
+        return _connect_scheduler.get()
+
+    @contextmanager
+    def use(self) -> Iterator[None]:
+        """Use this scheduler for the connects started within the context."""
+        token = _connect_scheduler.set(self)
+        try:
+            yield
+        finally:
+            _connect_scheduler.reset(token)
+
+    @classmethod
+    async def connect_leaf(
+        cls, device: Device, connect: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Call `connect` under the current scheduler, if there is one.
+
+        This is what a `DeviceConnector` that talks to the control system
+        directly, rather than via its children, should wrap its connect with.
+        """
+        scheduler = cls.current()
+        if scheduler is None:
+            await connect()
+        else:
+            await scheduler.connect_with_retries(device, connect)
+
+    def rank(self, device: Device) -> int:
+        """Return the priority of a Device, lower numbers are connected first."""
+        for rank, priority_device in enumerate(self.priority):
+            ancestor: Device | None = device
+            while ancestor is not None:
+                if ancestor is priority_device:
+                    return rank
+                ancestor = ancestor.parent
+        return len(self.priority)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Return the jittered delay to wait before retry number `attempt`."""
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return delay * (1 + self.jitter * random.uniform(-1, 1))
+
+    async def connect_with_retries(
+        self, device: Device, connect: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Call `connect` when a slot is free, retrying on `NotConnectedError`."""
+        rank = self.rank(device)
+        for attempt in range(self.max_attempts):
+            try:
+                async with self._slot(rank):
+                    await connect()
+                return
+            except NotConnectedError:
+                if attempt + 1 == self.max_attempts:
+                    raise
+            self.retries += 1
+            delay = self.retry_delay(attempt)
+            device.log.debug(f"Connect failed, retrying in {delay:.3f}s")
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def _slot(self, rank: int) -> AsyncIterator[None]:
+        if self.in_flight < self.max_concurrent and not self._waiters:
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (rank, next(self._order), waiter))
+            try:
+                # _release hands its slot directly to us
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+# The scheduler inherited by all the connect tasks started by Device.connect
+_connect_scheduler: ContextVar[ConnectScheduler | None] = ContextVar(
+    "_connect_scheduler", default=None
+)
+
+
 class DeviceConnector:
     """Defines how a `Device` should be connected and type hints processed."""
 
@@ -118,10 +283,26 @@ class DeviceConnector:
         This is called when there is no cached connect done in `mock=False`
         mode. It connects the Device and all its children in real mode in parallel.
         """
+        await self.connect_children(device.children(), timeout, force_reconnect)
+
+    async def connect_children(
+        self,
+        children: Iterable[tuple[str, Device]],
+        timeout: float,
+        force_reconnect: bool,
+    ):
+        """Connect the given children in parallel, gathering up errors.
+
+        If a [](#ConnectScheduler) is in use then the children are started in
+        priority order, and it bounds the number of their leaves that connect
+        at the same time.
+        """
+        if scheduler := ConnectScheduler.current():
+            children = sorted(children, key=lambda child: scheduler.rank(child[1]))
         # Connect in parallel, gathering up NotConnectedErrors
         coros = {
             name: child_device.connect(timeout=timeout, force_reconnect=force_reconnect)
-            for name, child_device in device.children()
+            for name, child_device in children
         }
         await wait_for_connection(**coros)
 
@@ -271,6 +452,9 @@ class Device(HasName):
         :param timeout: Time to wait before failing with a TimeoutError.
         :param force_reconnect:
             If True, force a reconnect even if the last connect succeeded.
+
+        If called within [](#ConnectScheduler.use) then the scheduler bounds,
+        orders and retries the connects of all the Signals in the tree.
         """
         connector: DeviceConnector = error_if_none(
             getattr(self, "_connector", None),
@@ -296,6 +480,7 @@ class Device(HasName):
             if force_reconnect or not can_use_previous_connect:
                 self._mock = None
                 coro = connector.connect_real(self, timeout, force_reconnect)
+                # The task copies the current context, so inherits the scheduler
                 self._connect_task = asyncio.create_task(coro)
             connect_task = error_if_none(
                 self._connect_task, "Connect task not created, this shouldn't happen"
@@ -1,6 +1,10 @@
+import asyncio
+import os
 import re
+import threading
 import uuid
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Callable
 from datetime import date
 from pathlib import Path, PurePath, PureWindowsPath
@@ -9,7 +13,7 @@ from urllib.parse import urlparse, urlunparse
 
 from pydantic import Field, field_validator
 
-from ._utils import ConfinedModel
+from ._utils import ConfinedModel, logger
 
 
 def generate_directory_uri(directory_path: PurePath) -> str:
@@ -289,6 +293,174 @@ class AutoMaxIncrementingPathProvider(PathProvider):
         )
 
 
+class ReservingPathProvider(PathProvider):
+    """Hand out numbered directories that were reserved ahead of time.
+
+    Directories like base_path/0001_dirname are created in blocks before they are
+    needed, in a background thread if there is a running event loop. Each one is
+    made with a single mkdir so that several processes sharing a base path never
+    get the same directory, skipping over numbers that are already taken. Calling
+    the provider then takes the next reserved directory without touching the
+    filesystem, so detectors can prepare quickly during rapid-fire scans.
+
+    The filesystem is only touched on the critical path if all the reserved
+    directories have been used up before the background reservation finished, or
+    if the base path provider has changed what it returns, in which case the
+    directories reserved inside the old base path are removed. Reserved
+    directories that are never used can be removed with `release`.
+
+    Args:
+    base_path_provider: Path to create directories inside of. Note that the filename
+    of this provider is used to name the directories and the files in them.
+    block_size: Number of directories to reserve at a time.
+    max_digits: Number of digits to pad onto the directory names.
+    starting_value: Number to start at if there are no numbered directories yet.
+
+    """
+
+    def __init__(
+        self,
+        base_path_provider: PathProvider,
+        block_size: int = 10,
+        max_digits: int = 4,
+        starting_value: int = 0,
+    ):
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self._base_path_provider = base_path_provider
+        self._block_size = block_size
+        self._max_digits = max_digits
+        self._starting_value = starting_value
+        self._next_values: dict[Path, int] = {}
+        # The reserved directories, all made inside this base path info
+        self._base_path_info: PathInfo | None = None
+        self._reserved: deque[PathInfo] = deque()
+        # Reservations can happen in the background thread or on the event loop
+        self._lock = threading.Lock()
+        self._reserving: asyncio.Future | None = None
+
+    def _release_reserved(self):
+        # Must be called with the lock held
+        while self._reserved:
+            path_info = self._reserved.popleft()
+            try:
+                os.rmdir(path_info.directory_path)
+            except OSError:
+                # Something has been written to it since, so leave it
+                pass
+
+    def _use_base(self, base_path_info: PathInfo):
+        # Directories reserved inside a different base path are no longer wanted
+        with self._lock:
+            if base_path_info != self._base_path_info:
+                self._release_reserved()
+                self._base_path_info = base_path_info
+
+    def _reserve(self, base_path_info: PathInfo, count: int):
+        # Make sure there are at least count directories reserved
+        with self._lock:
+            if base_path_info != self._base_path_info:
+                # The base path has changed since this was asked for
+                return
+            base_path_dir = Path(base_path_info.directory_path)
+            filename = base_path_info.filename
+            next_value = self._next_values.get(base_path_dir)
+            if next_value is None:
+                # Only scan the base directory once, after that rely on mkdir
+                # failing if another process has taken the number
+                with os.scandir(base_path_dir) as entries:
+                    numbers = [
+                        int(x.name.split("_", maxsplit=1)[0])
+                        for x in entries
+                        if re.match(r"^\d+_", x.name) and x.is_dir()
+                    ]
+                next_value = max(max(numbers, default=-1) + 1, self._starting_value)
+            while len(self._reserved) < count:
+                padded_counter = f"{next_value:0{self._max_digits}}"
+                if len(padded_counter) > self._max_digits:
+                    raise ValueError(
+                        f"Reserved directory counter exceeded maximum of "
+                        f"{self._max_digits} digits!"
+                    )
+                next_value += 1
+                directory = base_path_dir / f"{padded_counter}_{filename.strip('_')}"
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    continue
+                self._reserved.append(
+                    PathInfo(
+                        directory_path=directory,
+                        filename=filename.rstrip("_"),
+                        create_dir_depth=0,
+                        directory_uri=f"{base_path_info.directory_uri}{directory.name}",
+                    )
+                )
+            self._next_values[base_path_dir] = next_value
+
+    def _reserving_done(self, future: asyncio.Future):
+        # Don't keep the error around, the next call will try again
+        if not future.cancelled() and (exc := future.exception()):
+            logger.warning(f"Reserving directories failed, will retry: {exc!r}")
+
+    def _start_reserving(self, base_path_info: PathInfo):
+        if self._reserving is not None and not self._reserving.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to block, so reserve them now
+            self._reserve(base_path_info, self._block_size)
+        else:
+            self._reserving = loop.run_in_executor(
+                None, self._reserve, base_path_info, self._block_size
+            )
+            self._reserving.add_done_callback(self._reserving_done)
+
+    async def reserve(self, count: int | None = None):
+        """Reserve directories ahead of time, for instance before a batch of scans.
+
+        :param count: How many directories to have reserved, defaults to block_size.
+        """
+
+        def _reserve():
+            base_path_info = self._base_path_provider()
+            self._use_base(base_path_info)
+            self._reserve(base_path_info, count or self._block_size)
+
+        await asyncio.get_running_loop().run_in_executor(None, _reserve)
+
+    async def release(self):
+        """Remove the directories that have been reserved but not used."""
+
+        def _release():
+            with self._lock:
+                self._release_reserved()
+
+        if self._reserving is not None:
+            # Any error has already been logged
+            await asyncio.wait([self._reserving])
+        await asyncio.get_running_loop().run_in_executor(None, _release)
+
+    def __call__(self, datakey_name: str | None = None) -> PathInfo:
+        base_path_info = self._base_path_provider()
+        self._use_base(base_path_info)
+        try:
+            path_info = self._reserved.popleft()
+        except IndexError:
+            # Used them all up before the background reservation finished
+            self._reserve(base_path_info, 1)
+            path_info = self._reserved.popleft()
+        if len(self._reserved) <= self._block_size // 2:
+            try:
+                self._start_reserving(base_path_info)
+            except Exception:
+                # Don't lose the directory we reserved
+                self._reserved.appendleft(path_info)
+                raise
+        return path_info
+
+
 class AutoIncrementingPathProvider(PathProvider):
     """Provides a new numerically incremented path on each call."""
 
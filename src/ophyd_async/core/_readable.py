@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from collections.abc import Awaitable, Callable, Generator, Sequence
 from contextlib import contextmanager
@@ -105,13 +106,11 @@ class StandardReadable(
 
     @AsyncStatus.wrap
     async def stage(self) -> None:
-        for sig in self._stageables:
-            await sig.stage().task
+        await asyncio.gather(*[sig.stage().task for sig in self._stageables])
 
     @AsyncStatus.wrap
     async def unstage(self) -> None:
-        for sig in self._stageables:
-            await sig.unstage().task
+        await asyncio.gather(*[sig.unstage().task for sig in self._stageables])
 
     async def describe_configuration(self) -> dict[str, DataKey]:
         return await merge_gathered_dicts(
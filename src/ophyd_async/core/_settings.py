@@ -1,12 +1,62 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import weakref
 from abc import abstractmethod
-from collections.abc import Callable, Iterator, MutableMapping
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from enum import Enum
 from typing import Any, Generic
 
+import numpy as np
+from pydantic import BaseModel
+
 from ._device import Device, DeviceT
 from ._signal import SignalRW
 from ._signal_backend import SignalDatatypeT
+from ._utils import Callback
+
+# For each Signal, the attribute names of the siblings to apply before it
+_apply_after: weakref.WeakKeyDictionary[Device, set[str]] = weakref.WeakKeyDictionary()
+
+
+class ApplyAfter:
+    """Annotation to apply a Signal after some of its siblings in Settings.
+
+    When Settings containing the Signal and any of the siblings are applied,
+    the siblings are set first.
+
+    :param siblings: The attribute names of the sibling Signals to set first.
+
+    :example:
+    ```python
+    class SeqBlock(Device):
+        prescale_units: SignalRW[TimeUnits]
+        prescale: Annotated[SignalRW[float], ApplyAfter("prescale_units")]
+    ```
+    """
+
+    def __init__(self, *siblings: str):
+        self.siblings = siblings
+
+    def __call__(self, parent: Device, child: Device):
+        _apply_after.setdefault(child, set()).update(self.siblings)
+
+
+def _get_apply_after(signal: SignalRW) -> set[Device]:
+    dependencies: set[Device] = set()
+    for name in _apply_after.get(signal, ()):
+        dependency = getattr(signal.parent, name, None)
+        if isinstance(dependency, Device):
+            dependencies.add(dependency)
+    return dependencies
 
 
 class Settings(MutableMapping[SignalRW[Any], Any], Generic[DeviceT]):
@@ -100,9 +150,165 @@ class Settings(MutableMapping[SignalRW[Any], Any], Generic[DeviceT]):
             dest[signal] = value
         return where_true, where_false
 
+    def apply_batches(
+        self, apply_after: Mapping[SignalRW, Iterable[SignalRW]] | None = None
+    ) -> list[Settings[DeviceT]]:
+        """Split into batches of signals that can be applied concurrently.
+
+        Each signal is placed in a later batch than the signals in these Settings
+        that it should be applied after, as declared with `ApplyAfter` or passed
+        in ``apply_after``. Applying the batches in order, and the signals in
+        each batch concurrently, will respect those dependencies.
+
+        :param apply_after:
+            Extra dependencies, mapping a signal to the signals to apply before it,
+            for signals that are not declared on the class.
+        :returns: A list of Settings, one per batch.
+        :raises ValueError: If the dependencies are circular.
+        """
+        apply_after = apply_after or {}
+        pending = {
+            signal: _get_apply_after(signal)
+            .union(apply_after.get(signal, ()))
+            .intersection(self._settings)
+            - {signal}
+            for signal in self
+        }
+        batches: list[Settings[DeviceT]] = []
+        while pending:
+            ready = [signal for signal, after in pending.items() if not after]
+            if not ready:
+                names = sorted(signal.name for signal in pending)
+                raise ValueError(f"Circular apply dependencies between {names}")
+            batches.append(Settings(self.device, {s: self[s] for s in ready}))
+            for signal in ready:
+                del pending[signal]
+            for after in pending.values():
+                after.difference_update(ready)
+        return batches
+
+
+def _as_array(value: Any) -> np.ndarray:
+    if (
+        isinstance(value, Sequence)
+        and value
+        and all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+        and max(value) > np.iinfo(np.int64).max
+    ):
+        # Don't let numpy turn a serialised list of large uint64 into floats
+        return np.array(value, dtype=np.uint64)
+    return np.asarray(value)
+
+
+def _update_hash(h: hashlib.blake2b, value: Any) -> None:
+    # Values are normalised so that what is read from a device hashes the same
+    # as what a provider deserialises, e.g. an array and a list, or a Table and
+    # a dict of columns
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if value is None or isinstance(value, str | bytes):
+        h.update(f"{type(value).__name__}:{value}".encode())
+    elif isinstance(value, Mapping):
+        h.update(b"{")
+        for k in sorted(value):
+            h.update(f"{k}:".encode())
+            _update_hash(h, value[k])
+        h.update(b"}")
+    elif isinstance(value, Sequence | np.ndarray | int | float | np.generic):
+        array = _as_array(value)
+        h.update(f"array{array.shape}:".encode())
+        if array.dtype.kind in "biu":
+            # Canonicalise to int64, unless there are values too large for it
+            too_large = array.dtype == np.uint64 and np.any(array > 2**63 - 1)
+            h.update(array.astype(np.uint64 if too_large else np.int64).tobytes())
+        elif array.dtype.kind == "f":
+            h.update(array.astype(np.float64).tobytes())
+        else:
+            for item in array.ravel().tolist():
+                _update_hash(h, item)
+    else:
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+
+
+def settings_hash(value: Any) -> str:
+    """Return a hash of the content of a settings value.
+
+    Equal hashes mean equal values, but equal values may have different hashes
+    if they are of different types, e.g. ``1`` and ``1.0``, so a differing hash
+    only means the values could differ.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update_hash(h, value)
+    return h.hexdigest()
+
 
 class SettingsProvider:
-    """Base class for providing settings."""
+    """Base class for providing settings.
+
+    As well as storing and retrieving settings, this keeps the hashes of the
+    settings last known to be on each device, so that applying settings again
+    can skip the signals that have not changed. The signals are monitored from
+    when their hash is recorded until `forget_applied` is called, and the hash
+    is forgotten as soon as the signal changes to a different value, whatever
+    changed it.
+    """
+
+    @property
+    def _applied_hashes(self) -> dict[str, dict[str, str]]:
+        # Subclasses are not required to call super().__init__ so create on demand
+        return self.__dict__.setdefault("_applied_hashes_by_device", {})
+
+    @property
+    def _applied_monitors(self) -> dict[str, dict[str, tuple[SignalRW, Callback]]]:
+        return self.__dict__.setdefault("_applied_monitors_by_device", {})
+
+    def _forget_if_changed(self, device_name: str, name: str, reading: Mapping):
+        hashes = self._applied_hashes.get(device_name, {})
+        if name in hashes:
+            (value,) = [r["value"] for r in reading.values()]
+            if settings_hash(value) != hashes[name]:
+                del hashes[name]
+
+    def applied_hashes(self, device_name: str) -> Mapping[str, str]:
+        """Return the hashes of the settings last known to be on a device.
+
+        :param device_name: The name of the device.
+        :returns: A mapping of signal name to `settings_hash` of its value.
+        """
+        return self._applied_hashes.get(device_name, {})
+
+    async def record_applied(
+        self,
+        device_name: str,
+        signals: Mapping[str, SignalRW],
+        hashes: Mapping[str, str],
+    ) -> None:
+        """Record that signals of a device are known to have these values.
+
+        Each signal is monitored from now on, and its hash forgotten when it
+        changes to a value with a different hash.
+
+        :param device_name: The name of the device.
+        :param signals: A mapping of signal name to signal, for every name in hashes.
+        :param hashes: A mapping of signal name to `settings_hash` of its value.
+        """
+        self._applied_hashes.setdefault(device_name, {}).update(hashes)
+        monitors = self._applied_monitors.setdefault(device_name, {})
+        for name in set(hashes) - set(monitors):
+            callback = functools.partial(self._forget_if_changed, device_name, name)
+            signals[name].subscribe_reading(callback)
+            monitors[name] = (signals[name], callback)
+
+    def forget_applied(self, device_name: str) -> None:
+        """Forget what is known about a device, e.g. after it has been reset.
+
+        This also stops monitoring the signals of the device.
+        """
+        self._applied_hashes.pop(device_name, None)
+        for signal, callback in self._applied_monitors.pop(device_name, {}).values():
+            signal.clear_sub(callback)
 
     @abstractmethod
     async def store(self, name: str, data: dict[str, Any]):
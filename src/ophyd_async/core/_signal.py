@@ -4,11 +4,16 @@ import asyncio
 import contextlib
 import functools
 import inspect
+import itertools
 import time
 import warnings
-from collections.abc import AsyncGenerator, Callable
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Mapping
+from dataclasses import dataclass
+from enum import Enum
 from typing import Any, Generic, TypeVar, cast
 
+import numpy as np
 from bluesky.protocols import (
     Configurable,
     Locatable,
@@ -19,19 +24,20 @@ from bluesky.protocols import (
     Subscribable,
 )
 from event_model import DataKey
-from stamina import retry_context
 
-from ._device import Device, DeviceConnector, LazyMock
+from ._device import ConnectScheduler, Device, DeviceConnector, LazyMock
 from ._mock_signal_backend import MockSignalBackend
 from ._protocol import AsyncReadable, AsyncStageable
 from ._signal_backend import SignalBackend, SignalDatatypeT, SignalDatatypeV
 from ._soft_signal_backend import Getter, Setter, SoftSignalBackend
-from ._status import AsyncStatus
+from ._status import AsyncStatus, completed_status
 from ._utils import (
     CALCULATE_TIMEOUT,
     DEFAULT_TIMEOUT,
     CalculatableTimeout,
     Callback,
+    NotConnectedError,
+    _values_equal,
     _wait_for,
     error_if_none,
 )
@@ -57,7 +63,9 @@ class SignalConnector(DeviceConnector):
     async def connect_real(self, device: Device, timeout: float, force_reconnect: bool):
         self.backend = self._init_backend
         device.log.debug(f"Connecting to {self.backend.source(device.name, read=True)}")
-        await self.backend.connect(timeout)
+        await ConnectScheduler.connect_leaf(
+            device, lambda: self.backend.connect(timeout)
+        )
 
 
 class _ChildrenNotAllowed(dict[str, Device]):
@@ -111,13 +119,80 @@ class Signal(Device, Generic[SignalDatatypeT]):
 SignalT = TypeVar("SignalT", bound=Signal)
 
 
+def _as_numeric(value: Any) -> np.ndarray | None:
+    if isinstance(value, bool | str):
+        return None
+    if isinstance(value, int | float | np.number | np.ndarray):
+        array = np.asarray(value)
+        if array.dtype.kind in "iuf":
+            return array
+    return None
+
+
+@dataclass(frozen=True)
+class OnChange:
+    """Only deliver readings that differ from the last one delivered.
+
+    A reading is delivered if its alarm severity differs from the last reading
+    delivered to the same subscriber, or if its value has changed. For numeric
+    scalars and arrays the change must exceed a deadband of ``abs_change``, or
+    ``rel_change`` times the magnitude of the last delivered value, whichever is
+    larger. Other values are compared for equality.
+
+    :param abs_change: The absolute deadband for numeric values.
+    :param rel_change: The deadband for numeric values as a fraction of the last
+        delivered value.
+    """
+
+    abs_change: float = 0.0
+    rel_change: float = 0.0
+
+    def changed(self, old: Reading, new: Reading) -> bool:
+        """Return True if ``new`` should be delivered after ``old``."""
+        if old.get("alarm_severity", 0) != new.get("alarm_severity", 0):
+            return True
+        old_value, new_value = old["value"], new["value"]
+        if self.abs_change or self.rel_change:
+            old_array, new_array = _as_numeric(old_value), _as_numeric(new_value)
+            if (
+                old_array is not None
+                and new_array is not None
+                and old_array.shape == new_array.shape
+            ):
+                with np.errstate(invalid="ignore"):
+                    deadband = np.maximum(
+                        self.abs_change, self.rel_change * np.abs(old_array)
+                    )
+                    exceeded = np.abs(new_array - old_array) > deadband
+                # NaN compares False with everything, so check it separately
+                nan_changed = np.isnan(old_array) != np.isnan(new_array)
+                return bool(np.any(exceeded | nan_changed))
+        return not _values_equal(old_value, new_value)
+
+
+class _ChangeFilter:
+    def __init__(self, on_change: OnChange):
+        self._on_change = on_change
+        self._last_reading: Reading | None = None
+
+    def passes(self, reading: Reading) -> bool:
+        if self._last_reading is None or self._on_change.changed(
+            self._last_reading, reading
+        ):
+            self._last_reading = reading
+            return True
+        return False
+
+
 class _SignalCache(Generic[SignalDatatypeT]):
     def __init__(self, backend: SignalBackend[SignalDatatypeT], signal: Signal) -> None:
         self._signal: Signal[Any] = signal
         self._staged = False
-        self._listeners: set[Callback] = set()
+        self._listeners: dict[Callback, _ChangeFilter | None] = {}
+        self._connection_listeners: set[Callback[bool]] = set()
         self._valid = asyncio.Event()
         self._reading: Reading[SignalDatatypeT] | None = None
+        self.connected = True
         self.backend: SignalBackend[SignalDatatypeT] = backend
         try:
             asyncio.get_running_loop()
@@ -127,10 +202,12 @@ class _SignalCache(Generic[SignalDatatypeT]):
                 "are you trying to run subscribe outside a plan?"
             ) from exc
         signal.log.debug(f"Making subscription on source {signal.source}")
+        backend.set_connection_callback(self._connection_callback)
         backend.set_callback(self._callback)
 
     def close(self) -> None:
         self.backend.set_callback(None)
+        self.backend.set_connection_callback(None)
         self._signal.log.debug(f"Closing subscription on source {self._signal.source}")
 
     def _ensure_reading(self) -> Reading[SignalDatatypeT]:
@@ -138,6 +215,8 @@ class _SignalCache(Generic[SignalDatatypeT]):
         return reading
 
     async def get_reading(self) -> Reading[SignalDatatypeT]:
+        if not self.connected:
+            raise NotConnectedError(f"{self._signal.source} is disconnected")
         await self._valid.wait()
         return self._ensure_reading()
 
@@ -153,9 +232,25 @@ class _SignalCache(Generic[SignalDatatypeT]):
         self._reading = reading
         self._valid.set()
         # Copy the listeners in case one of the callbacks removes the listener
-        # from the set
-        for callback in list(self._listeners):
-            self._notify(callback)
+        # from the dict
+        for callback, change_filter in list(self._listeners.items()):
+            if change_filter is None or change_filter.passes(reading):
+                self._notify(callback)
+
+    def _connection_callback(self, connected: bool) -> None:
+        # Some transports report a disconnect before the first value arrives,
+        # only report disconnects of a source that has been seen to connect
+        if connected == self.connected or self._reading is None:
+            return
+        self.connected = connected
+        if connected:
+            self._signal.log.info(f"Source {self._signal.source} reconnected")
+        else:
+            self._signal.log.warning(f"Source {self._signal.source} disconnected")
+            # Wait for the first value after reconnect before trusting the cache
+            self._valid.clear()
+        for callback in list(self._connection_listeners):
+            callback(connected)
 
     def _notify(
         self,
@@ -163,25 +258,39 @@ class _SignalCache(Generic[SignalDatatypeT]):
     ) -> None:
         function({self._signal.name: self._ensure_reading()})
 
-    def subscribe(self, function: Callback) -> None:
-        self._listeners.add(function)
-        if self._valid.is_set():
+    def subscribe(self, function: Callback, on_change: OnChange | None = None) -> None:
+        change_filter = None if on_change is None else _ChangeFilter(on_change)
+        self._listeners[function] = change_filter
+        if self._valid.is_set() and (
+            change_filter is None or change_filter.passes(self._ensure_reading())
+        ):
             self._notify(function)
 
     def unsubscribe(self, function: Callback) -> bool:
         if function in self._listeners:
-            self._listeners.remove(function)
+            del self._listeners[function]
         else:
             self._signal.log.warning(
                 f"Unsubscribe failed for signal {self._signal.name}:"
                 f" subscriber {function} was not found"
                 f" in listeners list: {list(self._listeners)}"
             )
-        return self._staged or bool(self._listeners)
+        return self._needed()
+
+    def subscribe_connection(self, function: Callback[bool]) -> None:
+        self._connection_listeners.add(function)
+        function(self.connected)
+
+    def unsubscribe_connection(self, function: Callback[bool]) -> bool:
+        self._connection_listeners.discard(function)
+        return self._needed()
 
     def set_staged(self, staged: bool) -> bool:
         self._staged = staged
-        return self._staged or bool(self._listeners)
+        return self._needed()
+
+    def _needed(self) -> bool:
+        return self._staged or bool(self._listeners or self._connection_listeners)
 
 
 class SignalR(Signal[SignalDatatypeT], AsyncReadable, AsyncStageable, Subscribable):
@@ -243,13 +352,20 @@ class SignalR(Signal[SignalDatatypeT], AsyncReadable, AsyncStageable, Subscribab
         return value
 
     def subscribe_reading(
-        self, function: Callback[dict[str, Reading[SignalDatatypeT]]]
+        self,
+        function: Callback[dict[str, Reading[SignalDatatypeT]]],
+        on_change: OnChange | bool = False,
     ) -> None:
         """Subscribe to updates in the reading.
 
         :param function: The callback function to call when the reading changes.
+        :param on_change:
+            If True or an `OnChange` filter, drop updates that do not change the
+            reading since the last one passed to ``function``.
         """
-        self._get_cache().subscribe(function)
+        if on_change is True:
+            on_change = OnChange()
+        self._get_cache().subscribe(function, on_change or None)
 
     subscribe = subscribe_reading
 
@@ -260,15 +376,33 @@ class SignalR(Signal[SignalDatatypeT], AsyncReadable, AsyncStageable, Subscribab
         """
         self._del_cache(self._get_cache().unsubscribe(function))
 
-    @AsyncStatus.wrap
-    async def stage(self) -> None:
+    def subscribe_connection(self, function: Callback[bool]) -> None:
+        """Subscribe to the source of the signal disconnecting and reconnecting.
+
+        This monitors the signal, and calls the function with its current
+        connection state immediately, then with False or True whenever the
+        backend reports the source disconnecting or reconnecting.
+
+        :param function: The callback function to call when the connection changes.
+        """
+        self._get_cache().subscribe_connection(function)
+
+    def clear_connection_sub(self, function: Callback[bool]) -> None:
+        """Remove a subscription passed to `subscribe_connection`.
+
+        :param function: The callback function to remove.
+        """
+        self._del_cache(self._get_cache().unsubscribe_connection(function))
+
+    def stage(self) -> AsyncStatus:
         """Start caching this signal."""
         self._get_cache().set_staged(True)
+        return completed_status(name=self.name)
 
-    @AsyncStatus.wrap
-    async def unstage(self) -> None:
+    def unstage(self) -> AsyncStatus:
         """Stop caching this signal."""
         self._del_cache(self._get_cache().set_staged(False))
+        return completed_status(name=self.name)
 
 
 class SignalW(Signal[SignalDatatypeT], Movable):
@@ -289,14 +423,20 @@ class SignalW(Signal[SignalDatatypeT], Movable):
             timeout = self._timeout
         source = self._connector.backend.source(self.name, read=False)
         self.log.debug(f"Putting value {value} to backend at source {source}")
-        async for attempt in retry_context(
-            on=asyncio.TimeoutError,
-            attempts=self._attempts,
-            wait_initial=0,
-            wait_jitter=0,
-        ):
-            with attempt:
-                await _wait_for(self._connector.backend.put(value), timeout, source)
+        if self._attempts == 1:
+            await _wait_for(self._connector.backend.put(value), timeout, source)
+        else:
+            # Only pay for importing stamina if we need to retry
+            from stamina import retry_context
+
+            async for attempt in retry_context(
+                on=asyncio.TimeoutError,
+                attempts=self._attempts,
+                wait_initial=0,
+                wait_jitter=0,
+            ):
+                with attempt:
+                    await _wait_for(self._connector.backend.put(value), timeout, source)
         self.log.debug(f"Successfully put value {value} to backend at source {source}")
 
 
@@ -357,6 +497,7 @@ def soft_signal_rw(
     getter: Getter[SignalDatatypeT] | None = None,
     setter: Setter[SignalDatatypeT] | None = None,
     poll_period: float | None = None,
+    blocking_getter: bool = False,
 ) -> SignalRW[SignalDatatypeT]:
     """Create a read-writable Signal with a [](#SoftSignalBackend).
 
@@ -377,6 +518,8 @@ def soft_signal_rw(
     :param poll_period:
         How often (seconds) to call the getter while a subscription is active.
         Requires getter to be set.
+    :param blocking_getter:
+        If True, run the getter in the event loop's default executor.
     """
     backend = SoftSignalBackend(
         datatype,
@@ -386,6 +529,7 @@ def soft_signal_rw(
         getter=getter,
         setter=setter,
         poll_period=poll_period,
+        blocking_getter=blocking_getter,
     )
     signal = SignalRW(backend=backend, name=name)
     return signal
@@ -400,6 +544,7 @@ def soft_signal_r_and_setter(
     *,
     getter: Getter[SignalDatatypeT] | None = None,
     poll_period: float | None = None,
+    blocking_getter: bool = False,
 ) -> tuple[SignalR[SignalDatatypeT], Callable[[SignalDatatypeT], None]]:
     """Create a read-only Signal with a [](#SoftSignalBackend).
 
@@ -417,6 +562,8 @@ def soft_signal_r_and_setter(
     :param poll_period:
         How often (seconds) to call the getter while a subscription is active.
         Requires getter to be set.
+    :param blocking_getter:
+        If True, run the getter in the event loop's default executor.
     :return: A tuple of the created SignalR and a callable to set its value.
     """
     backend = SoftSignalBackend(
@@ -426,6 +573,7 @@ def soft_signal_r_and_setter(
         precision,
         getter=getter,
         poll_period=poll_period,
+        blocking_getter=blocking_getter,
     )
     signal = SignalR(backend=backend, name=name)
     return (signal, backend.set_value)
@@ -436,12 +584,14 @@ async def observe_value(
     timeout: float | None = None,
     done_status: Status | None = None,
     done_timeout: float | None = None,
+    on_change: OnChange | bool = False,
 ) -> AsyncGenerator[SignalDatatypeT, None]:
     """Subscribe to the value of a signal so it can be iterated from.
 
     The first value yielded in the iterator will be the current value of the
     Signal, and subsequent updates from the control system will result in that
-    value being yielded, even if it is the same as the previous value.
+    value being yielded, even if it is the same as the previous value unless
+    `on_change` is given.
 
     :param signal:
         Call subscribe_reading on this at the start, and clear_sub on it at the end.
@@ -456,6 +606,9 @@ async def observe_value(
         If given, the maximum time to watch a signal, in seconds. If the loop is
         still being watched after this length, raise asyncio.TimeoutError. This
         should be used instead of on an 'asyncio.wait_for' timeout.
+    :param on_change:
+        If True or an `OnChange` filter, only yield values that have changed
+        since the last one yielded.
 
     Due to a rare condition with busy signals, it is not recommended to use this
     function with asyncio.timeout, including in an `asyncio.wait_for` loop.
@@ -472,6 +625,7 @@ async def observe_value(
         timeout=timeout,
         done_status=done_status,
         done_timeout=done_timeout,
+        on_change=on_change,
     ):
         yield value
 
@@ -483,17 +637,127 @@ def _get_iteration_timeout(
     return min([x for x in [overall_deadline, timeout] if x is not None], default=None)
 
 
+class ObserveOverflow(Enum):
+    """What an `ObserveQueue` does with an update when it is full."""
+
+    DROP_OLDEST = "DROP_OLDEST"
+    """Discard the oldest pending update to make room for the new one"""
+
+    DROP_NEWEST = "DROP_NEWEST"
+    """Discard the new update, keeping the pending ones"""
+
+    LATEST = "LATEST"
+    """Only keep the latest pending update of each signal, ignoring maxsize"""
+
+
+class ObserveQueue:
+    """The buffer of pending updates used by `observe_signals_value`.
+
+    By default this is unbounded, so a consumer that is slower than the
+    signals it observes will see every update, but use memory without limit.
+    Pass a bounded one to `observe_signals_value` to trade updates for
+    predictable memory, then look at `dropped` to see how many were lost. Use
+    a new ObserveQueue for each call.
+
+    :param maxsize: The maximum number of pending updates, 0 means unbounded.
+    :param overflow: What to do with an update when the queue is full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: ObserveOverflow = ObserveOverflow.DROP_OLDEST,
+    ):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        """The number of updates discarded because the queue was full"""
+        self._updates: deque[tuple[SignalR, Any]] = deque()
+        self._latest: dict[SignalR, Any] = {}
+        self._end: Status | NotConnectedError | None = None
+        self._ready = asyncio.Event()
+
+    def put(self, signal: SignalR, value: Any) -> None:
+        """Add an update to the queue, applying the overflow policy."""
+        if self._end is not None:
+            # Nothing after the end will be yielded
+            return
+        if self.overflow is ObserveOverflow.LATEST:
+            if signal in self._latest:
+                # Remove it so that the new value is ordered as the newest
+                del self._latest[signal]
+                self.dropped += 1
+            self._latest[signal] = value
+        elif self.maxsize and len(self._updates) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow is ObserveOverflow.DROP_NEWEST:
+                return
+            self._updates.popleft()
+            self._updates.append((signal, value))
+        else:
+            self._updates.append((signal, value))
+        self._ready.set()
+
+    def put_end(self, end: Status | NotConnectedError) -> None:
+        """Mark the end of the updates, after the ones already pending."""
+        if self._end is None:
+            self._end = end
+        self._ready.set()
+
+    @property
+    def end(self) -> Status | NotConnectedError | None:
+        """The status or error that ends the iteration, if it has arrived."""
+        return self._end
+
+    def ready(self) -> bool:
+        """Return True if there are pending updates or the end has arrived."""
+        return self._ready.is_set()
+
+    async def wait(self) -> None:
+        """Wait until there are pending updates or the end has arrived."""
+        await self._ready.wait()
+
+    def take(self, limit: int | None = None) -> list[tuple[SignalR, Any]]:
+        """Remove and return pending updates in the order they arrived.
+
+        :param limit: The maximum number of updates to return, None means all.
+        """
+        if self.overflow is ObserveOverflow.LATEST:
+            signals = list(itertools.islice(self._latest, limit))
+            batch = [(signal, self._latest.pop(signal)) for signal in signals]
+            pending = bool(self._latest)
+        elif limit is None:
+            batch = list(self._updates)
+            self._updates.clear()
+            pending = False
+        else:
+            batch = [
+                self._updates.popleft() for _ in range(min(limit, len(self._updates)))
+            ]
+            pending = bool(self._updates)
+        if self._end is None and not pending:
+            self._ready.clear()
+        return batch
+
+
 async def observe_signals_value(
     *signals: SignalR[SignalDatatypeT],
     timeout: float | None = None,
     done_status: Status | None = None,
     done_timeout: float | None = None,
+    on_change: OnChange | bool = False,
+    queue: ObserveQueue | None = None,
 ) -> AsyncGenerator[tuple[SignalR[SignalDatatypeT], SignalDatatypeT], None]:
     """Subscribe to a set of signals so they can be iterated from.
 
     The first values yielded in the iterator will be the current values of the
     Signals, and subsequent updates from the control system will result in that
-    value being yielded, even if it is the same as the previous value.
+    value being yielded, even if it is the same as the previous value unless
+    `on_change` is given. If the
+    backend of any of the Signals reports that its source has disconnected then
+    the iterator raises `NotConnectedError` rather than waiting for `timeout`.
 
     :param signals:
         Call subscribe_reading on all the signals at the start, and clear_sub on
@@ -509,6 +773,13 @@ async def observe_signals_value(
         If given, the maximum time to watch a signal, in seconds. If the loop is
         still being watched after this length, raise asyncio.TimeoutError. This
         should be used instead of on an `asyncio.wait_for` timeout.
+    :param on_change:
+        If True or an `OnChange` filter, only yield values of each signal that
+        have changed since the last one yielded for that signal. Duplicate
+        updates are dropped before they are queued.
+    :param queue:
+        If given, the `ObserveQueue` to buffer pending updates in, which may be
+        bounded. If not given then an unbounded one is used.
 
     :example:
     ```python
@@ -519,24 +790,81 @@ async def observe_signals_value(
             do_something_else_with(value)
     ```
     """
-    q: asyncio.Queue[tuple[SignalR[SignalDatatypeT], SignalDatatypeT] | Status] = (
-        asyncio.Queue()
-    )
+    # Close explicitly so the subscriptions are cleared as soon as we are closed
+    async with contextlib.aclosing(
+        _observe_signals(
+            signals, timeout, done_status, done_timeout, on_change, queue, limit=1
+        )
+    ) as batches:
+        async for batch in batches:
+            yield batch[0]
+
+
+async def observe_signals_value_batches(
+    *signals: SignalR[SignalDatatypeT],
+    timeout: float | None = None,
+    done_status: Status | None = None,
+    done_timeout: float | None = None,
+    on_change: OnChange | bool = False,
+    queue: ObserveQueue | None = None,
+) -> AsyncGenerator[list[tuple[SignalR[SignalDatatypeT], SignalDatatypeT]], None]:
+    """Subscribe to a set of signals and iterate over batches of their updates.
+
+    Like `observe_signals_value`, but each iteration yields a list of all the
+    updates that arrived since the last one, in the order they arrived, so a
+    slow consumer can catch up in bulk. The parameters are the same as
+    `observe_signals_value`, with `timeout` applying to the wait for the next
+    batch.
+
+    :example:
+    ```python
+    queue = ObserveQueue(maxsize=1000)
+    async for batch in observe_signals_value_batches(sig1, sig2, queue=queue):
+        process_in_bulk(batch)
+    print(f"{queue.dropped} updates were dropped")
+    ```
+    """
+    # Close explicitly so the subscriptions are cleared as soon as we are closed
+    async with contextlib.aclosing(
+        _observe_signals(
+            signals, timeout, done_status, done_timeout, on_change, queue, limit=None
+        )
+    ) as batches:
+        async for batch in batches:
+            yield batch
+
+
+async def _observe_signals(
+    signals: tuple[SignalR[SignalDatatypeT], ...],
+    timeout: float | None,
+    done_status: Status | None,
+    done_timeout: float | None,
+    on_change: OnChange | bool,
+    queue: ObserveQueue | None,
+    limit: int | None,
+) -> AsyncGenerator[list[tuple[SignalR[SignalDatatypeT], SignalDatatypeT]], None]:
+    q = ObserveQueue() if queue is None else queue
     # dict to store signal subscription to remove it later
     cbs: dict[SignalR, Callback] = {}
+    connection_cbs: dict[SignalR, Callback[bool]] = {}
 
     # subscribe signal to update queue and fill cbs dict
     for signal in signals:
 
         def queue_value(reading: dict[str, Reading[SignalDatatypeT]], signal=signal):
-            value = reading[signal.name]["value"]
-            q.put_nowait((signal, value))
+            q.put(signal, reading[signal.name]["value"])
+
+        def queue_disconnect(connected: bool, signal=signal):
+            if not connected:
+                q.put_end(NotConnectedError(f"{signal.source} disconnected"))
 
         cbs[signal] = queue_value
-        signal.subscribe_reading(queue_value)
+        signal.subscribe_reading(queue_value, on_change=on_change)
+        connection_cbs[signal] = queue_disconnect
+        signal.subscribe_connection(queue_disconnect)
 
     if done_status is not None:
-        done_status.add_callback(q.put_nowait)
+        done_status.add_callback(q.put_end)
     overall_deadline = time.monotonic() + done_timeout if done_timeout else None
     try:
         last_item = ()
@@ -548,29 +876,36 @@ async def observe_signals_value(
                     f"timeout {done_timeout}s"
                 )
             iteration_timeout = _get_iteration_timeout(timeout, overall_deadline)
-            try:
-                item = await asyncio.wait_for(q.get(), iteration_timeout)
-            except TimeoutError as exc:
-                raise TimeoutError(
-                    f"Timeout Error while waiting {iteration_timeout}s to update "
-                    f"{[signal.source for signal in signals]}. "
-                    f"Last observed signal and value were {last_item}"
-                ) from exc
-            except asyncio.CancelledError as exc:
-                raise asyncio.CancelledError(
-                    f"Cancelled Error while waiting {iteration_timeout}s to update "
-                    f"{[signal.source for signal in signals]}. "
-                    f"Last observed signal and value were {last_item}"
-                ) from exc
-            if done_status and item is done_status:
+            if not q.ready():
+                try:
+                    await asyncio.wait_for(q.wait(), iteration_timeout)
+                except TimeoutError as exc:
+                    raise TimeoutError(
+                        f"Timeout Error while waiting {iteration_timeout}s to update "
+                        f"{[signal.source for signal in signals]}. "
+                        f"Last observed signal and value were {last_item}"
+                    ) from exc
+                except asyncio.CancelledError as exc:
+                    raise asyncio.CancelledError(
+                        f"Cancelled Error while waiting {iteration_timeout}s to update "
+                        f"{[signal.source for signal in signals]}. "
+                        f"Last observed signal and value were {last_item}"
+                    ) from exc
+            if batch := q.take(limit):
+                last_item = batch[-1]
+                yield cast(
+                    list[tuple[SignalR[SignalDatatypeT], SignalDatatypeT]], batch
+                )
+            elif isinstance(q.end, NotConnectedError):
+                raise q.end
+            elif done_status and q.end is done_status:
                 if exc := done_status.exception():
                     raise exc
                 else:
                     break
-            else:
-                last_item = cast(tuple[SignalR[SignalDatatypeT], SignalDatatypeT], item)
-                yield last_item
     finally:
+        for signal, cb in connection_cbs.items():
+            signal.clear_connection_sub(cb)
         for signal, cb in cbs.items():
             signal.clear_sub(cb)
         # Give the event loop a tick to finish cancelling any background tasks
@@ -578,35 +913,97 @@ async def observe_signals_value(
         await asyncio.sleep(0)
 
 
-class _ValueChecker(Generic[SignalDatatypeT]):
-    def __init__(self, match: SignalDatatypeT | Callable[[SignalDatatypeT], bool]):
-        self.got_first_value = asyncio.Event()
-        self._last_value: SignalDatatypeT | None = None
-        if callable(match):
-            self._matcher = match
-            self._matcher_name = getattr(match, "__name__", f"<{type(match).__name__}>")
-        else:
-            self._matcher = lambda v: v == match
-            self._matcher_name = repr(match)
-
-    async def _wait_for_value(self, signal: SignalR[SignalDatatypeT]):
-        async for value in observe_value(signal):
-            self._last_value = value
-            self.got_first_value.set()
-            if self._matcher(value):
-                return
+def _make_matcher(
+    match: Any | Callable[[Any], bool],
+) -> tuple[Callable[[Any], bool], str]:
+    if callable(match):
+        matcher = cast(Callable[[Any], bool], match)
+        return matcher, getattr(match, "__name__", f"<{type(match).__name__}>")
+    else:
+        return (lambda v: v == match), repr(match)
 
-    async def wait_for_value(
-        self, signal: SignalR[SignalDatatypeT], timeout: float | None
+
+class _ConditionWaiter:
+    """Evaluate conditions on many signals in their subscription callbacks."""
+
+    def __init__(
+        self,
+        conditions: Mapping[SignalR[Any], Any | Callable[[Any], bool]],
+        require_all: bool,
     ):
+        self._matchers = {
+            signal: _make_matcher(match) for signal, match in conditions.items()
+        }
+        self._require_all = require_all
+        self._last_values: dict[SignalR, Any] = {}
+        self._met: set[SignalR] = set()
+        self._done: asyncio.Future[SignalR | None] | None = None
+        self.got_first_values = asyncio.Event()
+
+    def _finish(self, result: SignalR | None = None, exc: Exception | None = None):
+        if self._done and not self._done.done():
+            if exc:
+                self._done.set_exception(exc)
+            else:
+                self._done.set_result(result)
+
+    def _check(self, signal: SignalR, value: Any) -> None:
+        self._last_values[signal] = value
+        if len(self._last_values) == len(self._matchers):
+            self.got_first_values.set()
+        try:
+            matched = self._matchers[signal][0](value)
+        except Exception as exc:
+            self._finish(exc=exc)
+            return
+        if matched:
+            self._met.add(signal)
+        else:
+            self._met.discard(signal)
+        if self._require_all and len(self._met) == len(self._matchers):
+            self._finish(signal)
+        elif not self._require_all and matched:
+            self._finish(signal)
+
+    def _timeout_message(self, timeout: float | None) -> str:
+        return "; ".join(
+            f"{signal.name} didn't match {name} in {timeout}s, "
+            f"last value {self._last_values.get(signal)!r}"
+            for signal, (_, name) in self._matchers.items()
+            if signal not in self._met
+        )
+
+    async def wait(self, timeout: float | None) -> SignalR | None:
+        if not self._matchers:
+            self.got_first_values.set()
+            return None
+        self._done = asyncio.get_running_loop().create_future()
+        cbs: dict[SignalR, Callback] = {}
+        connection_cbs: dict[SignalR, Callback[bool]] = {}
         try:
+            for signal in self._matchers:
+
+                def check(reading: dict[str, Reading], signal=signal):
+                    self._check(signal, reading[signal.name]["value"])
+
+                def check_connected(connected: bool, signal=signal):
+                    if not connected:
+                        msg = f"{signal.source} disconnected"
+                        self._finish(exc=NotConnectedError(msg))
+
+                cbs[signal] = check
+                signal.subscribe_reading(check, on_change=True)
+                connection_cbs[signal] = check_connected
+                signal.subscribe_connection(check_connected)
             async with asyncio.timeout(timeout):
-                await self._wait_for_value(signal)
+                return await self._done
         except TimeoutError as exc:
-            raise TimeoutError(
-                f"{signal.name} didn't match {self._matcher_name} in {timeout}s, "
-                f"last value {self._last_value!r}"
-            ) from exc
+            raise TimeoutError(self._timeout_message(timeout)) from exc
+        finally:
+            for signal, cb in connection_cbs.items():
+                signal.clear_connection_sub(cb)
+            for signal, cb in cbs.items():
+                signal.clear_sub(cb)
 
 
 async def wait_for_value(
@@ -631,7 +1028,66 @@ async def wait_for_value(
     await wait_for_value(device.num_captured, lambda v: v > 45, timeout=1)
     ```
     """
-    await _ValueChecker(match).wait_for_value(signal, timeout)
+    await _ConditionWaiter({signal: match}, require_all=True).wait(timeout)
+
+
+async def wait_for_all(
+    conditions: Mapping[SignalR[Any], Any | Callable[[Any], bool]],
+    timeout: float | None,
+) -> None:
+    """Wait for every signal to have a matching value at the same time.
+
+    Each signal is subscribed to once, and its condition is checked as each
+    update arrives, so many conditions can be waited for without a task or queue
+    for each one.
+
+    :param conditions:
+        A mapping of signal to what it should match. If a callable, it should
+        return True if the value matches. If not callable then the value will be
+        checked for equality with it.
+    :param timeout:
+        How long to wait for the values to match. If they don't then
+        TimeoutError is raised saying which conditions were not met.
+
+    :example:
+    ```python
+    await wait_for_all({device.writing: True, device.frames_written: 0}, timeout=1)
+    ```
+    """
+    await _ConditionWaiter(conditions, require_all=True).wait(timeout)
+
+
+async def wait_for_any(
+    conditions: Mapping[SignalR[Any], Any | Callable[[Any], bool]],
+    timeout: float | None,
+) -> SignalR[Any]:
+    """Wait for any of the signals to have a matching value.
+
+    Each signal is subscribed to once, and its condition is checked as each
+    update arrives.
+
+    :param conditions:
+        A mapping of signal to what it should match. If a callable, it should
+        return True if the value matches. If not callable then the value will be
+        checked for equality with it.
+    :param timeout:
+        How long to wait for a value to match. If none do then TimeoutError is
+        raised with the last value of each signal.
+    :returns: The first signal that matched.
+
+    :example:
+    ```python
+    signal = await wait_for_any(
+        {device.done: True, device.error: lambda v: v != ""}, timeout=10
+    )
+    ```
+    """
+    if not conditions:
+        raise ValueError("wait_for_any needs at least one condition")
+    return error_if_none(
+        await _ConditionWaiter(conditions, require_all=False).wait(timeout),
+        "No signal matched",
+    )
 
 
 async def set_and_wait_for_other_value(
@@ -669,15 +1125,13 @@ async def set_and_wait_for_other_value(
     ```
     """
     # Start monitoring before the set to avoid a race condition
-    checker = _ValueChecker(match_value)
-    wait_task = asyncio.create_task(
-        checker.wait_for_value(match_signal, timeout=timeout)
-    )
+    waiter = _ConditionWaiter({match_signal: match_value}, require_all=True)
+    wait_task = asyncio.create_task(waiter.wait(timeout))
 
     # Put this in a try/except to ensure wait_task is cancelled when we exit
     try:
         async with asyncio.timeout(timeout):
-            await checker.got_first_value.wait()
+            await waiter.got_first_values.wait()
 
         # Now we can start the set
         status = set_signal.set(set_value, timeout=set_timeout)
@@ -835,6 +1289,64 @@ def walk_signal_sources(device: Device) -> dict[str, str]:
     }
 
 
+class ConnectionMonitor:
+    """Keeps a live count of the disconnected Signals in a Device tree.
+
+    Monitors every [](#SignalR) in the tree while started, so that a
+    long-running plan can check `disconnected_count` or subscribe to changes
+    in it to fail fast when an IOC goes away. The underlying monitors are
+    re-armed by the backends when their source reconnects.
+
+    :param device: The root of the Device tree to monitor.
+    """
+
+    def __init__(self, device: Device):
+        self.device = device
+        self.disconnected: set[str] = set()
+        """The dotted attribute paths of the currently disconnected Signals."""
+        self._callbacks: dict[SignalR, Callback[bool]] = {}
+        self._listeners: set[Callback[int]] = set()
+
+    @property
+    def disconnected_count(self) -> int:
+        """The number of currently disconnected Signals."""
+        return len(self.disconnected)
+
+    def start(self) -> None:
+        """Start monitoring the connection of all the Signals in the tree."""
+        for path, signal in walk_devices(self.device).items():
+            if isinstance(signal, SignalR) and signal not in self._callbacks:
+                callback = functools.partial(self._update, path)
+                self._callbacks[signal] = callback
+                signal.subscribe_connection(callback)
+
+    def stop(self) -> None:
+        """Stop monitoring, releasing the Signal monitors that were made."""
+        for signal, callback in self._callbacks.items():
+            signal.clear_connection_sub(callback)
+        self._callbacks.clear()
+        self.disconnected.clear()
+
+    def subscribe(self, function: Callback[int]) -> None:
+        """Call function with `disconnected_count` now and whenever it changes."""
+        self._listeners.add(function)
+        function(self.disconnected_count)
+
+    def clear_sub(self, function: Callback[int]) -> None:
+        """Remove a subscription passed to `subscribe`."""
+        self._listeners.discard(function)
+
+    def _update(self, path: str, connected: bool) -> None:
+        count = self.disconnected_count
+        if connected:
+            self.disconnected.discard(path)
+        else:
+            self.disconnected.add(path)
+        if self.disconnected_count != count:
+            for function in list(self._listeners):
+                function(self.disconnected_count)
+
+
 class SignalDict(dict[SignalR, Any]):
     def __getitem__(self, key: SignalR[SignalDatatypeT]) -> SignalDatatypeT:
         return super().__getitem__(key)
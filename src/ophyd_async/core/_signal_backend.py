@@ -63,6 +63,8 @@ TableT = TypeVar("TableT", bound=Table)
 class SignalBackend(Generic[SignalDatatypeT]):
     """A read/write/monitor backend for a Signals."""
 
+    _connection_callback: Callback[bool] | None = None
+
     def __init__(self, datatype: type[SignalDatatypeT] | None):
         self.datatype = datatype
 
@@ -102,6 +104,19 @@ class SignalBackend(Generic[SignalDatatypeT]):
     def set_callback(self, callback: Callback[Reading[SignalDatatypeT]] | None) -> None:
         """Observe changes to the current value, timestamp and severity."""
 
+    def set_connection_callback(self, callback: Callback[bool] | None) -> None:
+        """Observe the connection to the underlying hardware dropping and returning.
+
+        Backends that can detect this call it with False on disconnect and True
+        when the connection returns, while a callback is set with `set_callback`.
+        The default implementation never calls it.
+        """
+        self._connection_callback = callback
+
+    def _notify_connection(self, connected: bool) -> None:
+        if self._connection_callback:
+            self._connection_callback(connected)
+
 
 _primitive_dtype: dict[type[Primitive], Dtype] = {
     bool: "boolean",
@@ -3,9 +3,10 @@ from __future__ import annotations
 import asyncio
 import time
 import typing
+import weakref
 from abc import abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any, Generic, get_args
 
@@ -27,7 +28,7 @@ from ._signal_backend import (
     make_datakey,
     make_metadata,
 )
-from ._utils import Callback, cached_get_origin, get_dtype, get_enum_cls
+from ._utils import Callback, cached_get_origin, get_dtype, get_enum_cls, logger
 
 
 class SoftConverter(Generic[SignalDatatypeT]):
@@ -122,6 +123,140 @@ Setter = (
 Getter = Callable[[], SignalDatatypeT | Awaitable[SignalDatatypeT]]
 
 
+async def _call_getter(getter: Getter[SignalDatatypeT], blocking: bool) -> Any:
+    if blocking:
+        return await asyncio.get_running_loop().run_in_executor(None, getter)
+    return await maybe_await(getter())
+
+
+@dataclass
+class PollStatistics:
+    """How long a polled getter takes, and how often it fails."""
+
+    calls: int = 0
+    """The number of times the getter has been polled."""
+    failures: int = 0
+    """The number of polls that raised an exception."""
+    consecutive_failures: int = 0
+    """The number of polls that have failed since the last one that succeeded."""
+    last_latency: float = 0.0
+    """How long the last poll took in seconds."""
+    max_latency: float = 0.0
+    """The longest a poll has taken in seconds."""
+    last_exception: Exception | None = None
+    """The exception raised by the last poll that failed."""
+
+
+@dataclass(eq=False)
+class _PolledGetter:
+    getter: Getter
+    blocking: bool
+    backends: list[SoftSignalBackend] = field(default_factory=list)
+    statistics: PollStatistics = field(default_factory=PollStatistics)
+
+    async def poll(self):
+        start = time.monotonic()
+        try:
+            value = await _call_getter(self.getter, self.blocking)
+        except Exception as exc:
+            self.statistics.failures += 1
+            self.statistics.consecutive_failures += 1
+            self.statistics.last_exception = exc
+            if self.statistics.consecutive_failures == 1:
+                # Only warn at the start of a run of failures to avoid log spam
+                logger.warning(f"Polling {self.getter} failed: {exc!r}")
+            return
+        finally:
+            latency = time.monotonic() - start
+            self.statistics.calls += 1
+            self.statistics.last_latency = latency
+            self.statistics.max_latency = max(self.statistics.max_latency, latency)
+        self.statistics.consecutive_failures = 0
+        # Copy in case a callback unsubscribes a backend
+        for backend in list(self.backends):
+            backend.set_value(value)
+
+
+class _PollGroup:
+    """All the getters polled at the same period, woken by a single timer.
+
+    A timer is used rather than a long running task so that polling stops as
+    soon as the last backend is removed, without waiting for a task to finish.
+    """
+
+    def __init__(self, period: float):
+        self.period = period
+        # Getters shared between backends are only called once per poll
+        self.getters: dict[Getter, _PolledGetter] = {}
+        self._loop = asyncio.get_running_loop()
+        self._next_poll = self._loop.time()
+        self._poll_task: asyncio.Task | None = None
+        self._stopped = False
+        self._timer = self._schedule()
+
+    def _schedule(self) -> asyncio.TimerHandle:
+        # Skip polls we are too late for rather than bunching them up
+        self._next_poll = max(self._next_poll + self.period, self._loop.time())
+        return self._loop.call_at(self._next_poll, self._start_poll)
+
+    def _start_poll(self):
+        self._poll_task = asyncio.create_task(self._poll())
+
+    async def _poll(self):
+        await asyncio.gather(*(polled.poll() for polled in list(self.getters.values())))
+        if not self._stopped:
+            self._timer = self._schedule()
+
+    def stop(self):
+        self._stopped = True
+        self._timer.cancel()
+        if self._poll_task:
+            # Only pending if a getter is awaiting something
+            self._poll_task.cancel()
+
+
+class _SoftPollScheduler:
+    """Polls the getters of all the monitored SoftSignalBackends in a loop."""
+
+    def __init__(self):
+        self.groups: dict[float, _PollGroup] = {}
+
+    def add(
+        self, backend: SoftSignalBackend, getter: Getter, blocking: bool, period: float
+    ) -> PollStatistics:
+        group = self.groups.get(period)
+        if group is None:
+            group = self.groups[period] = _PollGroup(period)
+        polled = group.getters.get(getter)
+        if polled is None:
+            polled = group.getters[getter] = _PolledGetter(getter, blocking)
+        polled.backends.append(backend)
+        return polled.statistics
+
+    def remove(self, backend: SoftSignalBackend, getter: Getter, period: float):
+        group = self.groups[period]
+        polled = group.getters[getter]
+        polled.backends.remove(backend)
+        if not polled.backends:
+            del group.getters[getter]
+        if not group.getters:
+            group.stop()
+            del self.groups[period]
+
+
+_poll_schedulers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, _SoftPollScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def _get_poll_scheduler() -> _SoftPollScheduler:
+    loop = asyncio.get_running_loop()
+    scheduler = _poll_schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _poll_schedulers[loop] = _SoftPollScheduler()
+    return scheduler
+
+
 class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
     """An backend to a soft Signal, for test signals see [](#MockSignalBackend).
 
@@ -141,9 +276,17 @@ class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
         called to refresh the cache.
     :param poll_period:
         How often (seconds) to call the getter while a subscription is active.
-        Requires getter to be set.
+        Requires getter to be set. All the subscribed backends with the same
+        poll_period are polled together, and a getter shared between them is
+        only called once per poll.
+    :param blocking_getter:
+        If True, the getter is a blocking function (e.g. a vendor SDK call)
+        that should be run in the event loop's default executor.
     """
 
+    poll_statistics: PollStatistics | None = None
+    """Latency and failures of the getter while it is being polled."""
+
     def __init__(
         self,
         datatype: type[SignalDatatypeT] | None,
@@ -154,6 +297,7 @@ class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
         getter: Getter[SignalDatatypeT] | None = None,
         setter: Setter[SignalDatatypeT] | None = None,
         poll_period: float | None = None,
+        blocking_getter: bool = False,
     ):
         if poll_period is not None and getter is None:
             raise ValueError("poll_period requires a getter to be set")
@@ -165,7 +309,7 @@ class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
         self._getter = getter
         self._setter = setter
         self._poll_period = poll_period
-        self._poll_task: asyncio.Task | None = None
+        self._blocking_getter = blocking_getter
         self.set_value(self.initial_value)
         self._setpoint = self.initial_value
         super().__init__(datatype)
@@ -173,19 +317,9 @@ class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
     async def _update_value_from_getter(self) -> SignalDatatypeT | None:
         if self._getter is None:
             return
-        result = await maybe_await(self._getter())
+        result = await _call_getter(self._getter, self._blocking_getter)
         self.set_value(result)
 
-    async def _poll(self) -> None:
-        if self._poll_period is None:
-            raise RuntimeError("No poll_period configured")
-        while True:
-            await asyncio.sleep(self._poll_period)
-            try:
-                await self._update_value_from_getter()
-            except Exception:
-                continue
-
     def set_value(self, value: SignalDatatypeT):
         """Set the current value, alarm and timestamp."""
         # setp = self.converter.write_value(value)
@@ -238,12 +372,14 @@ class SoftSignalBackend(SignalBackend[SignalDatatypeT]):
     def set_callback(self, callback: Callback[Reading[SignalDatatypeT]] | None) -> None:
         if callback and self.callback:
             raise RuntimeError("Cannot set a callback when one is already set")
+        if self._getter is not None and self._poll_period is not None:
+            if callback and not self.callback:
+                self.poll_statistics = _get_poll_scheduler().add(
+                    self, self._getter, self._blocking_getter, self._poll_period
+                )
+            elif self.callback and not callback:
+                _get_poll_scheduler().remove(self, self._getter, self._poll_period)
+                self.poll_statistics = None
         if callback:
             callback(self.reading)
-            if self._poll_period is not None:
-                self._poll_task = asyncio.create_task(self._poll())
-        else:
-            if self._poll_task is not None:
-                self._poll_task.cancel()
-                self._poll_task = None
         self.callback = callback
@@ -27,8 +27,11 @@ class AsyncStatusBase(Status, Awaitable[T]):
     generate warnings in test cleanup.
     """
 
-    def __init__(self, awaitable: Coroutine | asyncio.Task, name: str | None = None):
-        if isinstance(awaitable, asyncio.Task):
+    task: asyncio.Future
+
+    def __init__(self, awaitable: Coroutine | asyncio.Future, name: str | None = None):
+        if isinstance(awaitable, asyncio.Future):
+            # A Task, or a Future that may already be done
             self.task = awaitable
         else:
 
@@ -46,7 +49,9 @@ class AsyncStatusBase(Status, Awaitable[T]):
             # Avoid complaints about awaitable not awaited if task is
             # pre-emptively cancelled, by ensuring it is always disposed
             self.task.add_done_callback(lambda _: awaitable.close())
-        self.task.add_done_callback(self._run_callbacks)
+        if not self.task.done():
+            # If already done then add_callback will call callbacks immediately
+            self.task.add_done_callback(self._run_callbacks)
         self._callbacks: list[Callback[Status]] = []
         self._name = name
 
@@ -59,7 +64,7 @@ class AsyncStatusBase(Status, Awaitable[T]):
         else:
             self._callbacks.append(callback)
 
-    def _run_callbacks(self, task: asyncio.Task):
+    def _run_callbacks(self, task: asyncio.Future):
         for callback in self._callbacks:
             callback(self)
 
@@ -107,10 +112,8 @@ class AsyncStatusBase(Status, Awaitable[T]):
         else:
             status = "pending"
         device_str = f"device: {self._name}, " if self._name else ""
-        return (
-            f"<{type(self).__name__}, {device_str}"
-            f"task: {self.task.get_coro()}, {status}>"
-        )
+        coro = self.task.get_coro() if isinstance(self.task, asyncio.Task) else None
+        return f"<{type(self).__name__}, {device_str}task: {coro}, {status}>"
 
     async def __aenter__(self):
         return self
@@ -263,12 +266,23 @@ class WatchableAsyncStatus(AsyncStatusBase, Generic[T]):
         return wrap_f
 
 
-@AsyncStatus.wrap
-async def completed_status(exception: Exception | None = None):
+def completed_status(
+    exception: Exception | None = None, name: str | None = None
+) -> AsyncStatus:
     """Return a completed AsyncStatus.
 
+    This does not create a Task, so is cheap enough to return from verbs like
+    ``stage()`` that finish their work without awaiting anything.
+
     :param exception: If given, then raise this exception when awaited.
+    :param name: The name of the device, if available.
     """
+    future = asyncio.get_running_loop().create_future()
     if exception:
-        raise exception
-    return None
+        future.set_exception(exception)
+        # Mark it as retrieved so asyncio doesn't log it when garbage collected,
+        # it is still raised when awaited and returned by status.exception()
+        future.exception()
+    else:
+        future.set_result(None)
+    return AsyncStatus(future, name=name)
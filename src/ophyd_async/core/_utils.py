@@ -411,6 +411,16 @@ def error_if_none(value: T | None, msg: str) -> T:
     return value
 
 
+def _values_equal(a: Any, b: Any) -> bool:
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    try:
+        return bool(a == b)
+    except ValueError:
+        # Something like a sequence of arrays that can't be compared
+        return False
+
+
 def non_zero(value):
     """Return True if the value cast to an int is not zero."""
     return int(value) != 0
@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from enum import Enum
 from pathlib import Path
@@ -27,6 +28,27 @@ def enum_representer(dumper: yaml.Dumper, enum: Enum) -> yaml.Node:
     return dumper.represent_data(enum.value)
 
 
+class _SettingsDumper(yaml.Dumper):
+    """Dumper with our representers, so they are only registered once."""
+
+
+_SettingsDumper.add_representer(np.ndarray, ndarray_representer)
+_SettingsDumper.add_multi_representer(
+    ConfinedModel, pydantic_model_abstraction_representer
+)
+_SettingsDumper.add_multi_representer(Enum, enum_representer)
+
+
+def _dump(path: Path, data: dict[str, Any]):
+    with open(path, "w") as file:
+        yaml.dump(data, file, Dumper=_SettingsDumper)
+
+
+def _load(path: Path) -> Any:
+    with open(path) as file:
+        return yaml.full_load(file)
+
+
 class YamlSettingsProvider(SettingsProvider):
     """For providing settings from yaml to signals."""
 
@@ -37,19 +59,15 @@ class YamlSettingsProvider(SettingsProvider):
         return self._directory / (name + ".yaml")
 
     async def store(self, name: str, data: dict[str, Any]):
-        yaml.add_representer(np.ndarray, ndarray_representer, Dumper=yaml.Dumper)
-        yaml.add_multi_representer(
-            ConfinedModel,
-            pydantic_model_abstraction_representer,
-            Dumper=yaml.Dumper,
+        # Do file I/O in a thread so we don't block the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, _dump, self._file_path(name), data
         )
-        yaml.add_multi_representer(Enum, enum_representer, Dumper=yaml.Dumper)
-        with open(self._file_path(name), "w") as file:
-            yaml.dump(data, file)
 
     async def retrieve(self, name: str) -> dict[str, Any]:
-        with open(self._file_path(name)) as file:
-            data = yaml.full_load(file)
+        data = await asyncio.get_running_loop().run_in_executor(
+            None, _load, self._file_path(name)
+        )
         if isinstance(data, list):
             warnings.warn(
                 DeprecationWarning(
@@ -6,12 +6,20 @@ https://github.com/areaDetector/ADCore
 from ._acquire_logic import ADAcquireLogic, ADContAcqAcquireLogic
 from ._data_logic import (
     ADHDFDataLogic,
+    ADMultiHDFDataLogic,
+    ADMultiHDFWriters,
     ADMultipartDataLogic,
+    ADNDAttributeHDFDataLogic,
     ADWriterFactory,
     NDArrayDescription,
     PluginSignalDataLogic,
 )
 from ._detector import AreaDetector, ContAcqDetector
+from ._interleaved import (
+    create_interleaved_vds,
+    interleaved_frames_written,
+    interleaved_frames_written_signal,
+)
 from ._io import (
     NDROIIO,
     ADBaseColorMode,
@@ -41,6 +49,7 @@ from ._ndattribute import (
 )
 from ._plan_stubs import setup_ndattributes, setup_ndstats_sum
 from ._trigger_logic import (
+    ADContAcqStreamTriggerLogic,
     ADContAcqTriggerLogic,
     prepare_exposures,
     trigger_info_from_num_images,
@@ -69,6 +78,7 @@ __all__ = [
     # TriggerLogic
     "prepare_exposures",
     "ADContAcqTriggerLogic",
+    "ADContAcqStreamTriggerLogic",
     "trigger_info_from_num_images",
     # AcquireLogic
     "ADAcquireLogic",
@@ -77,8 +87,15 @@ __all__ = [
     "NDArrayDescription",
     "PluginSignalDataLogic",
     "ADHDFDataLogic",
+    "ADMultiHDFWriters",
+    "ADMultiHDFDataLogic",
     "ADMultipartDataLogic",
+    "ADNDAttributeHDFDataLogic",
     "ADWriterFactory",
+    # Interleaved writers
+    "interleaved_frames_written",
+    "interleaved_frames_written_signal",
+    "create_interleaved_vds",
     # Detector
     "AreaDetector",
     "ContAcqDetector",
@@ -1,14 +1,18 @@
 import asyncio
-from collections.abc import Callable, Sequence
-from dataclasses import dataclass
-from pathlib import PureWindowsPath
-from typing import Any, Generic
+import functools
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path, PureWindowsPath
+from typing import Any, Generic, TypeVar, cast
 from xml.etree import ElementTree as ET
 
 import numpy as np
 
 from ophyd_async.core import (
+    ChunkPolicy,
     DetectorDataLogic,
+    Device,
+    DeviceVector,
     EnableDisable,
     PathInfo,
     PathProvider,
@@ -21,16 +25,17 @@ from ophyd_async.core import (
 )
 from ophyd_async.epics.core import stop_busy_record
 
+from ._interleaved import create_interleaved_vds, interleaved_frames_written_signal
 from ._io import (
     ADBaseColorMode,
     ADBaseDataType,
     ADBaseIO,
+    ADCompression,
     ADFileWriteMode,
     NDArrayBaseIO,
     NDFileHDF5IO,
     NDPluginBaseIO,
     NDPluginFileIO,
-    NDPluginFileIOT,
 )
 from ._ndattribute import NDAttributeDataType, NDAttributePvDbrType
 
@@ -101,6 +106,32 @@ async def get_ndarray_resource_info(
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_ndattribute_xml(maybe_xml: str) -> tuple[tuple[str, tuple[str, str]], ...]:
+    # This is the check that ADCore does to see if it is an XML string
+    # rather than a filename to parse
+    if "<Attributes>" not in maybe_xml:
+        return ()
+    ndattribute_dtypes: list[tuple[str, tuple[str, str]]] = []
+    root = ET.fromstring(maybe_xml)
+    for child in root:
+        if child.attrib.get("type", "EPICS_PV") == "EPICS_PV":
+            dbrtype = child.attrib.get("dbrtype", "DBR_NATIVE")
+            if dbrtype == "DBR_NATIVE":
+                raise RuntimeError(
+                    f"NDAttribute {child.attrib['name']} has dbrtype "
+                    "DBR_NATIVE, which is not supported"
+                )
+            dtype_numpy = NDAttributePvDbrType[dbrtype].value
+            source = "ca://" + child.attrib["source"]
+        else:
+            datatype = child.attrib.get("datatype", "INT")
+            dtype_numpy = NDAttributeDataType[datatype].value
+            source = ""
+        ndattribute_dtypes.append((child.attrib["name"], (dtype_numpy, source)))
+    return tuple(ndattribute_dtypes)
+
+
 async def get_ndattribute_dtype_source(
     elements: Sequence[NDArrayBaseIO],
 ) -> dict[str, tuple[str, str]]:
@@ -109,28 +140,61 @@ async def get_ndattribute_dtype_source(
     )
     ndattribute_dtypes: dict[str, tuple[str, str]] = {}
     for maybe_xml in nd_attribute_xmls:
-        # This is the check that ADCore does to see if it is an XML string
-        # rather than a filename to parse
-        if "<Attributes>" in maybe_xml:
-            root = ET.fromstring(maybe_xml)
-            for child in root:
-                if child.attrib.get("type", "EPICS_PV") == "EPICS_PV":
-                    dbrtype = child.attrib.get("dbrtype", "DBR_NATIVE")
-                    if dbrtype == "DBR_NATIVE":
-                        raise RuntimeError(
-                            f"NDAttribute {child.attrib['name']} has dbrtype "
-                            "DBR_NATIVE, which is not supported"
-                        )
-                    dtype_numpy = NDAttributePvDbrType[dbrtype].value
-                    source = "ca://" + child.attrib["source"]
-                else:
-                    datatype = child.attrib.get("datatype", "INT")
-                    dtype_numpy = NDAttributeDataType[datatype].value
-                    source = ""
-                ndattribute_dtypes[child.attrib["name"]] = (dtype_numpy, source)
+        # The same XML is parsed on every prepare, so only do it once
+        ndattribute_dtypes.update(_parse_ndattribute_xml(maybe_xml))
     return ndattribute_dtypes
 
 
+T = TypeVar("T")
+ADWriterT = TypeVar("ADWriterT", bound=Device)
+
+
+class _MonitoredCache(Generic[T]):
+    """Cache values derived from signals until any of those signals change.
+
+    The signals of each key are monitored from first use, so checking whether
+    they have changed is done from the monitored values rather than from a get.
+    The cached values are dropped if any of the signals disconnect.
+    """
+
+    def __init__(self):
+        self._values: dict[Hashable, tuple[list[Any], T]] = {}
+        self._monitored: set[SignalR] = set()
+
+    def _ignore(self, reading: Any):
+        # The values are compared on each get, the monitor just keeps them current
+        pass
+
+    def _connection_changed(self, connected: bool):
+        if not connected:
+            self._values.clear()
+
+    async def _get_values(self, signals: Sequence[SignalR]) -> list[Any]:
+        for signal in signals:
+            if signal not in self._monitored:
+                signal.subscribe_reading(self._ignore)
+                signal.subscribe_connection(self._connection_changed)
+                self._monitored.add(signal)
+        return list(await asyncio.gather(*[signal.get_value() for signal in signals]))
+
+    async def get(
+        self,
+        signals: Sequence[SignalR],
+        key: Hashable,
+        calculate: Callable[[], Awaitable[T]],
+    ) -> T:
+        signal_values = await self._get_values(signals)
+        if key in self._values:
+            cached_signal_values, value = self._values[key]
+            if cached_signal_values == signal_values:
+                return value
+        value = await calculate()
+        # Don't keep it if a signal changed while we were working it out
+        if await self._get_values(signals) == signal_values:
+            self._values[key] = (signal_values, value)
+        return value
+
+
 async def prepare_file_paths(
     path_info: PathInfo, file_template: str, writer: NDPluginFileIO
 ):
@@ -161,6 +225,121 @@ async def prepare_file_paths(
     await writer.num_capture.set(0)
 
 
+# An HDF5 layout that only writes the NDAttributes of each frame, not the frame data
+_NDATTRIBUTES_ONLY_LAYOUT = (
+    '<?xml version="1.0" standalone="no" ?>'
+    "<hdf5_layout>"
+    '<group name="entry">'
+    '<attribute name="NX_class" source="constant" value="NXentry" type="string"/>'
+    '<group name="instrument">'
+    '<attribute name="NX_class" source="constant" value="NXinstrument" type="string"/>'
+    '<group name="NDAttributes" ndattr_default="true">'
+    '<attribute name="NX_class" source="constant" value="NXcollection" type="string"/>'
+    "</group>"
+    "</group>"
+    "</group>"
+    "</hdf5_layout>"
+)
+
+
+async def _get_frames_per_chunk(
+    chunk_policy: ChunkPolicy | None,
+    array_description: NDArrayDescription,
+    driver: NDArrayBaseIO,
+) -> int | None:
+    # Use the chunk policy if given, otherwise leave it to what is set on the IOC
+    if chunk_policy is None:
+        return None
+    frame = await get_ndarray_resource_info(array_description, "", {})
+    frame_rate = None
+    if isinstance(driver, ADBaseIO):
+        acquire_period = await driver.acquire_period.get_value()
+        if acquire_period > 0:
+            frame_rate = 1 / acquire_period
+    # AreaDetector can only chunk whole frames
+    return chunk_policy.frames_per_chunk(
+        cast(tuple[int, ...], frame.shape), frame.dtype_numpy, frame_rate
+    )
+
+
+async def _prepare_hdf_writer(
+    writer: NDFileHDF5IO,
+    path_info: PathInfo,
+    xml_layout: str = "",
+    frames_per_chunk: int | None = None,
+    compression: str | None = None,
+) -> int:
+    if frames_per_chunk is None:
+        # Determine number of frames that will be saved per HDF chunk.
+        # On a fresh IOC startup, this is set to zero until the first capture,
+        # so if it is zero, set it to 1.
+        frames_per_chunk = await writer.num_frames_chunks.get_value()
+        if frames_per_chunk == 0:
+            frames_per_chunk = 1
+            await writer.num_frames_chunks.set(frames_per_chunk)
+    else:
+        await writer.num_frames_chunks.set(frames_per_chunk)
+    if compression is not None:
+        await writer.compression.set(ADCompression(compression))
+    # Setup the HDF writer
+    await asyncio.gather(
+        writer.chunk_size_auto.set(True),
+        writer.num_extra_dims.set(0),
+        writer.lazy_open.set(True),
+        writer.swmr_mode.set(True),
+        writer.xml_file_name.set(xml_layout),
+        writer.enable_callbacks.set(EnableDisable.ENABLE),
+        prepare_file_paths(path_info=path_info, file_template="%s%s.h5", writer=writer),
+    )
+    return frames_per_chunk
+
+
+def _hdf_resource_signals(
+    array_description: NDArrayDescription, elements: Sequence[NDArrayBaseIO]
+) -> list[SignalR]:
+    # The signals that the resources in an HDF file are derived from
+    return [
+        *array_description.shape_signals,
+        array_description.data_type_signal,
+        array_description.color_mode_signal,
+        *[x.nd_attributes_file for x in elements],
+    ]
+
+
+def _get_ndattribute_resources(
+    ndattribute_dtype_sources: dict[str, tuple[str, str]],
+) -> list[StreamResourceInfo]:
+    return [
+        StreamResourceInfo(
+            data_key=name,
+            shape=(),
+            # NDAttributes appear to always be configured with
+            # this chunk size
+            chunk_shape=(16384,),
+            dtype_numpy=dtype_numpy,
+            source=source,
+            parameters={"dataset": f"/entry/instrument/NDAttributes/{name}"},
+        )
+        for name, (dtype_numpy, source) in ndattribute_dtype_sources.items()
+    ]
+
+
+async def _get_hdf_resources(
+    array_description: NDArrayDescription,
+    elements: Sequence[NDArrayBaseIO],
+    datakey_name: str,
+    frames_per_chunk: int,
+) -> list[StreamResourceInfo]:
+    main_dataset = await get_ndarray_resource_info(
+        array_description=array_description,
+        data_key=datakey_name,
+        parameters={"dataset": "/entry/data/data"},
+        frames_per_chunk=frames_per_chunk,
+    )
+    ndattribute_dtype_sources = await get_ndattribute_dtype_source(elements)
+    return [main_dataset] + _get_ndattribute_resources(ndattribute_dtype_sources)
+
+
 @dataclass
 class ADHDFDataLogic(DetectorDataLogic):
     """Data logic for AreaDetector HDF5 writer plugin.
@@ -171,6 +350,13 @@ class ADHDFDataLogic(DetectorDataLogic):
     :param writer: The NDFileHDFIO plugin instance.
     :param plugins: Additional NDPluginBaseIO instances to extract NDAttributes from.
     :param datakey_suffix: Suffix to append to the data key for the main dataset
+    :param chunk_policy:
+        How to chunk and compress the frames, if not given then the chunking and
+        compression already set on the IOC are used.
+
+    The resources describing what will be written are cached between prepares,
+    and the signals they are derived from are monitored so that the cache is only
+    used while none of them have changed.
     """
 
     array_description: NDArrayDescription
@@ -179,59 +365,48 @@ class ADHDFDataLogic(DetectorDataLogic):
     writer: NDFileHDF5IO
     plugins: Sequence[NDPluginBaseIO] = ()
     datakey_suffix: str = ""
+    chunk_policy: ChunkPolicy | None = None
+    _resources: _MonitoredCache[list[StreamResourceInfo]] = field(
+        default_factory=_MonitoredCache, init=False, repr=False
+    )
+
+    async def _get_resources(
+        self, datakey_name: str, frames_per_chunk: int
+    ) -> list[StreamResourceInfo]:
+        return await _get_hdf_resources(
+            self.array_description,
+            (self.driver, *self.plugins),
+            datakey_name,
+            frames_per_chunk,
+        )
 
     async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
         # Work out where to write
         path_info = self.path_provider(datakey_name)
-        # Determine number of frames that will be saved per HDF chunk.
-        # On a fresh IOC startup, this is set to zero until the first capture,
-        # so if it is zero, set it to 1.
-        frames_per_chunk = await self.writer.num_frames_chunks.get_value()
-        if frames_per_chunk == 0:
-            frames_per_chunk = 1
-            await self.writer.num_frames_chunks.set(frames_per_chunk)
         # Setup the HDF writer
-        await asyncio.gather(
-            self.writer.chunk_size_auto.set(True),
-            self.writer.num_extra_dims.set(0),
-            self.writer.lazy_open.set(True),
-            self.writer.swmr_mode.set(True),
-            self.writer.xml_file_name.set(""),
-            self.writer.enable_callbacks.set(EnableDisable.ENABLE),
-            prepare_file_paths(
-                path_info=path_info, file_template="%s%s.h5", writer=self.writer
+        frames_per_chunk = await _prepare_hdf_writer(
+            self.writer,
+            path_info,
+            frames_per_chunk=await _get_frames_per_chunk(
+                self.chunk_policy, self.array_description, self.driver
             ),
+            compression=self.chunk_policy.compression if self.chunk_policy else None,
         )
         # Start capturing
         await set_and_wait_for_value(
             self.writer.capture, True, wait_for_set_completion=False
         )
         # Return a provider that reflects what we have made
-        main_dataset = await get_ndarray_resource_info(
-            array_description=self.array_description,
-            data_key=datakey_name,
-            parameters={"dataset": "/entry/data/data"},
-            frames_per_chunk=frames_per_chunk,
-        )
-        ndattribute_dtype_sources = await get_ndattribute_dtype_source(
-            (self.driver, *self.plugins)
+        resources = await self._resources.get(
+            signals=_hdf_resource_signals(
+                self.array_description, (self.driver, *self.plugins)
+            ),
+            key=(datakey_name, frames_per_chunk),
+            calculate=lambda: self._get_resources(datakey_name, frames_per_chunk),
         )
-        ndattribute_datasets = [
-            StreamResourceInfo(
-                data_key=name,
-                shape=(),
-                # NDAttributes appear to always be configured with
-                # this chunk size
-                chunk_shape=(16384,),
-                dtype_numpy=dtype_numpy,
-                source=source,
-                parameters={"dataset": f"/entry/instrument/NDAttributes/{name}"},
-            )
-            for name, (dtype_numpy, source) in ndattribute_dtype_sources.items()
-        ]
         return StreamResourceDataProvider(
             uri=f"{path_info.directory_uri}{path_info.filename}.h5",
-            resources=[main_dataset] + ndattribute_datasets,
+            resources=resources,
             mimetype="application/x-hdf5",
             collections_written_signal=self.writer.num_captured,
             flush_signal=self.writer.flush_now,
@@ -245,6 +420,255 @@ class ADHDFDataLogic(DetectorDataLogic):
         return [datakey_name]
 
 
+class ADMultiHDFWriters(Device):
+    """An NDPluginScatter plugin and the HDF5 file writers it sends frames to.
+
+    :param prefix: EPICS PV prefix for the detector.
+    :param scatter_suffix: PV suffix for the NDPluginScatter plugin.
+    :param writer_suffixes: PV suffixes for each of the NDFileHDF5 plugins.
+    :param name: Name for the device.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        scatter_suffix: str,
+        writer_suffixes: Sequence[str],
+        name: str = "",
+    ):
+        self.scatter = NDPluginBaseIO(prefix + scatter_suffix)
+        self.writers = DeviceVector(
+            {
+                i: NDFileHDF5IO(prefix + suffix)
+                for i, suffix in enumerate(writer_suffixes, start=1)
+            }
+        )
+        super().__init__(name=name)
+
+
+@dataclass
+class ADMultiHDFDataLogic(DetectorDataLogic):
+    """Data logic that spreads frames across several AreaDetector HDF5 writers.
+
+    An NDPluginScatter plugin sends each frame to the next writer in turn, so
+    each writer writes every Nth frame to its own file. A file of virtual
+    datasets is created that interleaves these back into order, and this is
+    what appears in the StreamResource. This needs h5py, and the directory
+    being written to must be visible from this process. If the queue of a writer
+    fills then the scatter plugin skips it, and the frames in the virtual
+    datasets would be out of order. When capture is stopped the frames each
+    writer captured are checked against this, and an error raised if they don't
+    match.
+
+    :param array_description: Signals describing the NDArray shape and data type.
+    :param path_provider: Callable that provides path information for file writing.
+    :param driver: The AreaDetector driver instance.
+    :param writers: The NDPluginScatter plugin and the NDFileHDF5 plugins.
+    :param plugins: Additional NDPluginBaseIO instances to extract NDAttributes from.
+    :param datakey_suffix: Suffix to append to the data key for the main dataset
+    :param chunk_policy:
+        How to chunk and compress the frames, if not given then the chunking and
+        compression already set on the IOC are used.
+    """
+
+    array_description: NDArrayDescription
+    path_provider: PathProvider
+    driver: NDArrayBaseIO
+    writers: ADMultiHDFWriters
+    plugins: Sequence[NDPluginBaseIO] = ()
+    datakey_suffix: str = ""
+    chunk_policy: ChunkPolicy | None = None
+    _resources: _MonitoredCache[list[StreamResourceInfo]] = field(
+        default_factory=_MonitoredCache, init=False, repr=False
+    )
+    _frames_written: SignalR[int] | None = field(default=None, init=False, repr=False)
+    _capturing: bool = field(default=False, init=False, repr=False)
+
+    async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
+        # Work out where to write, each writer gets its own file
+        path_info = self.path_provider(datakey_name)
+        writers = list(self.writers.writers.values())
+        writer_path_infos = [
+            path_info.model_copy(update={"filename": f"{path_info.filename}_{i:06d}"})
+            for i in range(1, len(writers) + 1)
+        ]
+        # Make sure the writers get their frames from the scatter plugin
+        scatter_port = await self.writers.scatter.port_name.get_value()
+        await asyncio.gather(
+            self.writers.scatter.enable_callbacks.set(EnableDisable.ENABLE),
+            *[writer.nd_array_port.set(scatter_port) for writer in writers],
+        )
+        # Setup the HDF writers
+        policy_frames_per_chunk = await _get_frames_per_chunk(
+            self.chunk_policy, self.array_description, self.driver
+        )
+        writers_frames_per_chunk = await asyncio.gather(
+            *[
+                _prepare_hdf_writer(
+                    writer,
+                    writer_path_info,
+                    frames_per_chunk=policy_frames_per_chunk,
+                    compression=(
+                        self.chunk_policy.compression if self.chunk_policy else None
+                    ),
+                )
+                for writer, writer_path_info in zip(
+                    writers, writer_path_infos, strict=True
+                )
+            ]
+        )
+        # The resources describe every file, so they must all be chunked the same
+        frames_per_chunk = writers_frames_per_chunk[0]
+        if any(x != frames_per_chunk for x in writers_frames_per_chunk):
+            raise ValueError(
+                f"Writers {[writer.name for writer in writers]} have different "
+                f"frames per chunk {writers_frames_per_chunk}, they must all match"
+            )
+        elements = (self.driver, *self.plugins)
+        resources = await self._resources.get(
+            signals=_hdf_resource_signals(self.array_description, elements),
+            key=(datakey_name, frames_per_chunk),
+            calculate=lambda: _get_hdf_resources(
+                self.array_description, elements, datakey_name, frames_per_chunk
+            ),
+        )
+        # Make the file that interleaves the frames from each writer
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                create_interleaved_vds,
+                Path(path_info.directory_path) / f"{path_info.filename}.h5",
+                source_filenames=[f"{x.filename}.h5" for x in writer_path_infos],
+                datasets={
+                    # AreaDetector frames always have a fixed shape
+                    resource.parameters["dataset"]: (
+                        resource.dtype_numpy,
+                        cast(tuple[int, ...], resource.shape),
+                    )
+                    for resource in resources
+                },
+            ),
+        )
+        # Start capturing
+        self._capturing = True
+        await asyncio.gather(
+            *[
+                set_and_wait_for_value(
+                    writer.capture, True, wait_for_set_completion=False
+                )
+                for writer in writers
+            ]
+        )
+        if self._frames_written is None:
+            self._frames_written = interleaved_frames_written_signal(
+                [writer.num_captured for writer in writers]
+            )
+            await self._frames_written.connect()
+        return StreamResourceDataProvider(
+            uri=f"{path_info.directory_uri}{path_info.filename}.h5",
+            resources=resources,
+            mimetype="application/x-hdf5",
+            collections_written_signal=self._frames_written,
+            flush_signal=[writer.flush_now for writer in writers],
+        )
+
+    async def stop(self) -> None:
+        writers = list(self.writers.writers.values())
+        await asyncio.gather(*[stop_busy_record(writer.capture) for writer in writers])
+        if not self._capturing:
+            return
+        self._capturing = False
+        # The scatter plugin should have sent each writer every Nth frame
+        num_captured = await asyncio.gather(
+            *[writer.num_captured.get_value() for writer in writers]
+        )
+        total = sum(num_captured)
+        expected = [len(range(i, total, len(writers))) for i in range(len(writers))]
+        if num_captured != expected:
+            raise RuntimeError(
+                f"Writers {[writer.name for writer in writers]} captured "
+                f"{num_captured} frames rather than {expected}, so the scatter "
+                "plugin must have skipped a writer with a full queue and the "
+                "frames in the virtual datasets are out of order"
+            )
+
+    def get_hinted_fields(self, datakey_name: str) -> Sequence[str]:
+        # The main NDArray dataset is always hinted
+        return [datakey_name]
+
+
+@dataclass
+class ADNDAttributeHDFDataLogic(DetectorDataLogic):
+    """Data logic that writes the NDAttributes of each frame, but not the frame.
+
+    Plugins like NDStats and NDROIStat can be configured with an NDAttributes XML
+    file to attach their per-frame results to each NDArray. This writes just these
+    to an HDF5 file, so reduced values can be collected at the full frame rate
+    without writing the frames themselves. The writer should get its frames from
+    after these plugins in the plugin chain, and the attributes shouldn't also be
+    written by another HDF5 writer on the same detector, as their data keys would
+    clash. `ADWriterFactory.ndattribute_hdf` takes ``plugin_names`` to arrange this.
+
+    :param path_provider: Callable that provides path information for file writing.
+    :param writer: The NDFileHDFIO plugin instance.
+    :param plugins: NDPluginBaseIO instances to extract NDAttributes from.
+    :param datakey_suffix: Suffix to append to the detector name for the file name
+    :param hinted: Whether the NDAttributes should be hinted
+    """
+
+    path_provider: PathProvider
+    writer: NDFileHDF5IO
+    plugins: Sequence[NDArrayBaseIO]
+    datakey_suffix: str = "-ndattributes"
+    hinted: bool = True
+    _resources: _MonitoredCache[list[StreamResourceInfo]] = field(
+        default_factory=_MonitoredCache, init=False, repr=False
+    )
+    _hinted_fields: list[str] = field(default_factory=list, init=False, repr=False)
+
+    async def _get_resources(self) -> list[StreamResourceInfo]:
+        resources = _get_ndattribute_resources(
+            await get_ndattribute_dtype_source(self.plugins)
+        )
+        if not resources:
+            raise ValueError(
+                f"No NDAttributes are configured for {self.writer.name} to write, "
+                "set nd_attributes_file on one of "
+                f"{[plugin.name for plugin in self.plugins]}"
+            )
+        return resources
+
+    async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
+        # Work out what will be written
+        resources = await self._resources.get(
+            signals=[x.nd_attributes_file for x in self.plugins],
+            key=None,
+            calculate=self._get_resources,
+        )
+        self._hinted_fields = [resource.data_key for resource in resources]
+        # Work out where to write
+        path_info = self.path_provider(datakey_name)
+        # Setup the HDF writer to only write the NDAttributes
+        await _prepare_hdf_writer(self.writer, path_info, _NDATTRIBUTES_ONLY_LAYOUT)
+        # Start capturing
+        await set_and_wait_for_value(
+            self.writer.capture, True, wait_for_set_completion=False
+        )
+        return StreamResourceDataProvider(
+            uri=f"{path_info.directory_uri}{path_info.filename}.h5",
+            resources=resources,
+            mimetype="application/x-hdf5",
+            collections_written_signal=self.writer.num_captured,
+            flush_signal=self.writer.flush_now,
+        )
+
+    async def stop(self) -> None:
+        await stop_busy_record(self.writer.capture)
+
+    def get_hinted_fields(self, datakey_name: str) -> Sequence[str]:
+        return self._hinted_fields if self.hinted else []
+
+
 @dataclass
 class ADMultipartDataLogic(DetectorDataLogic):
     """Data logic for multipart AreaDetector file writers (e.g. JPEG, TIFF).
@@ -302,7 +726,7 @@ class ADMultipartDataLogic(DetectorDataLogic):
 
 
 @dataclass
-class ADWriterFactory(Generic[NDPluginFileIOT]):
+class ADWriterFactory(Generic[ADWriterT]):
     """Factory that creates a file-writer plugin and its matching data logic.
 
     Construct using the classmethods `hdf`, `jpeg`, or `tiff`, then pass one
@@ -312,7 +736,9 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
     `plugins`; it returns the writer device and the corresponding
     `DetectorDataLogic`.
 
-    :param writer_cls: Concrete `NDPluginFileIO` subclass to instantiate.
+    :param writer_cls:
+        Concrete `NDPluginFileIO` subclass to instantiate, or another callable
+        taking the writer's PV prefix and returning the writer device.
     :param writer_suffix: PV suffix appended to *prefix* to form the writer's PV prefix.
     :param writer_name:
         Attribute name under which the writer device is stored on the
@@ -329,9 +755,14 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
     :param data_logic_factory:
         Callable ``(writer, array_description, driver, plugins) → DetectorDataLogic``
         that builds the data logic given the already-constructed writer.
+    :param plugin_names:
+        Names of the detector plugins whose NDAttributes only this writer writes.
+        These are left out of the plugins passed to the other writers, which get
+        the rest. If not given, this writer gets all the plugins that no other
+        writer has claimed.
     """
 
-    writer_cls: type[NDPluginFileIOT]
+    writer_cls: Callable[[str], ADWriterT]
     writer_suffix: str
     writer_name: str
     datakey_suffix: str
@@ -339,16 +770,17 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
         NDArrayDescription | Callable[[ADBaseIO], NDArrayDescription] | None
     )
     data_logic_factory: Callable[
-        [NDPluginFileIOT, NDArrayDescription, ADBaseIO, Sequence[NDPluginBaseIO]],
+        [ADWriterT, NDArrayDescription, ADBaseIO, Sequence[NDPluginBaseIO]],
         DetectorDataLogic,
     ]
+    plugin_names: Sequence[str] | None = None
 
     def __call__(
         self,
         prefix: str,
         driver: ADBaseIO,
         plugins: Sequence[NDPluginBaseIO],
-    ) -> tuple[NDPluginFileIOT, DetectorDataLogic]:
+    ) -> tuple[ADWriterT, DetectorDataLogic]:
         """Instantiate the writer plugin and build the data logic.
 
         :param prefix: EPICS PV prefix for the detector (same as `AreaDetector.prefix`).
@@ -384,6 +816,7 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
         array_description: NDArrayDescription
         | Callable[[ADBaseIO], NDArrayDescription]
         | None = None,
+        chunk_policy: ChunkPolicy | None = None,
     ) -> "ADWriterFactory[NDFileHDF5IO]":
         """Create a factory for an HDF5 file writer.
 
@@ -399,6 +832,8 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
             Pass an `NDArrayDescription` or a callable ``(driver) → NDArrayDescription``
             when the shape/type comes from a plugin rather than the main driver
             (e.g. an ROI plugin).
+        :param chunk_policy:
+            How to chunk and compress the frames, defaults to what is set on the IOC.
         """
         return ADWriterFactory(
             writer_cls=NDFileHDF5IO,
@@ -413,7 +848,115 @@ class ADWriterFactory(Generic[NDPluginFileIOT]):
                 writer=writer,
                 plugins=list(plugins),
                 datakey_suffix=datakey_suffix,
+                chunk_policy=chunk_policy,
+            ),
+        )
+
+    @staticmethod
+    def multi_hdf(
+        path_provider: PathProvider,
+        num_writers: int,
+        scatter_suffix: str = "SCATTER1:",
+        writer_suffix: str = "HDF{}:",
+        writer_name: str = "hdf",
+        datakey_suffix: str = "",
+        array_description: NDArrayDescription
+        | Callable[[ADBaseIO], NDArrayDescription]
+        | None = None,
+        chunk_policy: ChunkPolicy | None = None,
+    ) -> "ADWriterFactory[ADMultiHDFWriters]":
+        """Create a factory for several HDF5 file writers fed by a scatter plugin.
+
+        :param path_provider: Provides file path information for each acquisition.
+        :param num_writers: The number of NDFileHDF5 plugins to spread frames across.
+        :param scatter_suffix: PV suffix for the NDPluginScatter plugin, defaults to
+            ``SCATTER1:``.
+        :param writer_suffix:
+            PV suffix for the NDFileHDF5 plugins, formatted with the writer number
+            starting from 1, defaults to ``HDF{}:``.
+        :param writer_name:
+            Attribute name for the writers on the detector, defaults to
+            ``"hdf"``.
+        :param datakey_suffix: Suffix appended to the datakey name, defaults to ``""``.
+        :param array_description:
+            Override the array shape/type description built from the driver.
+            Pass an `NDArrayDescription` or a callable ``(driver) → NDArrayDescription``
+            when the shape/type comes from a plugin.
+        :param chunk_policy:
+            How to chunk and compress the frames, defaults to what is set on the IOC.
+        """
+        if num_writers < 1:
+            raise ValueError(f"num_writers must be at least 1, got {num_writers}")
+        return ADWriterFactory(
+            writer_cls=lambda prefix: ADMultiHDFWriters(
+                prefix,
+                scatter_suffix=scatter_suffix,
+                writer_suffixes=[
+                    writer_suffix.format(i) for i in range(1, num_writers + 1)
+                ],
+            ),
+            writer_suffix="",
+            writer_name=writer_name,
+            datakey_suffix=datakey_suffix,
+            array_description=array_description,
+            data_logic_factory=lambda writers, desc, driver, plugins: (
+                ADMultiHDFDataLogic(
+                    array_description=desc,
+                    path_provider=path_provider,
+                    driver=driver,
+                    writers=writers,
+                    plugins=list(plugins),
+                    datakey_suffix=datakey_suffix,
+                    chunk_policy=chunk_policy,
+                )
+            ),
+        )
+
+    @staticmethod
+    def ndattribute_hdf(
+        path_provider: PathProvider,
+        writer_suffix: str = "HDF2:",
+        writer_name: str = "ndattribute_hdf",
+        datakey_suffix: str = "-ndattributes",
+        hinted: bool = True,
+        plugin_names: Sequence[str] | None = None,
+    ) -> "ADWriterFactory[NDFileHDF5IO]":
+        """Create a factory for an HDF5 file writer that only writes NDAttributes.
+
+        The NDAttributes come from the ``plugins`` of the detector. If there is
+        another HDF5 writer on the detector then pass ``plugin_names`` so that
+        it leaves out the NDAttributes written here.
+
+        :param path_provider: Provides file path information for each acquisition.
+        :param writer_suffix: PV suffix for the NDFileHDF5 plugin, defaults to
+            ``HDF2:``.
+        :param writer_name:
+            Attribute name for the writer on the detector, defaults to
+            ``"ndattribute_hdf"``.
+        :param datakey_suffix:
+            Suffix appended to the detector name to make the file name, defaults to
+            ``"-ndattributes"``.
+        :param hinted: Whether the NDAttributes should be hinted, defaults to True.
+        :param plugin_names:
+            Names of the detector plugins whose NDAttributes only this writer
+            writes, defaults to all the plugins not claimed by another writer.
+        """
+        return ADWriterFactory(
+            writer_cls=NDFileHDF5IO,
+            writer_suffix=writer_suffix,
+            writer_name=writer_name,
+            datakey_suffix=datakey_suffix,
+            array_description=None,
+            data_logic_factory=lambda writer, desc, driver, plugins: (
+                ADNDAttributeHDFDataLogic(
+                    path_provider=path_provider,
+                    writer=writer,
+                    plugins=list(plugins),
+                    datakey_suffix=datakey_suffix,
+                    hinted=hinted,
+                )
             ),
+            plugin_names=plugin_names,
         )
 
     @staticmethod
@@ -11,7 +11,7 @@ from ophyd_async.core import (
 from ._acquire_logic import ADContAcqAcquireLogic
 from ._data_logic import ADWriterFactory
 from ._io import ADBaseIO, ADBaseIOT, NDCircularBuffIO, NDPluginBaseIO, NDPluginBaseIOT
-from ._trigger_logic import ADContAcqTriggerLogic
+from ._trigger_logic import ADContAcqStreamTriggerLogic, ADContAcqTriggerLogic
 
 
 class AreaDetector(StandardDetector, Generic[ADBaseIOT]):
@@ -43,9 +43,19 @@ class AreaDetector(StandardDetector, Generic[ADBaseIOT]):
                 raise ValueError(
                     f"Duplicate writer_name(s) in writer_factories: {duplicates}"
                 )
-            plugin_list = list(plugins.values()) if plugins else []
+            plugins = plugins or {}
+            # Plugins claimed by a writer are only passed to that writer
+            claimed = {name for f in writer_factories for name in f.plugin_names or ()}
+            if missing := sorted(claimed - set(plugins)):
+                raise ValueError(f"Writer plugin_names {missing} are not in plugins")
+            unclaimed = [name for name in plugins if name not in claimed]
             for factory in writer_factories:
-                writer, data_logic = factory(prefix, driver, plugin_list)
+                names = (
+                    unclaimed if factory.plugin_names is None else factory.plugin_names
+                )
+                writer, data_logic = factory(
+                    prefix, driver, [plugins[name] for name in names]
+                )
                 setattr(self, factory.writer_name, writer)
                 self.add_detector_logics(data_logic)
         self.add_config_signals(
@@ -73,8 +83,12 @@ class ContAcqDetector(AreaDetector[ADBaseIO]):
     :param prefix: EPICS PV prefix for the detector
     :param writer_factories: Factories for file writer plugins and their data logics
     :param driver_suffix: Suffix for the driver PV, defaults to "cam1:"
+    :param cb_suffix: Suffix for the circular buffer plugin PV, defaults to "CB1:"
     :param plugins: Additional areaDetector plugins to include
     :param config_sigs: Additional signals to include in configuration
+    :param trigger_window:
+        Frames to keep from before and after each trigger of the circular buffer.
+        If given, EXTERNAL_EDGE triggering streams a window of frames per event
     :param name: Name for the detector device
     """
 
@@ -86,16 +100,24 @@ class ContAcqDetector(AreaDetector[ADBaseIO]):
         cb_suffix="CB1:",
         plugins: dict[str, NDPluginBaseIO] | None = None,
         config_sigs: Sequence[SignalR] = (),
+        trigger_window: tuple[int, int] | None = None,
         name: str = "",
     ) -> None:
         driver = ADBaseIO(prefix + driver_suffix)
         cb_plugin = NDCircularBuffIO(prefix + cb_suffix)
+        if trigger_window:
+            pre_count, post_count = trigger_window
+            trigger_logic = ADContAcqStreamTriggerLogic(
+                driver, cb_plugin, pre_count=pre_count, post_count=post_count
+            )
+        else:
+            trigger_logic = ADContAcqTriggerLogic(driver, cb_plugin)
         super().__init__(
             driver,
             prefix,
             *writer_factories,
             acquire_logic=ADContAcqAcquireLogic(driver, cb_plugin),
-            trigger_logic=ADContAcqTriggerLogic(driver, cb_plugin),
+            trigger_logic=trigger_logic,
             plugins=(plugins or {}) | {"cb": cb_plugin},
             config_sigs=config_sigs,
             name=name,
@@ -0,0 +1,127 @@
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from ophyd_async.core import Device, SignalR, derived_signal_r
+
+
+def interleaved_frames_written(
+    frames_written: Sequence[int], frames_per_block: int = 1
+) -> int:
+    """Return how many frames interleaved writers have written without any gaps.
+
+    Frames are distributed across N writers in blocks of ``frames_per_block``, so
+    the first writer gets blocks 0, N, 2N, ..., the second gets 1, N+1, 2N+1, ...
+    and so on.
+
+    :param frames_written: The number of frames each writer has written.
+    :param frames_per_block: The number of consecutive frames sent to each writer.
+    :return: The number of frames from the start that have all been written.
+    """
+    num_writers = len(frames_written)
+    return min(
+        ((written // frames_per_block) * num_writers + i) * frames_per_block
+        + written % frames_per_block
+        for i, written in enumerate(frames_written)
+    )
+
+
+def interleaved_frames_written_signal(
+    frames_written: Sequence[SignalR[int]], frames_per_block: int = 1
+) -> SignalR[int]:
+    """Make a signal of how many frames interleaved writers have written.
+
+    This can be used as the ``collections_written_signal`` of a data provider
+    that describes the frames written by all the writers.
+
+    :param frames_written: A signal for the number of frames each writer has written.
+    :param frames_per_block: The number of consecutive frames sent to each writer.
+    """
+    if not frames_written:
+        raise ValueError("At least one frames written signal is required")
+
+    def raw_to_derived(**kwargs: int) -> int:
+        return interleaved_frames_written(
+            [kwargs[f"writer{i}"] for i in range(len(frames_written))],
+            frames_per_block,
+        )
+
+    raw_devices: dict[str, Device] = {
+        f"writer{i}": signal for i, signal in enumerate(frames_written)
+    }
+    return derived_signal_r(
+        raw_to_derived, derived_units=None, derived_precision=None, **raw_devices
+    )
+
+
+def create_interleaved_vds(
+    path: Path,
+    source_filenames: Sequence[str],
+    datasets: Mapping[str, tuple[DTypeLike, Sequence[int]]],
+    frames_per_block: int = 1,
+):
+    """Create an HDF5 file of virtual datasets interleaving frames from other files.
+
+    The virtual datasets are unlimited in the frame dimension, so can be created
+    before any frames are written. Requires h5py to be installed.
+
+    :param path: The file to create.
+    :param source_filenames:
+        The files written by each writer, relative to the directory of ``path``.
+    :param datasets:
+        The path to each dataset that appears in every source file, and the dtype
+        and shape of a single frame in it.
+    :param frames_per_block: The number of consecutive frames sent to each writer.
+    """
+    import h5py
+    import h5py.h5d as h5d
+    import h5py.h5p as h5p
+    import h5py.h5s as h5s
+    import h5py.h5t as h5t
+
+    num_writers = len(source_filenames)
+    with h5py.File(path, "w", libver="latest") as file:
+        for dataset, (dtype, frame_shape) in datasets.items():
+            dtype = np.dtype(dtype)
+            frame_shape = tuple(frame_shape)
+            ones = (1,) * len(frame_shape)
+            zeros = (0,) * len(frame_shape)
+            # Dataspace that starts empty and can grow in the frame dimension
+            unlimited = ((0, *frame_shape), (h5s.UNLIMITED, *frame_shape))
+
+            dcpl = h5p.create(h5p.DATASET_CREATE)
+            dcpl.set_fill_value(np.zeros((), dtype))
+            for i, source_filename in enumerate(source_filenames):
+                # Every num_writers'th block of the virtual dataset...
+                virtual_space = h5s.create_simple(*unlimited)
+                virtual_space.select_hyperslab(
+                    (i * frames_per_block, *zeros),
+                    (h5s.UNLIMITED, *ones),
+                    stride=(num_writers * frames_per_block, *ones),
+                    block=(frames_per_block, *frame_shape),
+                )
+                # ...comes from consecutive blocks of the source dataset
+                source_space = h5s.create_simple(*unlimited)
+                source_space.select_hyperslab(
+                    (0, *zeros),
+                    (h5s.UNLIMITED, *ones),
+                    stride=(frames_per_block, *ones),
+                    block=(frames_per_block, *frame_shape),
+                )
+                dcpl.set_virtual(
+                    virtual_space,
+                    source_filename.encode(),
+                    dataset.encode(),
+                    source_space,
+                )
+            group_name, _, name = dataset.rpartition("/")
+            group = file.require_group(group_name or "/")
+            h5d.create(
+                group.id,
+                name.encode(),
+                h5t.py_create(dtype),
+                h5s.create_simple(*unlimited),
+                dcpl=dcpl,
+            )
@@ -2,12 +2,13 @@ import asyncio
 from dataclasses import dataclass
 
 from ophyd_async.core import (
-    DetectorTriggerLogic as _DetectorTriggerLogic,
-)
-from ophyd_async.core import (
+    DetectorTrigger,
     EnableDisable,
     TriggerInfo,
 )
+from ophyd_async.core import (
+    DetectorTriggerLogic as _DetectorTriggerLogic,
+)
 
 from ._io import ADBaseIO, ADImageMode, NDCBFlushOnSoftTrgMode, NDCircularBuffIO
 
@@ -80,3 +81,56 @@ class ADContAcqTriggerLogic(_DetectorTriggerLogic):
         # in continuous-acquisition mode, not the driver's num_images.
         num = await self.cb_plugin.post_count.get_value()
         return TriggerInfo(collections_per_event=max(1, num))
+
+
+@dataclass
+class ADContAcqStreamTriggerLogic(ADContAcqTriggerLogic):
+    """Trigger logic for streaming windows of frames from a circular buffer.
+
+    While the driver acquires continuously, the circular buffer keeps the latest
+    ``pre_count`` frames, and on each trigger flushes these and the next
+    ``post_count`` frames to the plugins after it. The trigger is either a soft
+    trigger or an NDAttribute condition configured on the CB plugin, and each
+    window of frames is published as a single event.
+
+    :param driver: The AreaDetector driver, which must be acquiring continuously.
+    :param cb_plugin: The circular buffer plugin.
+    :param pre_count: Frames to keep from before each trigger.
+    :param post_count: Frames to keep from after each trigger.
+    """
+
+    pre_count: int = 0
+    post_count: int = 1
+
+    # Windows are only flushed by triggers, so internal triggering is not supported
+    prepare_internal = _DetectorTriggerLogic.prepare_internal
+
+    def __post_init__(self):
+        if self.pre_count < 0 or self.post_count < 0:
+            raise ValueError("pre_count and post_count must not be negative")
+        if self.pre_count + self.post_count == 0:
+            raise ValueError("At least one frame must be kept for each trigger")
+
+    async def prepare_edge(self, num: int, livetime: float):
+        await self._ensure_driver_acquiring(livetime)
+        window = self.pre_count + self.post_count
+        if num % window:
+            raise ValueError(
+                f"Can only stream whole windows of {window} frames, but {num} "
+                f"frames were requested. Set collections_per_event={window}"
+            )
+        await asyncio.gather(
+            self.cb_plugin.enable_callbacks.set(EnableDisable.ENABLE),
+            self.cb_plugin.pre_count.set(self.pre_count),
+            self.cb_plugin.post_count.set(self.post_count),
+            # 0 means keep flushing windows until capture is stopped
+            self.cb_plugin.preset_trigger_count.set(num // window),
+            # Flush a soft trigger now rather than waiting for the next frame
+            self.cb_plugin.flush_on_soft_trg.set(NDCBFlushOnSoftTrgMode.IMMEDIATELY),
+        )
+
+    async def default_trigger_info(self) -> TriggerInfo:
+        return TriggerInfo(
+            trigger=DetectorTrigger.EXTERNAL_EDGE,
+            collections_per_event=self.pre_count + self.post_count,
+        )
@@ -1,11 +1,10 @@
+from typing import TYPE_CHECKING
+
+from . import _signal
 from ._epics_connector import EpicsDeviceConnector, PvSuffix
 from ._epics_device import EpicsDevice
 from ._pvi_connector import PviDeviceConnector, PviTree, SignalDetails
 from ._signal import (
-    CaCommandBackend,
-    CaSignalBackend,
-    PvaCommandBackend,
-    PvaSignalBackend,
     epics_signal_r,
     epics_signal_rw,
     epics_signal_rw_rbv,
@@ -20,6 +19,23 @@ from ._util import (
     wait_for_good_state,
 )
 
+if TYPE_CHECKING:
+    from ._aioca import CaCommandBackend, CaSignalBackend
+    from ._p4p import PvaCommandBackend, PvaSignalBackend
+
+
+def __getattr__(name: str):
+    # Transport backends are only imported on first use, as they are slow to import
+    if name in (
+        "CaCommandBackend",
+        "CaSignalBackend",
+        "PvaCommandBackend",
+        "PvaSignalBackend",
+    ):
+        return getattr(_signal, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "PviDeviceConnector",
     "PviTree",
@@ -384,12 +384,23 @@ class CaSignalBackend(EpicsSignalBackend[SignalDatatypeT]):
             self.subscription = None
 
         if callback:
+
+            def monitor_callback(value: AugmentedValue):
+                # Disconnects are reported as a CANothing, the monitor is
+                # re-armed by aioca when the channel reconnects
+                if value.ok:
+                    self._notify_connection(True)
+                    callback(self._make_reading(value))
+                else:
+                    self._notify_connection(False)
+
             self.subscription = camonitor(
                 self.read_pv,
-                lambda v: callback(self._make_reading(v)),
+                monitor_callback,
                 datatype=self.converter.read_dbr,
                 format=FORMAT_TIME,
                 all_updates=self._all_updates,
+                notify_disconnect=True,
             )
 
 
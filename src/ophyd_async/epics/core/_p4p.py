@@ -12,7 +12,7 @@ import numpy as np
 from bluesky.protocols import Reading
 from event_model import DataKey, Limits, LimitsRange
 from p4p import Value
-from p4p.client.asyncio import Context, Subscription
+from p4p.client.asyncio import Context, Disconnected, Subscription
 from pydantic import BaseModel
 
 from ophyd_async.core import (
@@ -450,13 +450,19 @@ class PvaSignalBackend(EpicsSignalBackend[SignalDatatypeT]):
         if callback:
 
             async def async_callback(v):
-                callback(self._make_reading(v))
+                # Disconnects are reported as an exception, the monitor is
+                # re-armed by p4p when the channel reconnects
+                if isinstance(v, Disconnected):
+                    self._notify_connection(False)
+                elif not isinstance(v, Exception):
+                    self._notify_connection(True)
+                    callback(self._make_reading(v))
 
             request = _pva_request_string(
                 self.converter.value_fields + self.converter.reading_fields
             )
             self.subscription = context().monitor(
-                self.read_pv, async_callback, request=request
+                self.read_pv, async_callback, request=request, notify_disconnect=True
             )
 
 
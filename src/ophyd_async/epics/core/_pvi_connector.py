@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import re
 from collections.abc import Mapping
+from contextlib import nullcontext
 
 from pydantic import (
     Field,
@@ -26,7 +28,12 @@ from ophyd_async.core import (
 )
 
 from ._epics_connector import fill_backend_with_prefix, fill_command_with_prefix
-from ._signal import PvaCommandBackend, PvaSignalBackend, pvget_with_timeout
+from ._signal import (
+    EpicsProtocol,
+    get_command_backend_type,
+    get_signal_backend_type,
+    pvget,
+)
 from ._util import EpicsCommandBackend
 
 
@@ -42,16 +49,45 @@ class PviDeviceConnector(DeviceConnector):
     :param error_hint:
         If given, this will be appended to the error message if any of they type
         hinted Signals are not present.
+    :param lazy:
+        If True, only fetch the PVI structure one level at a time as each Device
+        connects. Sub-devices that are not type hinted are created but not
+        connected, their PVI trees are expanded when they are connected later.
+    :param max_concurrent_fetches:
+        If given, the maximum number of PVI structures that will be fetched in
+        parallel across the whole tree of Devices.
     """
 
     mock_device_vector_len: int = 2
     pvi_tree: PviTree | None = None
 
-    def __init__(self, prefix: str = "", error_hint: str = "") -> None:
+    def __init__(
+        self,
+        prefix: str = "",
+        error_hint: str = "",
+        lazy: bool = False,
+        max_concurrent_fetches: int | None = None,
+    ) -> None:
         # TODO: what happens if we get a leading "pva://" here?
         self.prefix = prefix
         self.pvi_pv = prefix + "PVI"
         self.error_hint = error_hint
+        self.lazy = lazy
+        self.fetch_limiter = (
+            asyncio.Semaphore(max_concurrent_fetches)
+            if max_concurrent_fetches
+            else None
+        )
+        # Names of sub-devices that are not connected with this Device in lazy mode
+        self.deferred_children: set[str] = set()
+
+    def _fill_child_connector(
+        self, connector: PviDeviceConnector, pvi_tree: PviTree
+    ) -> None:
+        connector.pvi_tree = pvi_tree
+        connector.pvi_pv = pvi_tree.pvi_pv
+        connector.lazy = self.lazy
+        connector.fetch_limiter = self.fetch_limiter
 
     def create_children_from_annotations(self, device: Device):
         if not hasattr(self, "filler"):
@@ -67,11 +103,11 @@ class PviDeviceConnector(DeviceConnector):
                         " Command[[], None]; typed Command with parameters is not"
                         " yet supported over EPICS"
                     )
-                return PvaCommandBackend()
+                return get_command_backend_type(EpicsProtocol.PVA)()
 
             self.filler = DeviceFiller(
                 device=device,
-                signal_backend_factory=PvaSignalBackend,
+                signal_backend_factory=get_signal_backend_type(EpicsProtocol.PVA),
                 device_connector_factory=PviDeviceConnector,
                 command_backend_factory=_command_backend_factory,
             )
@@ -101,13 +137,23 @@ class PviDeviceConnector(DeviceConnector):
     async def connect_real(
         self, device: Device, timeout: float, force_reconnect: bool
     ) -> None:
-        if not self.pvi_tree:
-            # Top-level device, so discover PVI tree
+        if not self.pvi_tree or not self.pvi_tree.expanded:
+            # Top-level device, so discover PVI tree. In lazy mode we only
+            # need our own level, and the one below to know the type of children
             self.pvi_tree = await PviTree.build_device_tree(
-                pvi_pv=self.pvi_pv, timeout=timeout
+                pvi_pv=self.pvi_pv,
+                timeout=timeout,
+                max_depth=1 if self.lazy else None,
+                limiter=self.fetch_limiter,
+            )
+        elif self.lazy:
+            # Our parent fetched our level, so fetch the one below
+            self.pvi_tree = await self.pvi_tree.expand_children(
+                timeout=timeout, limiter=self.fetch_limiter
             )
 
         # Fill all sub devices
+        existing_children = {name for name, _ in device.children()}
         for device_name, device_sub_tree in self.pvi_tree.sub_devices.items():
             if device_sub_tree.vector_children:
                 # This is a DeviceVector
@@ -117,8 +163,12 @@ class PviDeviceConnector(DeviceConnector):
             else:
                 # This is a Device
                 connector = self.filler.fill_child_device(device_name)
-            connector.pvi_tree = device_sub_tree
-            connector.pvi_pv = device_sub_tree.pvi_pv
+            self._fill_child_connector(connector, device_sub_tree)
+        if self.lazy:
+            # Sub-devices that weren't type hinted are only connected on demand
+            self.deferred_children.update(
+                name for name, _ in device.children() if name not in existing_children
+            )
 
         # Fill all vector sub-device
         for (
@@ -144,8 +194,7 @@ class PviDeviceConnector(DeviceConnector):
                     connector = self.filler.fill_child_device(
                         device.name, vector_index=vector_index
                     )
-                    connector.pvi_tree = vector_child
-                    connector.pvi_pv = vector_child.pvi_pv
+                    self._fill_child_connector(connector, vector_child)
                 else:
                     raise TypeError(
                         "Failed to fill DeviceVector. "
@@ -170,7 +219,15 @@ class PviDeviceConnector(DeviceConnector):
         self.filler.check_filled(f"{self.pvi_pv}: {self.pvi_tree}{suffix}")
         # Set the name of the device to name all children
         device.set_name(device.name)
-        return await super().connect_real(device, timeout, force_reconnect)
+        await self.connect_children(
+            (
+                (name, child_device)
+                for name, child_device in device.children()
+                if name not in self.deferred_children
+            ),
+            timeout,
+            force_reconnect,
+        )
 
 
 class SignalDetails(ConfinedModel):
@@ -290,6 +347,10 @@ class PviTree(ConfinedModel):
         A mapping of int to `PviTree` objects representing child devices of a vector
         device.
 
+    :param expanded:
+        False if the PVI structure at `pvi_pv` has not been fetched yet, so
+        this tree is a placeholder with no children.
+
     :attr is_signal_vector:
         A computed property returning True if any child device in `vector_children`
         is an instance of `SignalDetails`, else False.
@@ -300,20 +361,31 @@ class PviTree(ConfinedModel):
     commands: Mapping[str, str] = Field(default_factory=dict)
     sub_devices: Mapping[str, PviTree] = Field(default_factory=dict)
     vector_children: Mapping[int, PviTree | SignalDetails] = Field(default_factory=dict)
+    expanded: bool = Field(default=True)
 
     @classmethod
-    async def build_device_tree(cls, pvi_pv: str, timeout: float) -> PviTree:
+    async def build_device_tree(
+        cls,
+        pvi_pv: str,
+        timeout: float,
+        max_depth: int | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> PviTree:
         """Recursively build a PviTree from a top level device.
 
         Starting from the top-level device, this classmethod performs
         post-order traversal over the served PVI structure, populating
         a PviTree from the bottom up.
 
-        :param name: Device name
         :param pvi_pv: Device PVI PV
         :param timeout: Timeout on pvget
+        :param max_depth:
+            If given, how many levels of sub-devices to fetch below this one.
+            Sub-devices deeper than this are left as unexpanded placeholders.
+        :param limiter: If given, limits the number of concurrent pvgets
         """
-        pvi_structure = await pvget_with_timeout(pvi_pv, timeout)
+        async with limiter or nullcontext():
+            pvi_structure = await pvget(pvi_pv, timeout)
 
         # An example entry is: {"d": "Prefix:Device:PVI", "rw": "Prefix:A"}
         # these entries are stored under the parent PVI structure name
@@ -333,11 +405,12 @@ class PviTree(ConfinedModel):
             and set(entries[entry_name]) != {"d"}
         }
 
+        sub_depth = None if max_depth is None else max_depth - 1
         sub_trees = await gather_dict(
             {
-                entry_name: cls._handle_legacy_entry(entry, timeout)
+                entry_name: cls._handle_legacy_entry(entry, timeout, sub_depth, limiter)
                 if isinstance(entry, list)  # Found a legacy entry, try to handle
-                else cls.build_device_tree(entry["d"], timeout)
+                else cls._build_sub_tree(entry["d"], timeout, sub_depth, limiter)
                 for entry_name, entry in entries.items()
             }
         )
@@ -359,9 +432,56 @@ class PviTree(ConfinedModel):
             vector_children=vector_children,
         )
 
+    @classmethod
+    async def _build_sub_tree(
+        cls,
+        pvi_pv: str,
+        timeout: float,
+        max_depth: int | None,
+        limiter: asyncio.Semaphore | None,
+    ) -> PviTree:
+        if max_depth is not None and max_depth < 0:
+            return PviTree(pvi_pv=pvi_pv, expanded=False)
+        return await cls.build_device_tree(pvi_pv, timeout, max_depth, limiter)
+
+    async def expand_children(
+        self, timeout: float, limiter: asyncio.Semaphore | None = None
+    ) -> PviTree:
+        """Return a copy of this tree with its direct sub-devices fetched.
+
+        Any sub-devices or vector children that are unexpanded placeholders will
+        have their own level of the PVI structure fetched, leaving their children
+        as placeholders.
+
+        :param timeout: Timeout on pvget
+        :param limiter: If given, limits the number of concurrent pvgets
+        """
+
+        async def expand(tree: PviTree) -> PviTree:
+            if tree.expanded:
+                return tree
+            return await self.build_device_tree(tree.pvi_pv, timeout, 0, limiter)
+
+        sub_devices, vector_children = await asyncio.gather(
+            gather_dict({k: expand(v) for k, v in self.sub_devices.items()}),
+            gather_dict(
+                {
+                    k: expand(v) if isinstance(v, PviTree) else v
+                    for k, v in self.vector_children.items()
+                }
+            ),
+        )
+        return self.model_copy(
+            update={"sub_devices": sub_devices, "vector_children": vector_children}
+        )
+
     @classmethod
     async def _handle_legacy_entry(
-        cls, legacy_entry: list[None | dict[str, str]], timeout: float
+        cls,
+        legacy_entry: list[None | dict[str, str]],
+        timeout: float,
+        max_depth: int | None = None,
+        limiter: asyncio.Semaphore | None = None,
     ) -> PviTree:
         """Handle legacy vector entries.
 
@@ -376,7 +496,9 @@ class PviTree(ConfinedModel):
         """
         sub_trees = await gather_dict(
             {
-                vector_index: cls.build_device_tree(vector_entry["d"], timeout)
+                vector_index: cls._build_sub_tree(
+                    vector_entry["d"], timeout, max_depth, limiter
+                )
                 for vector_index, vector_entry in enumerate(legacy_entry)
                 if vector_entry is not None
             }
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import warnings
 from collections.abc import Callable
 from enum import Enum
+from typing import Any
 
 from ophyd_async.core import (
     DEFAULT_TIMEOUT,
@@ -27,9 +30,6 @@ class EpicsProtocol(Enum):
     PVA = "pva"
 
 
-_default_epics_protocol = EpicsProtocol.CA
-
-
 def _make_unavailable_function(protocol: str, error: Exception):
     def transport_not_available(*args, **kwargs):
         msg = (
@@ -50,22 +50,57 @@ def _make_unavailable_class(
     return TransportNotAvailable
 
 
-try:
-    from ._p4p import PvaCommandBackend, PvaSignalBackend, pvget_with_timeout
-except ImportError as pva_error:
-    PvaSignalBackend = _make_unavailable_class("pva", pva_error)
-    PvaCommandBackend = _make_unavailable_class("pva", pva_error)
-    pvget_with_timeout = _make_unavailable_function("pva", pva_error)
-else:
-    _default_epics_protocol = EpicsProtocol.PVA
+# The transports are slow to import, so only import them when first used
+_transport_members: dict[str, tuple[str, str]] = {
+    "CaSignalBackend": ("._aioca", "ca"),
+    "CaCommandBackend": ("._aioca", "ca"),
+    "PvaSignalBackend": ("._p4p", "pva"),
+    "PvaCommandBackend": ("._p4p", "pva"),
+    "pvget_with_timeout": ("._p4p", "pva"),
+}
+
+
+def _import_transport_member(name: str) -> Any:
+    if name in globals():
+        return globals()[name]
+    module_name, protocol = _transport_members[name]
+    try:
+        module = importlib.import_module(module_name, __package__)
+    except ImportError as error:
+        if name[0].isupper():
+            value = _make_unavailable_class(protocol, error)
+        else:
+            value = _make_unavailable_function(protocol, error)
+    else:
+        value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _transport_members:
+        return _import_transport_member(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _transport_installed(module_name: str) -> bool:
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# Prefer CA if it is installed, otherwise use PVA if that is
+_default_epics_protocol = (
+    EpicsProtocol.PVA
+    if _transport_installed("p4p") and not _transport_installed("aioca")
+    else EpicsProtocol.CA
+)
+
 
-try:
-    from ._aioca import CaCommandBackend, CaSignalBackend
-except ImportError as ca_error:
-    CaSignalBackend = _make_unavailable_class("ca", ca_error)
-    CaCommandBackend = _make_unavailable_class("ca", ca_error)
-else:
-    _default_epics_protocol = EpicsProtocol.CA
+async def pvget(pv: str, timeout: float) -> Any:
+    """Get the value of a PV over PVA, importing the transport if needed."""
+    return await _import_transport_member("pvget_with_timeout")(pv, timeout)
 
 
 def split_protocol_from_pv(pv: str) -> tuple[EpicsProtocol, str]:
@@ -83,9 +118,9 @@ def split_protocol_from_pv(pv: str) -> tuple[EpicsProtocol, str]:
 def get_signal_backend_type(protocol: EpicsProtocol) -> type[EpicsSignalBackend]:
     match protocol:
         case EpicsProtocol.CA:
-            return CaSignalBackend
+            return _import_transport_member("CaSignalBackend")
         case EpicsProtocol.PVA:
-            return PvaSignalBackend
+            return _import_transport_member("PvaSignalBackend")
     raise TypeError(f"Unsupported protocol: {protocol}")
 
 
@@ -197,9 +232,9 @@ def get_command_backend_type(protocol: EpicsProtocol) -> type:
     """Return the EPICS command backend class for the given protocol."""
     match protocol:
         case EpicsProtocol.CA:
-            return CaCommandBackend
+            return _import_transport_member("CaCommandBackend")
         case EpicsProtocol.PVA:
-            return PvaCommandBackend
+            return _import_transport_member("PvaCommandBackend")
     raise TypeError(f"Unsupported protocol: {protocol}")
 
 
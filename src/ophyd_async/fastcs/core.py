@@ -5,11 +5,20 @@ from ophyd_async.epics.core import PviDeviceConnector
 
 
 def fastcs_connector(
-    uri: str, device: Device | None = None, error_hint: str = ""
+    uri: str,
+    device: Device | None = None,
+    error_hint: str = "",
+    lazy: bool = False,
+    max_concurrent_fetches: int | None = None,
 ) -> DeviceConnector:
     """Create devices and connections on pvi device `Device`."""
     # TODO: add Tango support based on uri scheme
-    connector = PviDeviceConnector(uri, error_hint)
+    connector = PviDeviceConnector(
+        uri,
+        error_hint,
+        lazy=lazy,
+        max_concurrent_fetches=max_concurrent_fetches,
+    )
     if device:
         connector.create_children_from_annotations(device)
     return connector
@@ -1,4 +1,10 @@
-from ophyd_async.core import PathProvider, SignalR, StandardDetector, TriggerableCommand
+from ophyd_async.core import (
+    ChunkPolicy,
+    PathProvider,
+    SignalR,
+    StandardDetector,
+    TriggerableCommand,
+)
 from ophyd_async.fastcs import odin
 from ophyd_async.fastcs.core import fastcs_connector
 
@@ -22,6 +28,8 @@ class EigerDetector(StandardDetector):
         prefix: str,
         path_provider: PathProvider,
         name="",
+        chunk_policy: ChunkPolicy | None = None,
+        create_vds: bool = False,
     ):
         # Need to do this first so the type hints are filled in
         connector = fastcs_connector(prefix, self)
@@ -32,6 +40,9 @@ class EigerDetector(StandardDetector):
                 path_provider=path_provider,
                 odin=self.od,
                 detector_bit_depth=self.detector.bit_depth_image,
+                chunk_policy=chunk_policy,
+                frame_period=self.detector.frame_time,
+                create_vds=create_vds,
             ),
         )
         super().__init__(name=name, connector=connector)
@@ -1,4 +1,4 @@
-from ophyd_async.core import PathProvider, StandardDetector, soft_signal_rw
+from ophyd_async.core import ChunkPolicy, PathProvider, StandardDetector, soft_signal_rw
 from ophyd_async.fastcs import odin
 from ophyd_async.fastcs.core import fastcs_connector
 
@@ -17,6 +17,8 @@ class JungfrauDetector(StandardDetector):
         drv_suffix: str,
         hdf_suffix: str,
         name="",
+        chunk_policy: ChunkPolicy | None = None,
+        create_vds: bool = False,
     ):
         # Need to do this first so the bit depth signal exists for the TriggerLogic
         # once FastCS Jungfrau
@@ -36,6 +38,9 @@ class JungfrauDetector(StandardDetector):
                 path_provider=path_provider,
                 odin=self.odin,
                 detector_bit_depth=self.detector.bit_depth,
+                chunk_policy=chunk_policy,
+                frame_period=self.detector.period_between_frames,
+                create_vds=create_vds,
             ),
         )
         super().__init__(name=name)
@@ -1,76 +1,191 @@
 import asyncio
+import functools
 from collections.abc import Sequence
+from pathlib import Path
 
 import numpy as np
 
 from ophyd_async.core import (
     DEFAULT_TIMEOUT,
+    ChunkPolicy,
     DetectorDataLogic,
     PathProvider,
     SignalR,
     StreamableDataProvider,
     StreamResourceDataProvider,
     StreamResourceInfo,
-    wait_for_value,
+    wait_for_all,
+)
+from ophyd_async.epics.adcore import (
+    create_interleaved_vds,
+    interleaved_frames_written_signal,
 )
 
-from ._io import OdinIO
+from ._io import FrameProcessorIO, OdinIO
 
 
 class OdinDataLogic(DetectorDataLogic):
+    """Data logic for Odin, which may have several frame processes writing.
+
+    Frames are spread across the frame processes in blocks, and each process
+    writes its own file. Only the first file is referenced unless ``create_vds``
+    is set. The write rate of each process is monitored while writing, and is
+    available as ``odin.fp[i].write_rate``.
+
+    :param path_provider: Callable that provides path information for file writing.
+    :param odin: The Odin IO.
+    :param detector_bit_depth: Signal with the bit depth of the detector frames.
+    :param chunk_policy:
+        How to chunk and compress the frames, if not given then BSLZ4 compressed
+        chunks of a single frame are written.
+    :param frame_period:
+        Signal with the time between frames in seconds, so the chunk policy can
+        keep the time taken to fill a chunk down.
+    :param create_vds:
+        If there is more than one frame process, create a file of virtual datasets
+        interleaving the files they write and reference that instead. This needs
+        h5py, and the directory to be mounted and writable from this process.
+    """
+
     def __init__(
         self,
         path_provider: PathProvider,
         odin: OdinIO,
         detector_bit_depth: SignalR[int],
+        chunk_policy: ChunkPolicy | None = None,
+        frame_period: SignalR[float] | None = None,
+        create_vds: bool = False,
     ):
         self.path_provider = path_provider
         self.odin = odin
         self.detector_bit_depth = detector_bit_depth
+        self.chunk_policy = chunk_policy
+        self.frame_period = frame_period
+        self.create_vds = create_vds
+        self._frames_written: dict[int, SignalR[int]] = {}
+        self._monitored: list[FrameProcessorIO] = []
+
+    async def _get_interleaved_frames_written(
+        self, processes: Sequence[FrameProcessorIO], frames_per_block: int
+    ) -> SignalR[int]:
+        if frames_per_block not in self._frames_written:
+            signal = interleaved_frames_written_signal(
+                [process.frames_written for process in processes], frames_per_block
+            )
+            await signal.connect()
+            self._frames_written[frames_per_block] = signal
+        return self._frames_written[frames_per_block]
 
     async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
         # Work out where to write
         path_info = self.path_provider(datakey_name)
-        # Get the current bit depth
-        datatype = f"uint{await self.detector_bit_depth.get_value()}"
+        # Get the current bit depth and frame shape
+        bit_depth, data_shape = await asyncio.gather(
+            self.detector_bit_depth.get_value(),
+            asyncio.gather(
+                self.odin.fp.data_dims_0.get_value(),
+                self.odin.fp.data_dims_1.get_value(),
+            ),
+        )
+        datatype = f"uint{bit_depth}"
         # Setup the HDF writer
         filename = f"{path_info.filename}.h5"
-        await asyncio.gather(
+        coros = [
             self.odin.acquisition_id.set(filename),
             self.odin.file_path.set(str(path_info.directory_path)),
-            self.odin.fp.data_compression.set("BSLZ4"),
+            self.odin.fp.data_compression.set(
+                (self.chunk_policy and self.chunk_policy.compression) or "BSLZ4"
+            ),
             self.odin.fp.data_datatype.set(datatype),
             self.odin.fp.frames.set(0),
             self.odin.block_size.set(
                 100000  # Needed temporarily, see https://github.com/bluesky/ophyd-async/issues/1272
             ),
+        ]
+        if self.chunk_policy:
+            frame_rate = None
+            if self.frame_period:
+                frame_period = await self.frame_period.get_value()
+                if frame_period > 0:
+                    frame_rate = 1 / frame_period
+            chunk_shape = self.chunk_policy.chunk_shape(
+                data_shape, datatype, frame_rate
+            )
+            coros += [
+                signal.set(value)
+                for signal, value in zip(
+                    (
+                        self.odin.fp.data_chunks_0,
+                        self.odin.fp.data_chunks_1,
+                        self.odin.fp.data_chunks_2,
+                    ),
+                    chunk_shape,
+                    strict=True,
+                )
+            ]
+        else:
+            # Use what the frame processes write by default
+            chunk_shape = (1, *data_shape)
+        await asyncio.gather(*coros)
+        # Read back the block size we just set, as that is how the frames
+        # will be spread across the frame processes
+        frames_per_block = max(
+            await self.odin.fp.process_frames_per_block.get_value(), 1
         )
         # Start writing
         await self.odin.fp.start_writing.trigger()
-        await wait_for_value(self.odin.writing, True, timeout=DEFAULT_TIMEOUT)
-        # Must ensure frames_written reset
+        # Must also ensure frames_written reset
         # See issue: https://github.com/DiamondLightSource/fastcs-odin/issues/107
-        await wait_for_value(self.odin.fp.frames_written, 0, timeout=DEFAULT_TIMEOUT)
-        # Return a provider that reflects what we have made
-        data_shape = await asyncio.gather(
-            self.odin.fp.data_dims_0.get_value(), self.odin.fp.data_dims_1.get_value()
+        await wait_for_all(
+            {self.odin.writing: True, self.odin.fp.frames_written: 0},
+            timeout=DEFAULT_TIMEOUT,
         )
+        # Return a provider that reflects what we have made
+        processes = list(self.odin.fp.values())
+        if not self._monitored:
+            for process in processes:
+                process.monitor_write_rate()
+            self._monitored = processes
+        if len(processes) < 2 or not self.create_vds:
+            # Should be _vds instead of _000001, see https://github.com/bluesky/ophyd-async/issues/1272
+            uri_filename = f"{filename}_000001.h5"
+            frames_written = self.odin.fp.frames_written
+        else:
+            # Interleave the files from each process in a virtual dataset
+            uri_filename = f"{filename}_vds.h5"
+            frames_written = await self._get_interleaved_frames_written(
+                processes, frames_per_block
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    create_interleaved_vds,
+                    Path(path_info.directory_path) / uri_filename,
+                    source_filenames=[
+                        f"{filename}_{i:06d}.h5" for i in range(1, len(processes) + 1)
+                    ],
+                    datasets={"/data": (datatype, data_shape)},
+                    frames_per_block=frames_per_block,
+                ),
+            )
         resource = StreamResourceInfo(
             data_key=datakey_name,
             shape=data_shape,
-            chunk_shape=(1, *data_shape),
+            chunk_shape=chunk_shape,
             dtype_numpy=np.dtype(datatype).str,
             parameters={"dataset": "/data"},
         )
         return StreamResourceDataProvider(
-            # Should be _vds instead of _000001, see https://github.com/bluesky/ophyd-async/issues/1272
-            uri=f"{path_info.directory_uri}{filename}_000001.h5",
+            uri=f"{path_info.directory_uri}{uri_filename}",
             resources=[resource],
             mimetype="application/x-hdf5",
-            collections_written_signal=self.odin.fp.frames_written,
+            collections_written_signal=frames_written,
         )
 
     async def stop(self) -> None:
+        for process in self._monitored:
+            process.stop_monitoring_write_rate()
+        self._monitored = []
         await asyncio.gather(
             self.odin.fp.stop_writing.trigger(),
             self.odin.mw.stop.trigger(),
@@ -1,4 +1,14 @@
-from ophyd_async.core import Device, DeviceVector, SignalR, SignalRW, TriggerableCommand
+from bluesky.protocols import Reading
+
+from ophyd_async.core import (
+    Device,
+    DeviceConnector,
+    DeviceVector,
+    SignalR,
+    SignalRW,
+    TriggerableCommand,
+    soft_signal_r_and_setter,
+)
 
 
 class MetaWriterIO(Device):
@@ -14,6 +24,40 @@ class MetaWriterIO(Device):
 class FrameProcessorIO(Device):
     """Ophyd-async implementation of a FrameProcessor Odin Subdevice."""
 
+    frames_written: SignalR[int]
+
+    def __init__(self, name: str = "", connector: DeviceConnector | None = None):
+        #: How fast frames are being written in Hz, while the write rate is monitored
+        self.write_rate, self._set_write_rate = soft_signal_r_and_setter(
+            float, 0.0, units="Hz"
+        )
+        self._last_written: tuple[float, int] | None = None
+        super().__init__(name=name, connector=connector)
+
+    def _update_write_rate(self, reading: dict[str, Reading[int]]):
+        (value,) = reading.values()
+        timestamp, frames_written = value["timestamp"], value["value"]
+        if self._last_written and frames_written >= self._last_written[1]:
+            last_timestamp, last_frames_written = self._last_written
+            if timestamp > last_timestamp:
+                self._set_write_rate(
+                    (frames_written - last_frames_written)
+                    / (timestamp - last_timestamp)
+                )
+        else:
+            # First update, or frames written was reset for a new acquisition
+            self._set_write_rate(0.0)
+        self._last_written = (timestamp, frames_written)
+
+    def monitor_write_rate(self):
+        """Start updating write_rate from the timestamps of frames_written."""
+        self._last_written = None
+        self.frames_written.subscribe_reading(self._update_write_rate)
+
+    def stop_monitoring_write_rate(self):
+        """Stop updating write_rate."""
+        self.frames_written.clear_sub(self._update_write_rate)
+
 
 class FrameProcessorVectorIO(DeviceVector[FrameProcessorIO]):
     """Ophyd-async implementation of a FrameProcessorAdapter Odin Subdevice."""
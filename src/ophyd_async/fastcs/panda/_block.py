@@ -1,4 +1,7 @@
+from typing import Annotated
+
 from ophyd_async.core import (
+    ApplyAfter,
     Device,
     DeviceVector,
     SignalR,
@@ -107,7 +110,7 @@ class SeqBlock(Device):
     table: SignalRW[SeqTable]
     active: SignalR[bool]
     repeats: SignalRW[int]
-    prescale: SignalRW[float]
+    prescale: Annotated[SignalRW[float], ApplyAfter("prescale_units")]
     prescale_units: SignalRW[PandaTimeUnits]
     enable: SignalRW[PandaBitMux]
     posa: SignalRW[PandaPosMux]
@@ -1,6 +1,6 @@
 from bluesky.utils import MsgGenerator, plan
 
-from ophyd_async.core import Settings
+from ophyd_async.core import Settings, SignalRW
 from ophyd_async.plan_stubs import apply_settings
 
 from ._detector import HDFPanda
@@ -8,7 +8,17 @@ from ._detector import HDFPanda
 
 @plan
 def apply_panda_settings(settings: Settings[HDFPanda]) -> MsgGenerator[None]:
-    """Apply given settings to a panda device."""
-    units, others = settings.partition(lambda signal: signal.name.endswith("_units"))
-    yield from apply_settings(units)
-    yield from apply_settings(others)
+    """Apply given settings to a panda device.
+
+    Each signal with a sibling of the same name with suffix "_units" is applied
+    after it, the rest are applied concurrently.
+    """
+    apply_after: dict[SignalRW, list[SignalRW]] = {}
+    for signal in settings:
+        if signal.parent and signal.name.endswith("_units"):
+            for name, sibling in signal.parent.children():
+                if sibling is signal:
+                    units_of = getattr(signal.parent, name.removesuffix("_units"), None)
+                    if isinstance(units_of, SignalRW):
+                        apply_after[units_of] = [signal]
+    yield from apply_settings(settings, apply_after)
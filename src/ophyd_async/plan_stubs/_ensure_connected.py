@@ -1,6 +1,14 @@
+from contextlib import nullcontext
+
 from bluesky.utils import plan
 
-from ophyd_async.core import DEFAULT_TIMEOUT, Device, LazyMock, wait_for_connection
+from ophyd_async.core import (
+    DEFAULT_TIMEOUT,
+    ConnectScheduler,
+    Device,
+    LazyMock,
+    wait_for_connection,
+)
 
 from ._wait_for_awaitable import wait_for_awaitable
 
@@ -11,18 +19,28 @@ def ensure_connected(
     mock: bool | LazyMock = False,
     timeout: float = DEFAULT_TIMEOUT,
     force_reconnect=False,
+    scheduler: ConnectScheduler | None = None,
 ):
-    """Plan stub to ensure devices are connected with a given timeout."""
+    """Plan stub to ensure devices are connected with a given timeout.
+
+    If a [](#ConnectScheduler) is given then it is used for all the connects.
+    """
     device_names = [device.name for device in devices]
     non_unique = {
         device: device.name for device in devices if device_names.count(device.name) > 1
     }
     if non_unique:
         raise ValueError(f"Devices do not have unique names {non_unique}")
-    coros = {
-        device.name: device.connect(
-            mock=mock, timeout=timeout, force_reconnect=force_reconnect
-        )
-        for device in devices
-    }
-    yield from wait_for_awaitable(wait_for_connection(**coros))
+
+    async def connect_devices():
+        # The connect tasks inherit the scheduler from the context they are made in
+        with scheduler.use() if scheduler else nullcontext():
+            coros = {
+                device.name: device.connect(
+                    mock=mock, timeout=timeout, force_reconnect=force_reconnect
+                )
+                for device in devices
+            }
+            await wait_for_connection(**coros)
+
+    yield from wait_for_awaitable(connect_devices())
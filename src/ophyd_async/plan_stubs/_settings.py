@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
-import bluesky.plan_stubs as bps
 import numpy as np
 from bluesky.utils import MsgGenerator, plan
 
@@ -14,6 +13,7 @@ from ophyd_async.core import (
     SettingsProvider,
     SignalRW,
     Table,
+    settings_hash,
     walk_config_signals,
     walk_rw_signals,
 )
@@ -95,16 +95,26 @@ def retrieve_settings(
     return Settings(device, signal_values)
 
 
+async def _apply_batches(batches: list[Settings]):
+    for batch in batches:
+        await asyncio.gather(*[signal.set(value) for signal, value in batch.items()])
+
+
 @plan
-def apply_settings(settings: Settings) -> MsgGenerator[None]:
-    """Set every SignalRW to the given value in Settings. If value is None ignore it."""
-    signal_values = {
-        signal: value for signal, value in settings.items() if value is not None
-    }
-    if signal_values:
-        for signal, value in signal_values.items():
-            yield from bps.abs_set(signal, value, group="apply_settings")
-        yield from bps.wait("apply_settings")
+def apply_settings(
+    settings: Settings,
+    apply_after: Mapping[SignalRW, Iterable[SignalRW]] | None = None,
+) -> MsgGenerator[None]:
+    """Set every SignalRW to the given value in Settings. If value is None ignore it.
+
+    The signals are set concurrently, except where they have been declared to be
+    applied after each other with `ApplyAfter` or in ``apply_after``, in which
+    case they are set in batches that respect these dependencies.
+    """
+    settings, _ = settings.partition(lambda signal: settings[signal] is not None)
+    if settings:
+        batches = settings.apply_batches(apply_after)
+        yield from wait_for_awaitable(_apply_batches(batches))
 
 
 @plan
@@ -112,6 +122,7 @@ def apply_settings_if_different(
     settings: Settings,
     apply_plan: Callable[[Settings], MsgGenerator[None]],
     current_settings: Settings | None = None,
+    provider: SettingsProvider | None = None,
 ) -> MsgGenerator[None]:
     """Set every SignalRW in settings, only if it is different to the current value.
 
@@ -122,12 +133,39 @@ def apply_settings_if_different(
         If given, should be a superset of settings containing the current value of
         the Settings in the Device. If not given it will be created by reading just
         the signals given in settings.
+    :param provider:
+        If given, use the hashes it keeps of the settings last known to be on the
+        Device to skip reading and setting signals that already have the value in
+        settings, then record the applied settings in it. The provider monitors
+        the signals it has hashes for until `SettingsProvider.forget_applied` is
+        called, so changes made by anything else are seen.
+        Signals that are not children of the Device are always read.
     """
+    signals: dict[str, SignalRW] = {}
+    to_record: dict[str, str] = {}
+    if provider:
+        names = {sig: name for name, sig in walk_rw_signals(settings.device).items()}
+        hashes = {
+            sig: settings_hash(value)
+            for sig, value in settings.items()
+            if value is not None and sig in names
+        }
+        applied = provider.applied_hashes(settings.device.name)
+        # Only consider the signals whose value could differ
+        settings, _ = settings.partition(
+            lambda sig: (
+                settings[sig] is not None
+                and (sig not in hashes or applied.get(names[sig]) != hashes[sig])
+            )
+        )
+        signals = {names[sig]: sig for sig in settings if sig in hashes}
+        to_record = {name: hashes[sig] for name, sig in signals.items()}
     if current_settings is None:
         # If we aren't give the current settings, then get the
         # values of just the signals we were asked to change.
         # This allows us to use this plan with Settings for a subset
-        # of signals in the Device without retrieving them all
+        # of signals in the Device without retrieving them all.
+        # Monitored signals will return their cached value.
         signal_values = yield from _get_values_of_signals(
             {sig: sig for sig in settings}
         )
@@ -150,3 +188,7 @@ def apply_settings_if_different(
         lambda sig: _is_different(current_settings[sig], settings[sig])
     )
     yield from apply_plan(settings_to_change)
+    if provider:
+        yield from wait_for_awaitable(
+            provider.record_applied(settings.device.name, signals, to_record)
+        )
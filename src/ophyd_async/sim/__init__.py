@@ -1,6 +1,7 @@
 """Some simulated devices to be used in tutorials and testing."""
 
 from ._blob_detector import SimBlobDetector
+from ._load_detector import SimLoadDetector
 from ._mirror_horizontal import HorizontalMirror, HorizontalMirrorDerived
 from ._mirror_vertical import (
     TwoJackDerived,
@@ -19,6 +20,7 @@ __all__ = [
     "PatternGenerator",
     "SimPointDetector",
     "SimBlobDetector",
+    "SimLoadDetector",
     "VerticalMirror",
     "HorizontalMirror",
     "HorizontalMirrorDerived",
@@ -3,6 +3,7 @@ from collections.abc import Sequence
 import numpy as np
 
 from ophyd_async.core import (
+    ChunkPolicy,
     DetectorDataLogic,
     PathProvider,
     StreamableDataProvider,
@@ -21,33 +22,46 @@ class BlobDataLogic(DetectorDataLogic):
         self,
         path_provider: PathProvider,
         pattern_generator: PatternGenerator,
+        chunk_policy: ChunkPolicy | None = None,
     ):
         self.path_provider = path_provider
         self.pattern_generator = pattern_generator
+        self.chunk_policy = chunk_policy
 
     async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
         # Work out where to write
         path_info = self.path_provider(datakey_name)
+        # Work out how to chunk the data
+        data_dtype = np.dtype(np.uint8).str
+        sum_dtype = np.dtype(np.int64).str
+        if self.chunk_policy:
+            # The trigger logic has already set the frame rate
+            frame_rate = self.pattern_generator.frame_rate
+            data_chunks = self.chunk_policy.chunk_shape(
+                (HEIGHT, WIDTH), data_dtype, frame_rate
+            )
+            sum_chunks = self.chunk_policy.chunk_shape((), sum_dtype, frame_rate)
+            compression = self.chunk_policy.compression
+        else:
+            data_chunks, sum_chunks, compression = (1, HEIGHT, WIDTH), (1024,), None
         # Open the file
         write_path = path_info.directory_path / f"{path_info.filename}.h5"
-        self.pattern_generator.open_file(write_path, WIDTH, HEIGHT)
+        self.pattern_generator.open_file(
+            write_path, WIDTH, HEIGHT, data_chunks, sum_chunks, compression
+        )
         # Return a provider that reflects what we have made
         data_resource = StreamResourceInfo(
             data_key=datakey_name,
             shape=(HEIGHT, WIDTH),
-            # NDAttributes appear to always be configured with
-            # this chunk size
-            chunk_shape=(1, HEIGHT, WIDTH),
-            dtype_numpy=np.dtype(np.uint8).str,
+            chunk_shape=data_chunks,
+            dtype_numpy=data_dtype,
             parameters={"dataset": DATA_PATH},
         )
         sum_resource = StreamResourceInfo(
             data_key=f"{datakey_name}-sum",
             shape=(),
-            # NDAttributes appear to always be configured with
-            # this chunk size
-            chunk_shape=(1024,),
-            dtype_numpy=np.dtype(np.int64).str,
+            chunk_shape=sum_chunks,
+            dtype_numpy=sum_dtype,
             parameters={"dataset": SUM_PATH},
         )
         return StreamResourceDataProvider(
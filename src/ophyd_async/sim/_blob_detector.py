@@ -1,6 +1,6 @@
 from collections.abc import Sequence
 
-from ophyd_async.core import PathProvider, SignalR, StandardDetector
+from ophyd_async.core import ChunkPolicy, PathProvider, SignalR, StandardDetector
 
 from ._blob_acquire_logic import BlobAcquireLogic
 from ._blob_data_logic import BlobDataLogic
@@ -17,13 +17,16 @@ class SimBlobDetector(StandardDetector):
         pattern_generator: PatternGenerator | None = None,
         config_sigs: Sequence[SignalR] = (),
         name: str = "",
+        chunk_policy: ChunkPolicy | None = None,
     ) -> None:
         self.pattern_generator = pattern_generator or PatternGenerator()
         self.add_detector_logics(
             BlobTriggerLogic(pattern_generator=self.pattern_generator),
             BlobAcquireLogic(pattern_generator=self.pattern_generator),
             BlobDataLogic(
-                path_provider=path_provider, pattern_generator=self.pattern_generator
+                path_provider=path_provider,
+                pattern_generator=self.pattern_generator,
+                chunk_policy=chunk_policy,
             ),
         )
         self.add_config_signals(*config_sigs)
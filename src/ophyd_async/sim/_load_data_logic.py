@@ -0,0 +1,97 @@
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from ophyd_async.core import (
+    ChunkPolicy,
+    DetectorDataLogic,
+    PathProvider,
+    StreamableDataProvider,
+    StreamResourceDataProvider,
+    StreamResourceInfo,
+)
+
+from ._load_generator import LoadGenerator
+from ._pattern_generator import DATA_PATH
+
+# The most frames to write in a batch, so the memory held for it is bounded
+_MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+
+class LoadDataLogic(DetectorDataLogic):
+    def __init__(
+        self,
+        path_provider: PathProvider,
+        load_generator: LoadGenerator,
+        width: int,
+        height: int,
+        dtype_numpy: str,
+        chunk_policy: ChunkPolicy,
+        batch_period: float = 0.1,
+    ):
+        self.path_provider = path_provider
+        self.load_generator = load_generator
+        self.width = width
+        self.height = height
+        self.dtype_numpy = dtype_numpy
+        self.chunk_policy = chunk_policy
+        self.batch_period = batch_period
+
+    def _batch_frames(self, frames_per_chunk: int, frame_rate: float | None) -> int:
+        # Write whole chunks at a time so each is only compressed once
+        chunk_bytes = (
+            frames_per_chunk
+            * self.width
+            * self.height
+            * np.dtype(self.dtype_numpy).itemsize
+        )
+        max_chunks = max(1, _MAX_BATCH_BYTES // chunk_bytes)
+        if frame_rate:
+            # Write the frames that are due each batch period
+            due_chunks = math.ceil(frame_rate * self.batch_period / frames_per_chunk)
+            return min(max(due_chunks, 1), max_chunks) * frames_per_chunk
+        else:
+            # As fast as possible, so write as much as we can at a time
+            return max_chunks * frames_per_chunk
+
+    async def prepare_unbounded(self, datakey_name: str) -> StreamableDataProvider:
+        # Work out where to write
+        path_info = self.path_provider(datakey_name)
+        # Work out how to chunk the data, the trigger logic has already set the rate
+        chunks = self.chunk_policy.chunk_shape(
+            (self.height, self.width),
+            self.dtype_numpy,
+            self.load_generator.frame_rate,
+        )
+        # Open the file, ready to write in batches
+        write_path = path_info.directory_path / f"{path_info.filename}.h5"
+        self.load_generator.open_load_file(
+            write_path,
+            self.width,
+            self.height,
+            self.dtype_numpy,
+            chunks,
+            self.chunk_policy.compression,
+            batch_frames=self._batch_frames(chunks[0], self.load_generator.frame_rate),
+        )
+        # Return a provider that reflects what we have made
+        data_resource = StreamResourceInfo(
+            data_key=datakey_name,
+            shape=(self.height, self.width),
+            chunk_shape=chunks,
+            dtype_numpy=self.dtype_numpy,
+            parameters={"dataset": DATA_PATH},
+        )
+        return StreamResourceDataProvider(
+            uri=f"{path_info.directory_uri}{path_info.filename}.h5",
+            resources=[data_resource],
+            mimetype="application/x-hdf5",
+            collections_written_signal=self.load_generator.images_written,
+        )
+
+    async def stop(self) -> None:
+        self.load_generator.close_file()
+
+    def get_hinted_fields(self, datakey_name: str) -> Sequence[str]:
+        return [datakey_name]
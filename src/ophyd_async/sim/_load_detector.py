@@ -0,0 +1,58 @@
+from ophyd_async.core import ChunkPolicy, PathProvider, StandardDetector
+
+from ._blob_acquire_logic import BlobAcquireLogic
+from ._blob_trigger_logic import BlobTriggerLogic
+from ._load_data_logic import LoadDataLogic
+from ._load_generator import LoadGenerator
+
+
+class SimLoadDetector(StandardDetector):
+    """Simulates a detector writing frames to HDF5 at a realistic data rate.
+
+    This is for benchmarking the detector and document pipeline offline. It
+    triggers like `SimBlobDetector`, but the frame size and dtype are
+    configurable, and frames are written from a background thread in batches
+    of whole chunks.
+
+    :param path_provider: Provides the path of the file to write.
+    :param width: The width of each frame in pixels.
+    :param height: The height of each frame in pixels.
+    :param dtype_numpy: The numpy dtype of each pixel, e.g. ``<u2``.
+    :param frame_rate:
+        The number of frames to write per second if not set by the `TriggerInfo`,
+        None means as fast as possible.
+    :param chunk_policy:
+        How to chunk and compress the frames, defaults to uncompressed chunks
+        of about 1MiB.
+    :param batch_period:
+        How long to let frames become due before writing them together, rounded
+        up to whole chunks.
+    :param name: The name of the detector.
+    """
+
+    def __init__(
+        self,
+        path_provider: PathProvider,
+        width: int = 1024,
+        height: int = 1024,
+        dtype_numpy: str = "<u2",
+        frame_rate: float | None = 100.0,
+        chunk_policy: ChunkPolicy | None = None,
+        batch_period: float = 0.1,
+        name: str = "",
+    ) -> None:
+        self.load_generator = LoadGenerator(frame_rate)
+        self.add_detector_logics(
+            BlobTriggerLogic(pattern_generator=self.load_generator),
+            BlobAcquireLogic(pattern_generator=self.load_generator),
+            LoadDataLogic(
+                path_provider=path_provider,
+                load_generator=self.load_generator,
+                width=width,
+                height=height,
+                dtype_numpy=dtype_numpy,
+                chunk_policy=chunk_policy or ChunkPolicy(),
+                batch_period=batch_period,
+            ),
+        )
+        super().__init__(name=name)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from pathlib import PurePath
+
+import h5py
+import numpy as np
+
+from ._pattern_generator import DATA_PATH, PatternGenerator, generate_gaussian_blob
+
+
+class LoadFile:
+    def __init__(
+        self,
+        path: PurePath,
+        width: int,
+        height: int,
+        dtype_numpy: str,
+        chunks: tuple[int, ...],
+        compression: str | None = None,
+        batch_frames: int = 1,
+    ):
+        self.file = h5py.File(path, "w", libver="latest")
+        self.data = self.file.create_dataset(
+            name=DATA_PATH,
+            shape=(0, height, width),
+            dtype=dtype_numpy,
+            maxshape=(None, height, width),
+            chunks=chunks,
+            compression=compression,
+        )
+        # Once datasets written, can switch the model to single writer multiple reader
+        self.file.swmr_mode = True
+        # Noise is slow to make, so only make a chunk of it and repeat that
+        noisy_blobs = _make_noisy_blobs(
+            min(batch_frames, chunks[0]), height, width, dtype_numpy
+        )
+        self.batch = np.resize(noisy_blobs, (batch_frames, height, width))
+        self.image_counter = 0
+
+    def write_images_to_file(self, num: int):
+        # Resize and flush once for the whole batch rather than once per frame
+        self.data.resize(self.image_counter + num, axis=0)
+        self.data[self.image_counter : self.image_counter + num] = self.batch[:num]
+        self.data.flush()
+        self.image_counter += num
+
+    def close(self):
+        self.file.close()
+
+
+def _make_noisy_blobs(num: int, height: int, width: int, dtype_numpy: str):
+    # Noise makes the frames compress about as well as real ones would
+    rng = np.random.default_rng(seed=0)
+    blob = generate_gaussian_blob(height, width)
+    dtype = np.dtype(dtype_numpy)
+    if np.issubdtype(dtype, np.integer):
+        max_value = min(np.iinfo(dtype).max, 2**16)
+        frames = rng.poisson(blob * max_value / 2, size=(num, *blob.shape))
+        frames = np.clip(frames, 0, max_value)
+    else:
+        frames = blob + rng.normal(scale=0.01, size=(num, *blob.shape))
+    return np.ascontiguousarray(frames, dtype=dtype)
+
+
+class LoadGenerator(PatternGenerator):
+    """Writes frames to file at a given rate, for load testing.
+
+    Unlike `PatternGenerator`, frames are written from a background thread in
+    batches, so realistic data rates can be reached.
+
+    :param frame_rate:
+        The number of frames to write per second if the exposure time and deadtime
+        are not given, None means as fast as possible.
+    """
+
+    def __init__(self, frame_rate: float | None = 100.0):
+        super().__init__()
+        self._period = 1 / frame_rate if frame_rate else 0.0
+        self._load_file: LoadFile | None = None
+        self._stop_writing = threading.Event()
+
+    def open_load_file(
+        self,
+        path: PurePath,
+        width: int,
+        height: int,
+        dtype_numpy: str,
+        chunks: tuple[int, ...],
+        compression: str | None = None,
+        batch_frames: int = 1,
+    ):
+        self._load_file = LoadFile(
+            path, width, height, dtype_numpy, chunks, compression, batch_frames
+        )
+        self._update_images_written(0)
+
+    def _get_load_file(self) -> LoadFile:
+        if not self._load_file:
+            raise RuntimeError("open_load_file not run")
+        return self._load_file
+
+    def _write_batches(self, file: LoadFile, loop: asyncio.AbstractEventLoop):
+        start = time.monotonic()
+        batch_frames = len(file.batch)
+        num = self._number_of_frames
+        written = 0
+        while written < num and not self._stop_writing.is_set():
+            if self._period:
+                due = min(num, math.floor((time.monotonic() - start) / self._period))
+                if due - written < min(batch_frames, num - written):
+                    # Wait until there are enough frames for a batch
+                    next_batch = min(written + batch_frames, num)
+                    self._stop_writing.wait(
+                        start + next_batch * self._period - time.monotonic()
+                    )
+                    continue
+            else:
+                due = num
+            count = min(due - written, batch_frames)
+            file.write_images_to_file(count)
+            written += count
+            # Publish the total in the file, as each trigger appends to it
+            loop.call_soon_threadsafe(self._update_images_written, file.image_counter)
+
+    async def write_images_to_file(self):
+        file = self._get_load_file()
+        self._stop_writing.clear()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self._write_batches, file, loop)
+        try:
+            await asyncio.shield(future)
+        finally:
+            # If we were cancelled then stop the thread and wait for it to finish
+            self._stop_writing.set()
+            await future
+
+    def close_file(self):
+        if self._load_file:
+            self._load_file.close()
+            self._load_file = None
+        super().close_file()
@@ -40,6 +40,9 @@ class PatternFile:
         path: PurePath,
         width: int = 320,
         height: int = 240,
+        data_chunks: tuple[int, ...] | None = None,
+        sum_chunks: tuple[int, ...] = (1024,),
+        compression: str | None = None,
     ):
         self.file = h5py.File(path, "w", libver="latest")
         self.data = self.file.create_dataset(
@@ -47,14 +50,16 @@ class PatternFile:
             shape=(0, height, width),
             dtype=np.uint8,
             maxshape=(None, height, width),
-            chunks=(1, height, width),
+            chunks=data_chunks or (1, height, width),
+            compression=compression,
         )
         self.sum = self.file.create_dataset(
             name=SUM_PATH,
             shape=(0,),
             dtype=np.int64,
             maxshape=(None,),
-            chunks=(1024,),
+            chunks=sum_chunks,
+            compression=compression,
         )
         # Once datasets written, can switch the model to single writer multiple reader
         self.file.swmr_mode = True
@@ -86,6 +91,11 @@ class PatternGenerator:
         self.sleep = sleep
         self.images_written, self._update_images_written = soft_signal_r_and_setter(int)
 
+    @property
+    def frame_rate(self) -> float | None:
+        """The number of frames that will be written per second, if limited."""
+        return 1 / self._period if self._period else None
+
     def set_x(self, x: float):
         self._x = x
 
@@ -97,8 +107,18 @@ class PatternGenerator:
         offset = 100 if high_energy else 10
         return generate_interesting_pattern(self._x, self._y, channel, offset)
 
-    def open_file(self, path: PurePath, width: int, height: int):
-        self._file = PatternFile(path, width, height)
+    def open_file(
+        self,
+        path: PurePath,
+        width: int,
+        height: int,
+        data_chunks: tuple[int, ...] | None = None,
+        sum_chunks: tuple[int, ...] = (1024,),
+        compression: str | None = None,
+    ):
+        self._file = PatternFile(
+            path, width, height, data_chunks, sum_chunks, compression
+        )
         self._update_images_written(0)
 
     def _get_file(self) -> PatternFile:
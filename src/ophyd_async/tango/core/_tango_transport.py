@@ -2,10 +2,14 @@ import asyncio
 import functools
 import logging
 import re
+import time
+import warnings
 from abc import abstractmethod
 from collections.abc import Callable, Coroutine, Sequence
+from dataclasses import dataclass
 from typing import (
     Any,
+    ClassVar,
     ParamSpec,
     TypeVar,
     cast,
@@ -291,7 +295,8 @@ class AttributeProxy(TangoProxy):
     def __init__(self, device_proxy: DeviceProxy, name: str):
         self._callback: Callback | None = None
         self._eid: int | None = None
-        self._poll_task: asyncio.Task | None = None
+        self._poll_scheduler: _TangoPollScheduler | None = None
+        self._polled: _PolledAttribute | None = None
         self._abs_change: float | None = None
         self._rel_change: float | None = None
         self._polling_period: float = 0.1
@@ -387,16 +392,7 @@ class AttributeProxy(TangoProxy):
         elif self._allow_polling:
             """start polling if no events supported"""
             if self._callback is not None:
-
-                async def _poll():
-                    while True:
-                        try:
-                            await self.poll()
-                        except RuntimeError as exc:
-                            self.exception = exc
-                            await asyncio.sleep(1)
-
-                self._poll_task = asyncio.create_task(_poll())
+                self._start_polling(self._callback)
         else:
             self.unsubscribe_callback()
             raise RuntimeError(
@@ -405,6 +401,51 @@ class AttributeProxy(TangoProxy):
                 " for which polling is disabled."
             )
 
+    def _start_polling(self, callback: Callback):
+        if self._polled is not None:
+            # Already polling, so just send the readings somewhere else
+            self._polled.callback = callback
+            return
+        self._polled = _PolledAttribute(
+            name=self._name,
+            converter=self._converter,
+            callback=callback,
+            on_error=self._set_poll_exception,
+            period=self._polling_period,
+            abs_change=self._abs_change,
+            rel_change=self._rel_change,
+        )
+        self._poll_scheduler = _TangoPollScheduler.for_device(self._proxy)
+        self._poll_scheduler.add(self._polled)
+
+    async def poll(self):
+        """Poll the attribute and call the callback if the value has changed.
+
+        Deprecated, as `subscribe_callback` starts polling an attribute that does
+        not support events if `set_polling` allows it. This calls the callback
+        with the current reading, then makes sure the attribute is polled along
+        with the other attributes of the device until `unsubscribe_callback`.
+        """
+        warnings.warn(
+            "AttributeProxy.poll is deprecated, subscribe_callback starts polling "
+            "when set_polling allows it",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        try:
+            reading = await self.get_reading()
+            if self._callback is not None:
+                self._callback(reading)
+        except Exception as exc:
+            raise RuntimeError(f"Could not poll the attribute: {exc}") from exc
+        if self._callback is not None:
+            self._start_polling(self._callback)
+            if self._polled is not None:
+                self._polled.last_reading = self._polled.last_emitted = reading
+
+    def _set_poll_exception(self, exc: Exception):
+        self.exception = RuntimeError(f"Could not poll the attribute: {exc}")
+
     def unsubscribe_callback(self):
         if self._eid:
             try:
@@ -413,9 +454,12 @@ class AttributeProxy(TangoProxy):
                 logger.warning(f"Could not unsubscribe from event: {exc}")
             finally:
                 self._eid = None
-        if self._poll_task:
-            self._poll_task.cancel()
-            self._poll_task = None
+        if self._poll_scheduler and self._polled:
+            self._poll_scheduler.remove(self._polled)
+            self._poll_scheduler = None
+            if self._polled.last_reading is not None:
+                self._last_reading = self._polled.last_reading
+            self._polled = None
             if self._callback is not None:
                 # Call the callback with the last reading
                 try:
@@ -435,79 +479,6 @@ class AttributeProxy(TangoProxy):
             if self._callback is not None:
                 self._callback(reading)
 
-    async def poll(self):
-        """Poll the attribute and call the callback if the value has changed.
-
-        Only callback if value has changed by more than the absolute or relative
-        change. This function is used when an attribute that does not support
-        events is cached or a callback is passed to it.
-        """
-        try:
-            last_reading = await self.get_reading()
-            flag = 0
-            # Initial reading
-            if self._callback is not None:
-                self._callback(last_reading)
-        except Exception as exc:
-            raise RuntimeError(f"Could not poll the attribute: {exc}") from exc
-
-        try:
-            # If the value is a number, we can check for changes
-            if isinstance(last_reading["value"], int | float):
-                while True:
-                    await asyncio.sleep(self._polling_period)
-                    reading = await self.get_reading()
-                    if reading is None or reading["value"] is None:
-                        continue
-                    diff = abs(reading["value"] - last_reading["value"])
-                    if self._abs_change is not None and diff >= abs(self._abs_change):
-                        if self._callback is not None:
-                            self._callback(reading)
-                            flag = 0
-
-                    elif (
-                        self._rel_change is not None
-                        and diff >= self._rel_change * abs(last_reading["value"])
-                    ):
-                        if self._callback is not None:
-                            self._callback(reading)
-                            flag = 0
-
-                    else:
-                        flag = (flag + 1) % 4
-                        if flag == 0 and self._callback is not None:
-                            self._callback(reading)
-
-                    last_reading = reading.copy()
-                    if self._callback is None:
-                        break
-            # If the value is not a number, we can only poll
-            else:
-                while True:
-                    await asyncio.sleep(self._polling_period)
-                    flag = (flag + 1) % 4
-                    if flag == 0:
-                        reading = await self.get_reading()
-                        if reading is None or reading["value"] is None:
-                            continue
-                        if isinstance(reading["value"], np.ndarray):
-                            if not np.array_equal(
-                                reading["value"], last_reading["value"]
-                            ):
-                                if self._callback is not None:
-                                    self._callback(reading)
-                                else:
-                                    break
-                        else:
-                            if reading["value"] != last_reading["value"]:
-                                if self._callback is not None:
-                                    self._callback(reading)
-                                else:
-                                    break
-                        last_reading = reading.copy()
-        except Exception as exc:
-            raise RuntimeError(f"Could not poll the attribute: {exc}") from exc
-
     def set_polling(
         self,
         allow_polling: bool = False,
@@ -515,11 +486,196 @@ class AttributeProxy(TangoProxy):
         abs_change: float | None = None,
         rel_change: float | None = 0.1,
     ):
-        """Set the polling parameters."""
+        """Set the polling parameters.
+
+        These apply straight away if the attribute is already being polled.
+        """
         self._allow_polling = allow_polling
         self._polling_period = polling_period
         self._abs_change = abs_change
         self._rel_change = rel_change
+        if self._polled is not None:
+            # The scheduler reads these from the attribute on every poll
+            self._polled.period = polling_period
+            self._polled.abs_change = abs_change
+            self._polled.rel_change = rel_change
+
+
+@dataclass(eq=False)
+class _PolledAttribute:
+    """An attribute registered with a `_TangoPollScheduler`."""
+
+    name: str
+    converter: TangoConverter
+    callback: Callback
+    on_error: Callable[[Exception], None]
+    period: float
+    abs_change: float | None
+    rel_change: float | None
+    next_poll: float = 0.0
+    last_reading: Reading | None = None
+    last_emitted: Reading | None = None
+
+
+class _TangoPollScheduler:
+    """Poll every non-event attribute of a single DeviceProxy together.
+
+    Each tick, all attributes that are due are fetched with one
+    ``read_attributes`` call, the abs/rel change filters of the numeric
+    scalars among them are evaluated with numpy in one go, and callbacks are
+    only fired for the attributes that changed. If reading takes a significant
+    fraction of the polling period the effective period is stretched so the
+    device is not saturated.
+    """
+
+    _schedulers: ClassVar[dict[tuple[int, int], "_TangoPollScheduler"]] = {}
+
+    def __init__(self, device_proxy: DeviceProxy):
+        self._proxy = device_proxy
+        self._attrs: list[_PolledAttribute] = []
+        self._loop = asyncio.get_running_loop()
+        self._key = (id(self._loop), id(device_proxy))
+        self._wakeup: asyncio.Future[None] | None = None
+        self._task: asyncio.Task | None = None
+        # Moving average of the time taken by a batched read
+        self.read_time: float = 0.0
+
+    @classmethod
+    def for_device(cls, device_proxy: DeviceProxy) -> "_TangoPollScheduler":
+        """Get the scheduler for this DeviceProxy, making it if needed."""
+        key = (id(asyncio.get_running_loop()), id(device_proxy))
+        if key not in cls._schedulers:
+            cls._schedulers[key] = cls(device_proxy)
+        return cls._schedulers[key]
+
+    def add(self, attr: _PolledAttribute):
+        if attr not in self._attrs:
+            self._attrs.append(attr)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wake()
+
+    def remove(self, attr: _PolledAttribute):
+        if attr in self._attrs:
+            self._attrs.remove(attr)
+        if not self._attrs:
+            if self._task:
+                self._task.cancel()
+                self._task = None
+            if self._schedulers.get(self._key) is self:
+                del self._schedulers[self._key]
+
+    def _wake(self):
+        if self._wakeup and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def _run(self):
+        while self._attrs:
+            now = time.monotonic()
+            due = [attr for attr in self._attrs if attr.next_poll <= now]
+            if due:
+                await self._poll(due)
+                for attr in due:
+                    # Never spend more than half of the time reading the device
+                    attr.next_poll = now + max(attr.period, 2 * self.read_time)
+            if not self._attrs:
+                break
+            delay = min(attr.next_poll for attr in self._attrs) - time.monotonic()
+            # Sleep until the next attribute is due, or a new one is added
+            self._wakeup = self._loop.create_future()
+            handle = self._loop.call_later(max(delay, 0), self._wake)
+            try:
+                await self._wakeup
+            finally:
+                handle.cancel()
+
+    @ensure_proper_executor
+    async def _read(self, names: list[str]) -> dict[str, Any]:
+        start = time.monotonic()
+        try:
+            results = await self._proxy.read_attributes(names)  # type: ignore
+            dev_attrs: dict[str, Any] = dict(zip(names, results, strict=True))
+        except Exception:
+            # Something in the batch is unreadable, so find out which one
+            dev_attrs = {}
+            for name in names:
+                try:
+                    dev_attrs[name] = await self._proxy.read_attribute(name)  # type: ignore
+                except Exception as exc:
+                    dev_attrs[name] = exc
+        self.read_time = 0.8 * self.read_time + 0.2 * (time.monotonic() - start)
+        return dev_attrs
+
+    async def _poll(self, due: list[_PolledAttribute]):
+        dev_attrs = await self._read(list(dict.fromkeys(attr.name for attr in due)))
+        polled: list[_PolledAttribute] = []
+        for attr in due:
+            dev_attr = dev_attrs[attr.name]
+            try:
+                if isinstance(dev_attr, Exception):
+                    raise dev_attr
+                if getattr(dev_attr, "has_failed", False):
+                    raise RuntimeError(f"Reading {attr.name} failed")
+                attr.last_reading = Reading(
+                    value=attr.converter.value(dev_attr.value),
+                    timestamp=dev_attr.time.totime(),
+                    alarm_severity=dev_attr.quality,
+                )
+            except Exception as exc:
+                attr.on_error(exc)
+            else:
+                polled.append(attr)
+        for attr, changed in zip(polled, _polled_changes(polled), strict=True):
+            if changed and attr.last_reading is not None:
+                attr.last_emitted = attr.last_reading
+                try:
+                    attr.callback(attr.last_reading)
+                except Exception as exc:
+                    attr.on_error(exc)
+
+
+def _polled_changes(polled: list[_PolledAttribute]) -> list[bool]:
+    """Work out which polled readings differ from the last ones emitted.
+
+    Numeric scalars are compared to their abs/rel change thresholds in a single
+    vectorised operation, anything else is emitted whenever its value changes.
+    """
+    changed = [True] * len(polled)
+    numeric: list[_PolledAttribute] = []
+    numeric_indices: list[int] = []
+    for i, attr in enumerate(polled):
+        if attr.last_emitted is None or attr.last_reading is None:
+            continue
+        value, last = attr.last_reading["value"], attr.last_emitted["value"]
+        if isinstance(value, int | float) and isinstance(last, int | float):
+            numeric.append(attr)
+            numeric_indices.append(i)
+        elif isinstance(value, np.ndarray) or isinstance(last, np.ndarray):
+            changed[i] = not np.array_equal(value, last)
+        else:
+            changed[i] = value != last
+    if numeric:
+        value = np.array([a.last_reading["value"] for a in numeric], dtype=np.float64)  # type: ignore
+        last = np.array([a.last_emitted["value"] for a in numeric], dtype=np.float64)  # type: ignore
+        abs_change = np.array(
+            [np.inf if a.abs_change is None else abs(a.abs_change) for a in numeric]
+        )
+        rel_change = np.array(
+            [np.inf if a.rel_change is None else a.rel_change for a in numeric]
+        )
+        unfiltered = np.array(
+            [a.abs_change is None and a.rel_change is None for a in numeric]
+        )
+        with np.errstate(invalid="ignore"):
+            diff = np.abs(value - last)
+            passed = np.where(
+                unfiltered,
+                diff > 0,
+                (diff >= abs_change) | (diff >= rel_change * np.abs(last)),
+            )
+        for i, flag in zip(numeric_indices, passed, strict=True):
+            changed[i] = bool(flag)
+    return changed
 
 
 class CommandProxy(TangoProxy):
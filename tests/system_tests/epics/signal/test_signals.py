@@ -22,6 +22,7 @@ from ophyd.signal import EpicsSignal
 from ophyd_async.core import (
     Array1D,
     Command,
+    ConnectionMonitor,
     NotConnectedError,
     Signal,
     SignalDatatypeT,
@@ -462,6 +463,35 @@ async def test_error_raised_on_disconnected_pv(
         await signal.set(True, timeout=0.1)
 
 
+@pytest.mark.timeout(TIMEOUT + 30)
+async def test_connection_monitor_sees_ioc_restart():
+    ioc_devices = EpicsTestIocAndDevices()
+    ioc_devices.ioc.start()
+    device = ioc_devices.pva_device
+    try:
+        await device.connect()
+        monitor = ConnectionMonitor(device)
+        counts = []
+        monitor.subscribe(counts.append)
+        monitor.start()
+        assert await device.a_float.get_value() == 3.141
+        ioc_devices.ioc.stop()
+        while monitor.disconnected_count < len(monitor._callbacks):
+            await asyncio.sleep(0.1)
+        assert "a_float" in monitor.disconnected
+        with pytest.raises(NotConnectedError, match="is disconnected"):
+            await device.a_float.get_value()
+        ioc_devices.ioc.start()
+        while monitor.disconnected_count:
+            await asyncio.sleep(0.1)
+        # The monitors have been re-armed and are giving values again
+        assert await device.a_float.get_value() == 3.141
+        assert counts[0] == counts[-1] == 0
+        monitor.stop()
+    finally:
+        ioc_devices.ioc.stop()
+
+
 class BadEnum(StrictEnum):
     A = "Aaa"
     B = "B"
@@ -101,3 +101,39 @@ async def test_panda_block_missing_signals(panda_pva, panda_t):
             == "PandA has a pulse block containing a width signal which has not been "
             + "retrieved by PVI."
         )
+
+
+@pytest.mark.timeout(15.0 if os.name == "nt" else 4.5)
+async def test_panda_lazy_connect_defers_extra_blocks(panda_pva):
+    class Panda(Device):
+        pcap: PcapBlock
+        pulse: DeviceVector[PulseBlock]
+        seq: DeviceVector[SeqBlock]
+
+        def __init__(self, uri: str, name: str = ""):
+            super().__init__(
+                name=name,
+                connector=fastcs_connector(
+                    uri, self, lazy=True, max_concurrent_fetches=2
+                ),
+            )
+
+    panda = Panda("PANDAQSRV:", name="panda")
+    await panda.connect()
+
+    # Annotated blocks are filled and connected
+    assert panda.seq[1].table._connector.backend.datatype is SeqTable
+    assert panda.pcap.newsignal
+    assert await panda.pulse[1].delay.get_value() == 0
+
+    # Extra blocks exist with the right type, but are not expanded yet
+    assert panda._connector.deferred_children == {"extra", "ttlout"}
+    assert isinstance(panda.extra, DeviceVector)
+    assert len(panda.extra) == 0
+
+    # Until they are connected
+    await panda.extra.connect()
+    assert isinstance(panda.extra[1], Device)
+    assert isinstance(panda.extra[2], Device)
+    await panda.ttlout.connect()
+    assert isinstance(panda.ttlout[1], Signal)
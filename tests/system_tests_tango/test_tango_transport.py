@@ -3,6 +3,7 @@ import logging
 import re
 from collections.abc import Sequence
 from typing import Any
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import numpy.typing as npt
@@ -507,6 +508,53 @@ async def test_attribute_poll(tango_test_device):
     attr_proxy.unsubscribe_callback()
 
 
+# --------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.timeout(3)
+async def test_attribute_poll_thresholds_can_change_while_polling(tango_test_device):
+    device_proxy = await DeviceProxy(tango_test_device)
+    attr_proxy = AttributeProxy(device_proxy, "floatvalue")
+    attr_proxy.support_events = False
+    values = []
+    attr_proxy.set_polling(True, 0.1, 100, 100.0)
+    attr_proxy.subscribe_callback(lambda reading: values.append(reading["value"]))
+    await asyncio.sleep(0.2)
+    values.clear()
+    # A small change is filtered out by the thresholds given at subscribe
+    current_value = await attr_proxy.get()
+    await attr_proxy.put(current_value + 1)
+    await asyncio.sleep(0.25)
+    assert values == []
+    # But not once they are lowered
+    attr_proxy.set_polling(True, 0.1, 0.5, None)
+    await asyncio.sleep(0.25)
+    assert values == [current_value + 1]
+    attr_proxy.unsubscribe_callback()
+
+
+# --------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.timeout(3)
+async def test_attribute_poll_is_deprecated(tango_test_device):
+    device_proxy = await DeviceProxy(tango_test_device)
+    attr_proxy = AttributeProxy(device_proxy, "floatvalue")
+    attr_proxy.support_events = False
+    attr_proxy._callback = callback = MagicMock()
+    with pytest.deprecated_call(match="AttributeProxy.poll is deprecated"):
+        await attr_proxy.poll()
+    # The current value is sent straight away
+    current_value = await attr_proxy.get()
+    callback.assert_called_once()
+    assert callback.call_args.args[0]["value"] == current_value
+    # And then changes are polled for
+    assert attr_proxy._poll_scheduler
+    await attr_proxy.put(current_value + 2)
+    await asyncio.sleep(0.7)
+    assert callback.call_args.args[0]["value"] == current_value + 2
+    attr_proxy.unsubscribe_callback()
+    assert attr_proxy._poll_scheduler is None
+
+
 # --------------------------------------------------------------------
 @pytest.mark.asyncio
 @pytest.mark.parametrize("attr", ["array", "label"])
@@ -534,10 +582,41 @@ async def test_attribute_poll_stringsandarrays(tango_test_device, attr):
         await asyncio.sleep(0.5)
         assert val == "new label"
 
-    assert attr_proxy._poll_task
+    assert attr_proxy._poll_scheduler
     attr_proxy.unsubscribe_callback()
 
 
+# --------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.timeout(3)
+async def test_attribute_poll_batches_reads_per_device(tango_test_device):
+    device_proxy = await DeviceProxy(tango_test_device)
+    proxies = [AttributeProxy(device_proxy, name) for name in ("floatvalue", "label")]
+    values = {}
+    for attr_proxy in proxies:
+        attr_proxy.support_events = False
+        attr_proxy.set_polling(True, 0.1)
+        attr_proxy.subscribe_callback(
+            lambda reading, name=attr_proxy._name: values.update({name: reading})
+        )
+    scheduler = proxies[0]._poll_scheduler
+    assert scheduler is not None
+    assert scheduler is proxies[1]._poll_scheduler
+    with patch.object(scheduler, "_read", wraps=scheduler._read) as read:
+        await asyncio.sleep(0.35)
+    assert set(values) == {"floatvalue", "label"}
+    assert read.call_count >= 2
+    for call in read.call_args_list:
+        assert call.args[0] == ["floatvalue", "label"]
+    # Unchanged values are not re-emitted
+    values.clear()
+    await asyncio.sleep(0.25)
+    assert values == {}
+    for attr_proxy in proxies:
+        attr_proxy.unsubscribe_callback()
+    assert scheduler._task is None
+
+
 # --------------------------------------------------------------------
 @pytest.mark.asyncio
 async def test_attribute_poll_exceptions(tango_test_device):
@@ -0,0 +1,42 @@
+import pytest
+
+from ophyd_async.core import ChunkPolicy, ReadPattern
+
+
+@pytest.mark.parametrize(
+    "frame_shape,dtype_numpy,frame_rate,expected",
+    [
+        # Frames bigger than the target get a chunk each
+        ((2048, 2048), "<u2", None, (1, 2048, 2048)),
+        # Small frames are grouped together
+        ((256, 256), "<u2", None, (8, 256, 256)),
+        # But not so many that a chunk takes too long to fill
+        ((256, 256), "<u2", 4, (4, 256, 256)),
+        ((), "<f8", None, (131072,)),
+        ((), "<f8", 1000, (1000,)),
+        # Zero sized dimensions are treated as 1
+        ((0, 10), "<u1", None, (104857, 1, 10)),
+    ],
+)
+def test_chunk_policy_for_frames(
+    frame_shape: tuple[int, ...],
+    dtype_numpy: str,
+    frame_rate: float | None,
+    expected: tuple[int, ...],
+):
+    policy = ChunkPolicy()
+    assert policy.chunk_shape(frame_shape, dtype_numpy, frame_rate) == expected
+    assert policy.frames_per_chunk(frame_shape, dtype_numpy, frame_rate) == expected[0]
+
+
+@pytest.mark.parametrize(
+    "frame_rate,expected",
+    [(None, (128, 64, 64)), (20, (20, 128, 128)), (1000, (128, 64, 64))],
+)
+def test_chunk_policy_tiles_frames_for_time_series(
+    frame_rate: float | None, expected: tuple[int, ...]
+):
+    policy = ChunkPolicy(read_pattern=ReadPattern.TIME_SERIES)
+    assert policy.chunk_shape((2048, 2048), "<u2", frame_rate) == expected
+    # Writers that can only chunk whole frames get a frame per chunk
+    assert policy.frames_per_chunk((2048, 2048), "<u2", frame_rate) == 1
@@ -8,6 +8,7 @@ import pytest
 
 from ophyd_async.core import (
     DEFAULT_TIMEOUT,
+    ConnectScheduler,
     Device,
     DeviceFiller,
     DeviceProcessor,
@@ -15,6 +16,7 @@ from ophyd_async.core import (
     NotConnectedError,
     Reference,
     SignalRW,
+    SoftSignalBackend,
     init_devices,
     soft_signal_rw,
     wait_for_connection,
@@ -273,6 +275,104 @@ async def test_no_reconnect_signals_if_not_forced():
         assert parent.child1.connect.call_count == count
 
 
+class CountingBackend(SoftSignalBackend[int]):
+    def __init__(self, label: str, record: list[str], failures: int = 0):
+        self.label = label
+        self.record = record
+        self.failures = failures
+        super().__init__(int)
+
+    async def connect(self, timeout: float):
+        self.record.append(self.label)
+        if self.failures:
+            self.failures -= 1
+            raise NotConnectedError("Not there yet")
+        await asyncio.sleep(0.01)
+
+
+class ManySignals(Device):
+    def __init__(self, name: str, record: list[str], failures: int = 0):
+        self.signals = DeviceVector(
+            {i: SignalRW(CountingBackend(name, record, failures)) for i in range(10)}
+        )
+        super().__init__(name)
+
+
+async def test_connect_scheduler_bounds_concurrent_connects():
+    record = []
+    device = ManySignals("device", record)
+    scheduler = ConnectScheduler(max_concurrent=3)
+    in_flight = []
+
+    async def watch():
+        while True:
+            in_flight.append(scheduler.in_flight)
+            await asyncio.sleep(0.001)
+
+    watcher = asyncio.create_task(watch())
+    with scheduler.use():
+        await device.connect()
+    watcher.cancel()
+    assert len(record) == 10
+    assert max(in_flight) == 3
+    assert scheduler.in_flight == 0
+
+
+class TwoGroups(Device):
+    def __init__(self, name: str, record: list[str]):
+        self.first = ManySignals("first", record)
+        self.second = ManySignals("second", record)
+        super().__init__(name)
+
+
+async def test_connect_scheduler_connects_priority_devices_first():
+    record = []
+    parent = TwoGroups("parent", record)
+    scheduler = ConnectScheduler(max_concurrent=1, priority=[parent.second])
+    with scheduler.use():
+        await parent.connect()
+    assert record == ["second"] * 10 + ["first"] * 10
+
+
+def test_ensure_connected_uses_scheduler(RE):
+    record = []
+    parent = TwoGroups("parent", record)
+    scheduler = ConnectScheduler(max_concurrent=1, priority=[parent.second])
+    # Devices that override connect without knowing about schedulers still work
+    dummy = DummyBaseDevice()
+    dummy.set_name("dummy")
+    RE(ensure_connected(parent, dummy, scheduler=scheduler))
+    assert record == ["second"] * 10 + ["first"] * 10
+    assert dummy.connected
+
+
+async def test_connect_scheduler_retries_with_backoff():
+    record = []
+    device = ManySignals("device", record, failures=2)
+    scheduler = ConnectScheduler(max_attempts=3, backoff=0.001, max_backoff=0.002)
+    with scheduler.use():
+        await device.connect()
+    assert len(record) == 30
+    assert scheduler.retries == 20
+    # But not if we run out of attempts
+    device = ManySignals("device", record, failures=2)
+    with (
+        ConnectScheduler(max_attempts=2, backoff=0).use(),
+        pytest.raises(NotConnectedError, match="Not there yet"),
+    ):
+        await device.connect()
+
+
+def test_connect_scheduler_retry_delay_is_jittered_and_capped():
+    scheduler = ConnectScheduler(backoff=1.0, max_backoff=4.0, jitter=0.5)
+    delays = [scheduler.retry_delay(attempt) for attempt in range(5)]
+    assert 0.5 <= delays[0] <= 1.5
+    assert 1.0 <= delays[1] <= 3.0
+    assert all(2.0 <= delay <= 6.0 for delay in delays[2:])
+    with pytest.raises(ValueError, match="max_concurrent must be >= 1"):
+        ConnectScheduler(max_concurrent=0)
+
+
 def test_setitem_with_non_int_key():
     device_vector = DeviceVector(children={})
     with pytest.raises(TypeError, match="Expected int, got"):
@@ -1,9 +1,10 @@
 import asyncio
 import math
 import re
-from typing import TypeVar
-from unittest.mock import ANY, call
+from typing import ClassVar, TypedDict, TypeVar
+from unittest.mock import ANY, call, patch
 
+import numpy as np
 import pytest
 from bluesky.protocols import Reading
 
@@ -85,6 +86,144 @@ async def test_monitoring_position():
     assert results.empty()
 
 
+async def test_monitoring_only_emits_changed_outputs():
+    results = asyncio.Queue[dict[str, Reading[float]]]()
+    inst = VerticalMirror("mirror")
+    inst.height.subscribe_reading(results.put_nowait)
+    inst.angle.subscribe_reading(results.put_nowait)
+    assert [await results.get(), await results.get()] == [
+        {"mirror-height": {"value": 0, "timestamp": ANY, "alarm_severity": 0}},
+        {"mirror-angle": {"value": 0, "timestamp": ANY, "alarm_severity": 0}},
+    ]
+    transform = await inst._factory.transform()
+    # Both jacks moving together in the same tick only changes the height
+    await asyncio.gather(inst.y1.set(1), inst.y2.set(1))
+    assert await results.get() == {
+        "mirror-height": {"value": 1, "timestamp": ANY, "alarm_severity": 0}
+    }
+    await asyncio.sleep(0)
+    assert results.empty()
+    # And the transform is reused until one of its parameters changes
+    assert await inst._factory.transform() is transform
+    await inst.y1_y2_distance.set(2)
+    assert await inst._factory.transform() is not transform
+    inst.height.clear_sub(results.put_nowait)
+    inst.angle.clear_sub(results.put_nowait)
+
+
+async def test_concurrent_reads_share_raw_reads():
+    inst = HorizontalMirror("mirror")
+    await inst.x2.set(1)
+    with (
+        patch.object(inst.x1, "read", wraps=inst.x1.read) as x1_read,
+        patch.object(inst.x2, "read", wraps=inst.x2.read) as x2_read,
+    ):
+        x, roll = await asyncio.gather(inst.x.read(), inst.roll.read())
+        assert x1_read.call_count == x2_read.call_count == 1
+        # But the next read does a new read of the raw devices
+        await inst.x.read()
+        assert x1_read.call_count == x2_read.call_count == 2
+    assert x["mirror-x"]["value"] == 0.5
+    assert roll["mirror-roll"]["value"] == pytest.approx(math.pi / 4)
+
+
+async def test_read_after_set_does_not_share_earlier_read():
+    inst = HorizontalMirror("mirror")
+    release = asyncio.Event()
+    x1_read = inst.x1.read
+
+    async def slow_x1_read():
+        await release.wait()
+        return await x1_read()
+
+    with patch.object(inst.x1, "read", side_effect=slow_x1_read):
+        before_set = asyncio.create_task(inst.x.read())
+        # Let the read of the raw devices start, and read x2
+        for _ in range(3):
+            await asyncio.sleep(0)
+        await inst.x2.set(2)
+        # This read is still in progress, but must not be used after the set
+        after_set = asyncio.create_task(inst.x.read())
+        await asyncio.sleep(0)
+        release.set()
+        assert (await before_set)["mirror-x"]["value"] == 0
+        assert (await after_set)["mirror-x"]["value"] == 1
+
+
+class ScaledDerived(TypedDict):
+    scaled: float
+
+
+class ScaledRaw(TypedDict):
+    raw: float
+
+
+class ScaledTransform(Transform):
+    gain: float
+    calls: ClassVar[int] = 0
+
+    def raw_to_derived(self, *, raw: float) -> ScaledDerived:
+        ScaledTransform.calls += 1
+        return ScaledDerived(scaled=raw * self.gain)
+
+    def derived_to_raw(self, *, scaled: float) -> ScaledRaw:
+        ScaledTransform.calls += 1
+        return ScaledRaw(raw=scaled / self.gain)
+
+
+async def test_batch_conversion_is_vectorised():
+    async def set_derived(value: float):
+        pass
+
+    factory = DerivedSignalFactory(
+        ScaledTransform, set_derived, raw=soft_signal_rw(float), gain=2.0
+    )
+    derived = await factory.raw_to_derived_batch(raw=np.arange(1000.0))
+    np.testing.assert_array_equal(derived["scaled"], np.arange(0.0, 2000.0, 2.0))
+    raw = await factory.derived_to_raw_batch(scaled=derived["scaled"])
+    np.testing.assert_array_equal(raw["raw"], np.arange(1000.0))
+    # Each direction was a single call for all the points
+    assert ScaledTransform.calls == 2
+
+
+class AbsTransform(Transform):
+    def raw_to_derived(self, *, raw: float) -> ScaledDerived:
+        return ScaledDerived(scaled=raw if raw > 0 else -raw)
+
+    def derived_to_raw(self, *, scaled: float) -> ScaledRaw:
+        return ScaledRaw(raw=scaled)
+
+
+async def test_batch_conversion_of_conditional_transform():
+    async def set_derived(value: float):
+        pass
+
+    factory = DerivedSignalFactory(AbsTransform, set_derived, raw=soft_signal_rw(float))
+    # Using an array in an if statement raises ValueError, so it is evaluated
+    # point by point
+    derived = await factory.raw_to_derived_batch(raw=[-2.0, 1.0, -3.0])
+    np.testing.assert_array_equal(derived["scaled"], [2.0, 1.0, 3.0])
+
+
+async def test_batch_conversion_of_scalar_transform():
+    inst = VerticalMirror("mirror")
+    await inst.y1.set(1)
+    await inst.y1_y2_distance.set(2)
+    # TwoJackTransform uses math so is evaluated point by point,
+    # and the y1 position is taken from its current value
+    derived = await inst._factory.raw_to_derived_batch(jack2=[1, 3, -1])
+    np.testing.assert_allclose(derived["height"], [1, 2, 0])
+    np.testing.assert_allclose(derived["angle"], [0, math.pi / 4, -math.pi / 4])
+    raw = await inst._factory.derived_to_raw_batch(height=[2, 3], angle=[0, 0])
+    assert raw.keys() == {"jack1", "jack2"}
+    np.testing.assert_allclose(raw["jack1"], [2, 3])
+    np.testing.assert_allclose(raw["jack2"], [2, 3])
+    # Missing derived values come from the current position
+    raw = await inst._factory.derived_to_raw_batch(height=np.array([5.0, 6.0]))
+    np.testing.assert_allclose(raw["jack1"], [5.5, 6.5])
+    np.testing.assert_allclose(raw["jack2"], [4.5, 5.5])
+
+
 async def test_setting_position_straight_through():
     inst = VerticalMirror("mirror")
     # Connect in mock mode so we can see what would have been set
@@ -2,11 +2,18 @@ import asyncio
 import re
 import time
 
+import numpy as np
 import pytest
 
 from ophyd_async.core import (
+    Array1D,
     AsyncStatus,
+    NotConnectedError,
+    ObserveOverflow,
+    ObserveQueue,
+    OnChange,
     observe_signals_value,
+    observe_signals_value_batches,
     observe_value,
     soft_signal_r_and_setter,
     soft_signal_rw,
@@ -224,3 +231,123 @@ async def test_observe_signals_value_timeout_message():
 
     # let all tasks finish correctly
     await asyncio.sleep(max(time_delay_sec1, time_delay_sec2) * 2)
+
+
+async def test_observe_value_fails_fast_on_disconnect():
+    sig, setter = soft_signal_r_and_setter(float)
+    backend = sig._connector.backend
+
+    async def tick_then_disconnect():
+        await asyncio.sleep(0.01)
+        setter(1.0)
+        await asyncio.sleep(0.01)
+        backend._notify_connection(False)
+
+    recv = []
+    start = time.monotonic()
+    status = AsyncStatus(tick_then_disconnect())
+    with pytest.raises(NotConnectedError, match="soft://"):
+        async for val in observe_value(sig, timeout=10):
+            recv.append(val)
+    assert recv == [0, 1]
+    assert time.monotonic() - start < 1
+    await status
+
+
+@pytest.mark.parametrize(
+    "on_change, updates, expected",
+    [
+        (False, [0, 1, 1, 1.2, 2], [0, 0, 1, 1, 1.2, 2]),
+        (True, [0, 1, 1, 1.2, 2], [0, 1, 1.2, 2]),
+        (OnChange(abs_change=0.5), [0.2, 0.6, 1.2, 1.4, 1.8], [0, 0.6, 1.2, 1.8]),
+        (OnChange(rel_change=0.5), [4, 6, 7, 2, 1.5], [0, 4, 7, 2]),
+        (OnChange(abs_change=0.5), [np.nan, np.nan, 0], [0, np.nan, 0]),
+    ],
+)
+async def test_observe_value_on_change(on_change, updates, expected):
+    sig, setter = soft_signal_r_and_setter(float)
+
+    async def tick():
+        for value in updates:
+            await asyncio.sleep(0.01)
+            setter(value)
+
+    recv = []
+    status = AsyncStatus(tick())
+    async for val in observe_value(sig, done_status=status, on_change=on_change):
+        recv.append(val)
+    np.testing.assert_array_equal(recv, expected)
+    await status
+
+
+async def test_subscribe_reading_on_change_arrays_and_severity():
+    sig, setter = soft_signal_r_and_setter(Array1D[np.int32])
+    all_readings, changed_readings = [], []
+    sig.subscribe_reading(all_readings.append)
+    sig.subscribe_reading(changed_readings.append, on_change=True)
+    setter(np.array([1, 2], dtype=np.int32))
+    setter(np.array([1, 2], dtype=np.int32))
+    # Changing shape is always a change, even with a deadband
+    setter(np.array([1, 2, 3], dtype=np.int32))
+    assert len(all_readings) == 4
+    assert [r[sig.name]["value"].tolist() for r in changed_readings] == [
+        [],
+        [1, 2],
+        [1, 2, 3],
+    ]
+    # Same value but a different alarm severity is delivered
+    reading = changed_readings[-1][sig.name]
+    assert not OnChange().changed(reading, reading)
+    assert OnChange(abs_change=10).changed(reading, {**reading, "alarm_severity": 2})
+    sig.clear_sub(all_readings.append)
+    sig.clear_sub(changed_readings.append)
+
+
+@pytest.mark.parametrize(
+    "overflow, expected, dropped",
+    [
+        (ObserveOverflow.DROP_OLDEST, [3, 4, 5], 2),
+        (ObserveOverflow.DROP_NEWEST, [1, 2, 3], 2),
+        (ObserveOverflow.LATEST, [5], 4),
+    ],
+)
+async def test_observe_signals_value_batches_bounded(overflow, expected, dropped):
+    sig, setter = soft_signal_r_and_setter(int)
+    queue = ObserveQueue(maxsize=3, overflow=overflow)
+    batches = observe_signals_value_batches(sig, queue=queue)
+    assert await anext(batches) == [(sig, 0)]
+    # A slow consumer falls behind
+    for i in range(1, 6):
+        setter(i)
+    assert await anext(batches) == [(sig, v) for v in expected]
+    assert queue.dropped == dropped
+    await batches.aclose()
+
+
+async def test_observe_signals_value_latest_keeps_arrival_order():
+    sig1, setter1 = soft_signal_r_and_setter(int)
+    sig2, setter2 = soft_signal_r_and_setter(int)
+    queue = ObserveQueue(overflow=ObserveOverflow.LATEST)
+    recv = []
+
+    async def tick():
+        await asyncio.sleep(0.01)
+        setter1(1)
+        setter2(2)
+        setter1(3)
+
+    status = AsyncStatus(tick())
+    async for signal, value in observe_signals_value(
+        sig1, sig2, done_status=status, queue=queue
+    ):
+        recv.append((signal, value))
+        # Don't let the consumer see the updates until they have all arrived
+        await status
+    # sig2's initial value was still pending when it was replaced
+    assert recv == [(sig1, 0), (sig2, 2), (sig1, 3)]
+    assert queue.dropped == 2
+
+
+def test_observe_queue_rejects_negative_size():
+    with pytest.raises(ValueError, match="maxsize must be >= 0"):
+        ObserveQueue(maxsize=-1)
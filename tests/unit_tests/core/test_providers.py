@@ -1,10 +1,13 @@
+import asyncio
 import itertools
 import os
 import shutil
 import sys
+import threading
 import uuid
 from datetime import date
 from pathlib import Path, PurePosixPath, PureWindowsPath
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +16,7 @@ from ophyd_async.core import (
     AutoIncrementingPathProvider,
     AutoMaxIncrementingPathProvider,
     PathInfo,
+    ReservingPathProvider,
     StaticFilenameProvider,
     StaticPathProvider,
     UUIDFilenameProvider,
@@ -249,3 +253,136 @@ def test_posix_path_produces_valid_path_info_on_windows(static_filename_provider
     info = path_provider()
     assert str(info.directory_path) == "/tmp/posix_path"
     assert info.directory_uri == "file://localhost/tmp/posix_path/"
+
+
+def test_auto_max_increment_path_provider_sees_dirs_without_stat_changes(
+    tmp_path: Path,
+):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture"), tmp_path)
+    path_provider = AutoMaxIncrementingPathProvider(base_provider)
+    (tmp_path / "0041_capture").mkdir()
+    (tmp_path / "other").mkdir()
+    assert path_provider().directory_path == tmp_path / "0042_capture"
+    # Another process swaps a directory for a numbered one, and the mtime doesn't
+    # change, like on network filesystems with coarse or cached attributes
+    stat = tmp_path.stat()
+    (tmp_path / "other").rmdir()
+    (tmp_path / "0099_capture").mkdir()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert tmp_path.stat().st_nlink == stat.st_nlink
+    assert path_provider().directory_path == tmp_path / "0100_capture"
+
+
+def test_reserving_path_provider_skips_taken_directories(tmp_path: Path):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture_"), tmp_path)
+    (tmp_path / "0002_capture").mkdir()
+    provider1 = ReservingPathProvider(base_provider, block_size=2)
+    provider2 = ReservingPathProvider(base_provider, block_size=2)
+    info = provider1()
+    assert info.directory_path == tmp_path / "0003_capture"
+    assert info.filename == "capture"
+    # Another process reserves the next ones, so the first skips over them
+    assert provider2().directory_path == tmp_path / "0006_capture"
+    assert provider1().directory_path == tmp_path / "0004_capture"
+    assert provider1().directory_path == tmp_path / "0005_capture"
+    assert provider1().directory_path == tmp_path / "0009_capture"
+    assert sorted(x.name for x in tmp_path.iterdir()) == [
+        f"{i:04}_capture" for i in range(2, 12)
+    ]
+
+
+def test_reserving_path_provider_rejects_empty_blocks(tmp_path: Path):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture"), tmp_path)
+    with pytest.raises(ValueError, match="block_size must be at least 1, got 0"):
+        ReservingPathProvider(base_provider, block_size=0)
+
+
+async def test_reserving_path_provider_reserves_in_background(tmp_path: Path):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture"), tmp_path)
+    provider = ReservingPathProvider(base_provider, block_size=4)
+    await provider.reserve()
+    threads = []
+    real_mkdir = os.mkdir
+
+    def mkdir(path):
+        threads.append(threading.current_thread())
+        real_mkdir(path)
+
+    with patch("os.mkdir", side_effect=mkdir):
+        paths = [provider().directory_path for _ in range(3)]
+        # When half were used a background reservation started
+        assert provider._reserving
+        await provider._reserving
+    assert paths == [tmp_path / f"000{i}_capture" for i in range(3)]
+    # And the filesystem was only touched in that background thread
+    assert threads and threading.current_thread() not in threads
+    # Those not used are removed on release
+    await provider.release()
+    assert sorted(x.name for x in tmp_path.iterdir()) == [
+        f"000{i}_capture" for i in range(3)
+    ]
+
+
+def test_reserving_path_provider_keeps_directory_if_reserving_fails(tmp_path: Path):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture"), tmp_path)
+    provider = ReservingPathProvider(base_provider, block_size=2)
+    real_mkdir = os.mkdir
+
+    # Reserving the first directory works, topping up fails once
+    errors: list[OSError | None] = [None, OSError("transient")]
+
+    def mkdir(path):
+        if errors and (error := errors.pop(0)):
+            raise error
+        real_mkdir(path)
+
+    with patch("os.mkdir", side_effect=mkdir):
+        with pytest.raises(OSError, match="transient"):
+            provider()
+        # The directory reserved before the failure is not thrown away
+        assert provider().directory_path == tmp_path / "0000_capture"
+        assert provider().directory_path == tmp_path / "0001_capture"
+
+
+async def test_reserving_path_provider_retries_after_background_failure(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    base_provider = StaticPathProvider(StaticFilenameProvider("capture"), tmp_path)
+    provider = ReservingPathProvider(base_provider, block_size=2)
+    await provider.reserve()
+    with patch.object(provider, "_reserve", side_effect=OSError("transient")):
+        assert provider().directory_path == tmp_path / "0000_capture"
+        assert provider._reserving
+        await asyncio.wait([provider._reserving])
+        await asyncio.sleep(0)
+    assert "Reserving directories failed, will retry" in caplog.text
+    # The next call tries again in the background
+    assert provider().directory_path == tmp_path / "0001_capture"
+    assert provider._reserving
+    await provider._reserving
+    assert provider().directory_path == tmp_path / "0002_capture"
+
+
+def test_reserving_path_provider_releases_when_base_path_changes(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    filename_provider = StaticFilenameProvider("capture")
+    base_provider = StaticPathProvider(filename_provider, tmp_path / "a")
+    provider = ReservingPathProvider(base_provider, block_size=4)
+    assert provider().directory_path == tmp_path / "a" / "0000_capture"
+    base_provider._directory_path = tmp_path / "b"
+    # Nothing reserved in the old base path is handed out
+    assert provider().directory_path == tmp_path / "b" / "0000_capture"
+    assert provider().directory_path == tmp_path / "b" / "0001_capture"
+    # And those not used are removed
+    assert [x.name for x in (tmp_path / "a").iterdir()] == ["0000_capture"]
+
+
+def test_reserving_path_provider_uses_base_directory_uri(tmp_path: Path):
+    base_provider = StaticPathProvider(
+        StaticFilenameProvider("capture"),
+        tmp_path,
+        directory_uri="http://server/data/",
+    )
+    provider = ReservingPathProvider(base_provider, block_size=2)
+    assert provider().directory_uri == "http://server/data/0000_capture/"
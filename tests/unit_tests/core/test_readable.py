@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bluesky.protocols import HasHints
@@ -289,3 +290,16 @@ async def test_duplicate_readable_raises_exception():
 
     with pytest.raises(KeyError):
         DummyDerivedDevice("test_duplicates")
+
+
+async def test_staging_many_signals_creates_one_task():
+    signals = [soft_signal_rw(float) for _ in range(500)]
+    device = StandardReadable()
+    device.add_readables(signals)
+    real_create_task = asyncio.create_task
+    with patch("asyncio.create_task", side_effect=real_create_task) as create_task:
+        await device.stage()
+        assert all(sig._cache for sig in signals)
+        await device.unstage()
+        assert not any(sig._cache for sig in signals)
+    assert create_task.call_count == 2
@@ -16,7 +16,9 @@ from event_model import DataKey
 from ophyd_async.core import (
     Array1D,
     AsyncReadable,
+    ConnectionMonitor,
     Device,
+    NotConnectedError,
     SignalR,
     SignalRW,
     SoftSignalBackend,
@@ -30,6 +32,8 @@ from ophyd_async.core import (
     set_mock_value,
     soft_signal_r_and_setter,
     soft_signal_rw,
+    wait_for_all,
+    wait_for_any,
     wait_for_value,
     walk_devices,
     walk_signal_sources,
@@ -424,6 +428,61 @@ async def test_wait_for_value_with_function():
     assert await time_taken_by(wait_for_value(signal, less_than_42, timeout=2)) < 0.1
 
 
+async def test_wait_for_all_needs_conditions_met_together():
+    writing, set_writing = soft_signal_r_and_setter(bool, name="writing")
+    frames, set_frames = soft_signal_r_and_setter(int, 3, name="frames")
+    with pytest.raises(
+        asyncio.TimeoutError,
+        match=re.escape(
+            "writing didn't match True in 0.1s, last value False; "
+            "frames didn't match 0 in 0.1s, last value 3"
+        ),
+    ):
+        await wait_for_all({writing: True, frames: 0}, timeout=0.1)
+    t = asyncio.create_task(wait_for_all({writing: True, frames: 0}, timeout=2))
+    await asyncio.sleep(0.1)
+    set_writing(True)
+    set_frames(1)
+    set_writing(False)
+    set_frames(0)
+    await asyncio.sleep(0.1)
+    # The conditions have each been met, but not at the same time
+    assert not t.done()
+    set_writing(True)
+    await t
+    # Subscriptions are cleared afterwards
+    assert writing._cache is None and frames._cache is None
+
+
+async def test_wait_for_any_returns_matching_signal():
+    done, set_done = soft_signal_r_and_setter(bool, name="done")
+    error, set_error = soft_signal_r_and_setter(str, name="error")
+    conditions = {done: True, error: lambda v: v != ""}
+    with pytest.raises(
+        asyncio.TimeoutError,
+        match="done didn't match True in 0.1s, last value False; "
+        "error didn't match <lambda> in 0.1s, last value ''",
+    ):
+        await wait_for_any(conditions, timeout=0.1)
+    t = asyncio.create_task(wait_for_any(conditions, timeout=2))
+    await asyncio.sleep(0.1)
+    set_error("Broken")
+    assert await t is error
+    with pytest.raises(ValueError, match="at least one condition"):
+        await wait_for_any({}, timeout=0.1)
+
+
+async def test_wait_for_all_raises_predicate_errors():
+    signal, _ = soft_signal_r_and_setter(float, name="signal")
+
+    def broken(v):
+        raise ZeroDivisionError()
+
+    with pytest.raises(ZeroDivisionError):
+        await wait_for_all({signal: broken}, timeout=1)
+    assert signal._cache is None
+
+
 @pytest.mark.parametrize(
     "signal_method,signal_class",
     [(soft_signal_r_and_setter, SignalR), (soft_signal_rw, SignalRW)],
@@ -1185,3 +1244,32 @@ async def test_soft_signal_r_and_setter_with_poll_period():
 async def test_soft_signal_r_and_setter_poll_period_without_getter_raises():
     with pytest.raises(ValueError, match="poll_period requires a getter"):
         soft_signal_r_and_setter(float, poll_period=0.1)
+
+
+class TwoSignalDevice(Device):
+    def __init__(self, name: str = ""):
+        self.a, self.set_a = soft_signal_r_and_setter(int)
+        self.b = soft_signal_rw(int)
+        super().__init__(name)
+
+
+async def test_connection_monitor_counts_disconnected_signals():
+    device = TwoSignalDevice("device")
+    monitor = ConnectionMonitor(device)
+    counts = []
+    monitor.subscribe(counts.append)
+    monitor.start()
+    assert device.a._cache and device.b._cache
+    device.a._connector.backend._notify_connection(False)
+    device.b._connector.backend._notify_connection(False)
+    assert monitor.disconnected == {"a", "b"}
+    # Cached reads fail fast while disconnected
+    with pytest.raises(NotConnectedError, match="is disconnected"):
+        await device.a.get_value()
+    device.a._connector.backend._notify_connection(True)
+    device.set_a(3)
+    assert await device.a.get_value() == 3
+    assert monitor.disconnected_count == 1
+    assert counts == [0, 1, 2, 1]
+    monitor.stop()
+    assert not device.a._cache and not device.b._cache
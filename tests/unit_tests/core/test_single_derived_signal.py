@@ -100,18 +100,16 @@ async def test_monitoring_position(cls: type[ReadOnlyBeamstop | MovableBeamstop]
         "value"
     ] == BeamstopPosition.OUT_OF_POSITION
     assert results.empty()
+    # Derived value hasn't changed, so no update
     await inst.y.set(5)
-    assert (await results.get())["inst-position"][
-        "value"
-    ] == BeamstopPosition.OUT_OF_POSITION
+    await asyncio.sleep(0)
     assert results.empty()
+    # Raw values that change in the same tick give a single update
     await asyncio.gather(inst.x.set(0), inst.y.set(0))
-    assert (await results.get())["inst-position"][
-        "value"
-    ] == BeamstopPosition.OUT_OF_POSITION
     assert (await results.get())["inst-position"][
         "value"
     ] == BeamstopPosition.IN_POSITION
+    await asyncio.sleep(0)
     assert results.empty()
 
 
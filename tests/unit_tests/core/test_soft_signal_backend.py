@@ -1,8 +1,11 @@
 import asyncio
 import os
+import threading
+import time
 import typing
 from collections.abc import Callable, Sequence
 from typing import Any, TypeVar
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -329,19 +332,108 @@ async def test_soft_signal_backend_poll_period_updates_via_callback():
     backend.set_callback(None)
 
 
-async def test_soft_signal_backend_poll_task_starts_and_stops():
-    backend = SoftSignalBackend(float, getter=lambda: 0.0, poll_period=0.05)
+async def test_soft_signal_backend_polling_starts_and_stops():
+    polled = asyncio.Event()
+
+    def getter():
+        polled.set()
+        return 0.0
+
+    backend = SoftSignalBackend(float, getter=getter, poll_period=0.01)
     await backend.connect(timeout=1)
 
     updates: asyncio.Queue[Reading] = asyncio.Queue()
-    assert backend._poll_task is None
+    assert backend.poll_statistics is None
+    tasks_before = asyncio.all_tasks()
 
     backend.set_callback(updates.put_nowait)
-    assert backend._poll_task is not None
-    assert not backend._poll_task.cancelled()
+    assert backend.poll_statistics is not None
+    await asyncio.wait_for(polled.wait(), timeout=1)
 
     backend.set_callback(None)
-    assert backend._poll_task is None
+    assert backend.poll_statistics is None
+    # Polling has stopped straight away, without leaving a task to finish
+    assert asyncio.all_tasks() == tasks_before
+    polled.clear()
+    await asyncio.sleep(0.05)
+    assert not polled.is_set()
+
+
+async def test_soft_signal_backends_with_same_period_share_a_timer():
+    calls = []
+    polled_twice = asyncio.Event()
+
+    def getter():
+        calls.append(time.monotonic())
+        if len(calls) == 2:
+            polled_twice.set()
+        return len(calls)
+
+    loop = asyncio.get_running_loop()
+    backends = [
+        SoftSignalBackend(float, getter=getter, poll_period=0.05) for _ in range(10)
+    ]
+    other = SoftSignalBackend(float, getter=lambda: 1.0, poll_period=0.05)
+    updates: list[list[float]] = [[] for _ in backends]
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        for backend, backend_updates in zip(backends, updates, strict=True):
+            backend.set_callback(lambda r, u=backend_updates: u.append(r["value"]))
+        other.set_callback(lambda r: None)
+        assert call_at.call_count == 1
+    await asyncio.wait_for(polled_twice.wait(), timeout=1)
+    for backend in backends + [other]:
+        backend.set_callback(None)
+    # The shared getter was called once per poll for all the backends
+    assert len(calls) == 2
+    assert all(u[1:] == [1, 2] for u in updates)
+    assert backends[0].poll_statistics is None
+
+
+async def test_soft_signal_backend_reports_poll_failures(
+    caplog: pytest.LogCaptureFixture,
+):
+    values = iter([1.0, ValueError("bad"), ValueError("still bad"), 2.0])
+    done = asyncio.Event()
+
+    def getter():
+        value = next(values)
+        if value == 2.0:
+            done.set()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    backend = SoftSignalBackend(float, getter=getter, poll_period=0.01)
+    updates = []
+    backend.set_callback(lambda r: updates.append(r["value"]))
+    statistics = backend.poll_statistics
+    assert statistics
+    # The getter is synchronous, so the whole poll has finished when we wake
+    await asyncio.wait_for(done.wait(), timeout=1)
+    backend.set_callback(None)
+    assert updates == [0.0, 1.0, 2.0]
+    assert statistics.calls == 4
+    assert statistics.failures == 2
+    assert statistics.consecutive_failures == 0
+    assert repr(statistics.last_exception) == "ValueError('still bad')"
+    assert statistics.max_latency >= statistics.last_latency > 0
+    # Only the first of a run of failures is logged
+    assert [r.message for r in caplog.records if r.levelname == "WARNING"] == [
+        f"Polling {getter} failed: ValueError('bad')"
+    ]
+
+
+async def test_soft_signal_backend_blocking_getter_runs_in_executor():
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def getter():
+        threads.append(threading.get_ident())
+        return 3.0
+
+    backend = SoftSignalBackend(float, getter=getter, blocking_getter=True)
+    assert await backend.get_value() == 3.0
+    assert threads and loop_thread not in threads
 
 
 async def test_soft_signal_backend_no_poll_without_poll_period():
@@ -351,5 +443,5 @@ async def test_soft_signal_backend_no_poll_without_poll_period():
 
     updates: asyncio.Queue[Reading] = asyncio.Queue()
     backend.set_callback(updates.put_nowait)
-    assert backend._poll_task is None
+    assert backend.poll_statistics is None
     backend.set_callback(None)
@@ -846,6 +846,7 @@ async def test_different_collections_written_raises(tmp_path):
     det = StandardDetector(name="det")
     dl1 = StreamableOnlyDataLogic(tmp_path)
     dl2 = StreamableOnlyDataLogic(tmp_path)
+    dl2.datakey_suffix = "-2"
     det.add_detector_logics(JustInternalTriggerLogic(), dl1, dl2)
 
     await det.prepare(TriggerInfo(number_of_events=5))
@@ -864,6 +865,23 @@ async def test_different_collections_written_raises(tmp_path):
         await det.kickoff()
 
 
+async def test_duplicate_datakeys_raises(tmp_path):
+    """Test that data logics streaming the same data key raises error."""
+    det = StandardDetector(name="det")
+    det.add_detector_logics(
+        JustInternalTriggerLogic(),
+        StreamableOnlyDataLogic(tmp_path),
+        StreamableOnlyDataLogic(tmp_path),
+    )
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Data keys ['det'] are streamed by more than one data logic of det"
+        ),
+    ):
+        await det.prepare(TriggerInfo(number_of_events=5))
+
+
 async def test_multiple_data_logics(tmp_path):
     """Test detector with multiple data logics."""
     det = StandardDetector(name="det")
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import gc
 import re
 import time
 import traceback
@@ -351,6 +352,33 @@ async def test_completed_status():
     await completed_status()
 
 
+async def test_completed_status_is_done_without_a_task():
+    tasks_before = asyncio.all_tasks()
+    status = completed_status(name="dev")
+    assert status.done and status.success
+    assert asyncio.all_tasks() == tasks_before
+    callback = Mock()
+    status.add_callback(callback)
+    callback.assert_called_once_with(status)
+    assert repr(status) == "<AsyncStatus, device: dev, task: None, done>"
+    failed = completed_status(ValueError("Bad"))
+    assert isinstance(failed.exception(), ValueError)
+    assert not failed.success
+
+
+async def test_completed_status_exception_not_logged_if_never_retrieved():
+    loop = asyncio.get_running_loop()
+    handler = Mock()
+    loop.set_exception_handler(handler)
+    try:
+        completed_status(ValueError("Bad"))
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+    handler.assert_not_called()
+
+
 async def test_device_name_in_failure_message_asyncstatus_wrap(RE):
     device_name = "MyFailingMovable"
     d = FailingMovable(name=device_name)
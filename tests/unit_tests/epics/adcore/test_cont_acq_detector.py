@@ -93,3 +93,89 @@ async def test_cont_acq_controller_success(
             call.cb.capture.put(True),
         ],
     )
+
+
+async def test_cont_acq_streams_trigger_windows():
+    async with init_devices(mock=True):
+        det = adcore.ContAcqDetector(prefix="PREFIX:", trigger_window=(2, 3))
+    set_mock_value(det.driver.image_mode, adcore.ADImageMode.CONTINUOUS)
+    set_mock_value(det.driver.acquire, True)
+    await det.stage()
+    await det.prepare(
+        TriggerInfo(
+            trigger=DetectorTrigger.EXTERNAL_EDGE,
+            number_of_events=4,
+            collections_per_event=5,
+        )
+    )
+    assert_has_calls(
+        det,
+        [
+            call.cb.capture.put(False),
+            call.cb.enable_callbacks.put(EnableDisable.ENABLE),
+            call.cb.pre_count.put(2),
+            call.cb.post_count.put(3),
+            call.cb.preset_trigger_count.put(4),
+            call.cb.flush_on_soft_trg.put(adcore.NDCBFlushOnSoftTrgMode.IMMEDIATELY),
+            # Capture starts at prepare so triggers can arrive at any time
+            call.cb.capture.put(True),
+        ],
+    )
+    with pytest.raises(ValueError, match="Set collections_per_event=5"):
+        await det.prepare(TriggerInfo(trigger=DetectorTrigger.EXTERNAL_EDGE))
+
+
+async def test_cont_acq_streams_until_stopped():
+    async with init_devices(mock=True):
+        det = adcore.ContAcqDetector(prefix="PREFIX:", trigger_window=(0, 10))
+    set_mock_value(det.driver.image_mode, adcore.ADImageMode.CONTINUOUS)
+    set_mock_value(det.driver.acquire, True)
+    await det.prepare(
+        TriggerInfo(
+            trigger=DetectorTrigger.EXTERNAL_EDGE,
+            number_of_events=0,
+            collections_per_event=10,
+        )
+    )
+    assert (
+        await det.get_plugin(
+            "cb", adcore.NDCircularBuffIO
+        ).preset_trigger_count.get_value()
+        == 0
+    )
+
+
+async def test_cont_acq_stream_default_trigger_info_is_a_window():
+    async with init_devices(mock=True):
+        det = adcore.ContAcqDetector(prefix="PREFIX:", trigger_window=(2, 3))
+    set_mock_value(det.driver.image_mode, adcore.ADImageMode.CONTINUOUS)
+    set_mock_value(det.driver.acquire, True)
+    trigger_logic = det._trigger_logic
+    assert trigger_logic
+    trigger_info = await trigger_logic.default_trigger_info()
+    assert trigger_info == TriggerInfo(
+        trigger=DetectorTrigger.EXTERNAL_EDGE, collections_per_event=5
+    )
+    # The default must be a valid window so trigger() can use it without prepare
+    await det.prepare(trigger_info)
+    cb = det.get_plugin("cb", adcore.NDCircularBuffIO)
+    assert await cb.pre_count.get_value() == 2
+    assert await cb.post_count.get_value() == 3
+
+
+async def test_cont_acq_stream_does_not_support_internal_triggers():
+    async with init_devices(mock=True):
+        det = adcore.ContAcqDetector(prefix="PREFIX:", trigger_window=(2, 3))
+    with pytest.raises(ValueError, match="INTERNAL not supported"):
+        await det.prepare(TriggerInfo(collections_per_event=5))
+
+
+@pytest.mark.parametrize(
+    "trigger_window,message",
+    [((-1, 2), "must not be negative"), ((0, 0), "At least one frame")],
+)
+def test_cont_acq_trigger_window_must_keep_frames(
+    trigger_window: tuple[int, int], message: str
+):
+    with pytest.raises(ValueError, match=message):
+        adcore.ContAcqDetector(prefix="PREFIX:", trigger_window=trigger_window)
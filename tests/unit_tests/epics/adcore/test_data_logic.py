@@ -1,11 +1,13 @@
 import os
+import re
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
-from unittest.mock import ANY, call
+from unittest.mock import ANY, call, patch
 
 import pytest
 
 from ophyd_async.core import (
     AutoIncrementingPathProvider,
+    ChunkPolicy,
     EnableDisable,
     StaticFilenameProvider,
     StaticPathProvider,
@@ -275,3 +277,343 @@ async def test_3d_dataset_shape(hdf_det: adcore.AreaDetector[adcore.ADBaseIO]):
             "source": ANY,
         },
     }
+
+
+async def test_hdf_resources_cached_until_signals_change(
+    hdf_det: adcore.AreaDetector[adcore.ADBaseIO],
+):
+    writer = hdf_det.get_plugin("hdf", adcore.NDPluginFileIO)
+    stats = hdf_det.get_plugin("stats")
+    set_mock_value(writer.file_path_exists, True)
+    set_mock_value(
+        stats.nd_attributes_file,
+        adcore.ndattributes_to_xml(
+            [
+                adcore.NDAttributeParam(
+                    name="mydetector-sum",
+                    param="TOTAL",
+                    datatype=adcore.NDAttributeDataType.DOUBLE,
+                )
+            ]
+        ),
+    )
+
+    async def prepare_and_describe():
+        await hdf_det.stage()
+        await hdf_det.prepare(TriggerInfo())
+        return await hdf_det.describe()
+
+    logic_cls = adcore.ADHDFDataLogic
+    with patch.object(
+        logic_cls, "_get_resources", autospec=True, side_effect=logic_cls._get_resources
+    ) as mock_get_resources:
+        first = await prepare_and_describe()
+        assert first["detector"]["shape"] == [1, 768, 1024]
+        assert "mydetector-sum" in first
+        assert mock_get_resources.call_count == 1
+        assert await prepare_and_describe() == first
+        assert mock_get_resources.call_count == 1
+        # Changing a monitored signal means they are worked out again
+        set_mock_value(hdf_det.driver.array_size_x, 512)
+        changed = await prepare_and_describe()
+        assert changed["detector"]["shape"] == [1, 768, 512]
+        assert mock_get_resources.call_count == 2
+
+
+async def test_hdf_resources_monitored_across_stages(
+    hdf_det: adcore.AreaDetector[adcore.ADBaseIO],
+):
+    writer = hdf_det.get_plugin("hdf", adcore.NDPluginFileIO)
+    set_mock_value(writer.file_path_exists, True)
+    size_x = hdf_det.driver.array_size_x
+    logic_cls = adcore.ADHDFDataLogic
+    with patch.object(
+        logic_cls, "_get_resources", autospec=True, side_effect=logic_cls._get_resources
+    ) as mock_get_resources:
+        await hdf_det.stage()
+        await hdf_det.prepare(TriggerInfo())
+        await hdf_det.unstage()
+        # The signals stay monitored, so later prepares don't need to get them
+        monitor = size_x._cache
+        assert monitor
+        with patch.object(
+            size_x._connector.backend, "get_value", side_effect=AssertionError
+        ):
+            await hdf_det.stage()
+            await hdf_det.prepare(TriggerInfo())
+        assert size_x._cache is monitor
+        assert mock_get_resources.call_count == 1
+        # But changes made while unstaged are still seen
+        await hdf_det.unstage()
+        set_mock_value(size_x, 512)
+        await hdf_det.stage()
+        await hdf_det.prepare(TriggerInfo())
+        describe = await hdf_det.describe()
+        assert describe["detector"]["shape"] == [1, 768, 512]
+        assert mock_get_resources.call_count == 2
+
+
+async def test_hdf_resources_dropped_on_disconnect(
+    hdf_det: adcore.AreaDetector[adcore.ADBaseIO],
+):
+    writer = hdf_det.get_plugin("hdf", adcore.NDPluginFileIO)
+    set_mock_value(writer.file_path_exists, True)
+    size_x = hdf_det.driver.array_size_x
+    logic_cls = adcore.ADHDFDataLogic
+    with patch.object(
+        logic_cls, "_get_resources", autospec=True, side_effect=logic_cls._get_resources
+    ) as mock_get_resources:
+        await hdf_det.stage()
+        await hdf_det.prepare(TriggerInfo())
+        await hdf_det.unstage()
+        monitor = size_x._cache
+        assert monitor
+        monitor._connection_callback(False)
+        monitor._connection_callback(True)
+        set_mock_value(size_x, 1024)
+        await hdf_det.stage()
+        await hdf_det.prepare(TriggerInfo())
+        assert mock_get_resources.call_count == 2
+
+
+async def test_multi_hdf_writes_interleaved_vds(
+    tmp_path: Path, static_path_provider: StaticPathProvider
+):
+    async with init_devices(mock=True):
+        det = adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.multi_hdf(static_path_provider, 2),
+            name="detector",
+        )
+    set_mock_value(det.driver.array_size_x, 3)
+    set_mock_value(det.driver.array_size_y, 2)
+    set_mock_value(det.driver.data_type, adcore.ADBaseDataType.UINT16)
+    hdf = dict(det.children())["hdf"]
+    assert isinstance(hdf, adcore.ADMultiHDFWriters)
+    set_mock_value(hdf.scatter.port_name, "SCATTER1")
+    for writer in hdf.writers.values():
+        set_mock_value(writer.file_path_exists, True)
+    await det.prepare(TriggerInfo(number_of_events=4))
+    # Each writer gets its frames from the scatter plugin into its own file
+    assert [
+        (await writer.nd_array_port.get_value(), await writer.file_name.get_value())
+        for writer in hdf.writers.values()
+    ] == [
+        ("SCATTER1", "ophyd_async_tests_000001"),
+        ("SCATTER1", "ophyd_async_tests_000002"),
+    ]
+    assert (tmp_path / "ophyd_async_tests.h5").exists()
+    assert (await det.describe())["detector"]["shape"] == [1, 2, 3]
+    # Frames are only collectable when all the frames before them are written
+    set_mock_value(hdf.writers[1].num_captured, 2)
+    assert await det.get_index() == 1
+    set_mock_value(hdf.writers[2].num_captured, 1)
+    assert await det.get_index() == 3
+
+
+async def test_multi_hdf_writers_must_have_the_same_chunking(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.multi_hdf(static_path_provider, 2),
+            name="detector",
+        )
+    hdf = dict(det.children())["hdf"]
+    assert isinstance(hdf, adcore.ADMultiHDFWriters)
+    for writer in hdf.writers.values():
+        set_mock_value(writer.file_path_exists, True)
+    set_mock_value(hdf.writers[1].num_frames_chunks, 1)
+    set_mock_value(hdf.writers[2].num_frames_chunks, 4)
+    with pytest.raises(ValueError, match=r"different frames per chunk \[1, 4\]"):
+        await det.prepare(TriggerInfo(number_of_events=4))
+    # Nothing is captured when the writers don't match
+    assert not await hdf.writers[1].capture.get_value()
+
+
+async def test_multi_hdf_raises_if_scatter_skipped_a_writer(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.multi_hdf(static_path_provider, 3),
+            name="detector",
+        )
+    hdf = dict(det.children())["hdf"]
+    assert isinstance(hdf, adcore.ADMultiHDFWriters)
+    for writer in hdf.writers.values():
+        set_mock_value(writer.file_path_exists, True)
+
+    async def capture_and_stop(*num_captured: int):
+        await det.stage()
+        await det.prepare(TriggerInfo(number_of_events=sum(num_captured)))
+        for writer, num in zip(hdf.writers.values(), num_captured, strict=True):
+            set_mock_value(writer.num_captured, num)
+        await det.unstage()
+
+    # Frames sent to each writer in turn is fine
+    await capture_and_stop(3, 2, 2)
+    # But not if the second writer was skipped for a frame
+    with pytest.raises(
+        RuntimeError,
+        match=re.escape(
+            "captured [3, 1, 3] frames rather than [3, 2, 2], so the scatter plugin "
+            "must have skipped a writer"
+        ),
+    ):
+        await capture_and_stop(3, 1, 3)
+    # And it is only checked once per capture
+    await det.unstage()
+
+
+async def test_ndattribute_hdf_only_writes_ndattributes(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.ndattribute_hdf(static_path_provider),
+            plugins={"stats": adcore.NDStatsIO("PREFIX:STATS:")},
+            name="detector",
+        )
+    writer = det.get_plugin("ndattribute_hdf", adcore.NDFileHDF5IO)
+    set_mock_value(writer.file_path_exists, True)
+    with pytest.raises(ValueError, match="No NDAttributes are configured"):
+        await det.prepare(TriggerInfo(number_of_events=3))
+    set_mock_value(
+        det.get_plugin("stats").nd_attributes_file,
+        adcore.ndattributes_to_xml(
+            [
+                adcore.NDAttributeParam(
+                    name="detector-total",
+                    param="TOTAL",
+                    datatype=adcore.NDAttributeDataType.DOUBLE,
+                )
+            ]
+        ),
+    )
+    await det.prepare(TriggerInfo(number_of_events=3))
+    # The layout only has the NDAttributes group, not the frame data
+    layout = await writer.xml_file_name.get_value()
+    assert 'ndattr_default="true"' in layout
+    assert "detector" not in layout
+    assert await writer.capture.get_value()
+    assert await det.describe() == {
+        "detector-total": {
+            "dtype": "number",
+            "dtype_numpy": "<f8",
+            "external": "STREAM:",
+            "shape": [1],
+            "source": ANY,
+        }
+    }
+    assert det.hints == {"fields": ["detector-total"]}
+
+
+def _hdf_and_ndattribute_hdf_det(
+    path_provider: StaticPathProvider, plugin_names: list[str] | None
+) -> adsimdetector.SimDetector:
+    return adsimdetector.SimDetector(
+        "PREFIX:",
+        adcore.ADWriterFactory.hdf(path_provider),
+        adcore.ADWriterFactory.ndattribute_hdf(
+            path_provider, plugin_names=plugin_names
+        ),
+        plugins={
+            "stats": adcore.NDStatsIO("PREFIX:STATS:"),
+            "roi": adcore.NDROIIO("PREFIX:ROI:"),
+        },
+        name="detector",
+    )
+
+
+async def _setup_hdf_and_ndattribute_hdf_det(det: adsimdetector.SimDetector):
+    for name in ("hdf", "ndattribute_hdf"):
+        set_mock_value(det.get_plugin(name, adcore.NDFileHDF5IO).file_path_exists, True)
+    for name in ("stats", "roi"):
+        set_mock_value(
+            det.get_plugin(name).nd_attributes_file,
+            adcore.ndattributes_to_xml(
+                [
+                    adcore.NDAttributeParam(
+                        name=f"detector-{name}-total",
+                        param="TOTAL",
+                        datatype=adcore.NDAttributeDataType.DOUBLE,
+                    )
+                ]
+            ),
+        )
+
+
+async def test_ndattribute_hdf_plugins_left_out_of_hdf(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = _hdf_and_ndattribute_hdf_det(static_path_provider, ["stats"])
+    await _setup_hdf_and_ndattribute_hdf_det(det)
+    await det.prepare(TriggerInfo())
+    # Only the writer that claimed the stats plugin writes its NDAttributes
+    assert list(await det.describe()) == [
+        "detector",
+        "detector-roi-total",
+        "detector-stats-total",
+    ]
+    hdf_logic, ndattribute_logic = det._data_logics
+    assert isinstance(hdf_logic, adcore.ADHDFDataLogic)
+    assert isinstance(ndattribute_logic, adcore.ADNDAttributeHDFDataLogic)
+    assert hdf_logic.plugins == [det.get_plugin("roi")]
+    assert ndattribute_logic.plugins == [det.get_plugin("stats")]
+
+
+async def test_ndattributes_written_by_two_hdf_writers_raises(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = _hdf_and_ndattribute_hdf_det(static_path_provider, None)
+    await _setup_hdf_and_ndattribute_hdf_det(det)
+    with pytest.raises(
+        ValueError,
+        match=r"Data keys \['detector-roi-total', 'detector-stats-total'\] are "
+        "streamed by more than one data logic of detector",
+    ):
+        await det.prepare(TriggerInfo())
+
+
+def test_ndattribute_hdf_plugin_names_must_be_plugins(
+    static_path_provider: StaticPathProvider,
+):
+    with pytest.raises(ValueError, match=r"plugin_names \['stats'\] are not in"):
+        adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.ndattribute_hdf(
+                static_path_provider, plugin_names=["stats"]
+            ),
+        )
+
+
+async def test_hdf_chunk_policy_sets_chunking_and_compression(
+    static_path_provider: StaticPathProvider,
+):
+    async with init_devices(mock=True):
+        det = adsimdetector.SimDetector(
+            "PREFIX:",
+            adcore.ADWriterFactory.hdf(
+                static_path_provider,
+                chunk_policy=ChunkPolicy(compression="BSLZ4"),
+            ),
+        )
+    set_mock_value(det.driver.array_size_x, 256)
+    set_mock_value(det.driver.array_size_y, 256)
+    set_mock_value(det.driver.data_type, adcore.ADBaseDataType.UINT16)
+    # 4 frames per second, so 4 frames fill a chunk in a second
+    set_mock_value(det.driver.acquire_period, 0.25)
+    writer = det.get_plugin("hdf", adcore.NDFileHDF5IO)
+    set_mock_value(writer.file_path_exists, True)
+    await det.prepare(TriggerInfo())
+    assert await writer.num_frames_chunks.get_value() == 4
+    assert await writer.compression.get_value() == adcore.ADCompression.BSLZ4
+    docs = [doc async for doc in det.collect_asset_docs(1)]
+    assert docs[0][0] == "stream_resource"
+    assert docs[0][1]["parameters"]["chunk_shape"] == (4, 256, 256)
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from ophyd_async.core import soft_signal_rw
+from ophyd_async.epics.adcore import (
+    create_interleaved_vds,
+    interleaved_frames_written,
+    interleaved_frames_written_signal,
+)
+
+
+@pytest.mark.parametrize(
+    "frames_written,frames_per_block,expected",
+    [
+        ([0, 0, 0], 1, 0),
+        ([1, 0, 0], 1, 1),
+        ([2, 2, 1], 1, 5),
+        ([3, 3, 3], 1, 9),
+        ([2, 3, 3], 1, 6),
+        ([4], 1, 4),
+        ([2, 0], 2, 2),
+        ([3, 2], 2, 5),
+        ([4, 1], 2, 3),
+    ],
+)
+def test_interleaved_frames_written(
+    frames_written: list[int], frames_per_block: int, expected: int
+):
+    assert interleaved_frames_written(frames_written, frames_per_block) == expected
+
+
+async def test_interleaved_frames_written_signal():
+    writers = [soft_signal_rw(int, name=f"writer{i}") for i in range(2)]
+    signal = interleaved_frames_written_signal(writers)
+    await signal.connect()
+    assert await signal.get_value() == 0
+    await writers[0].set(3)
+    assert await signal.get_value() == 1
+    await writers[1].set(2)
+    assert await signal.get_value() == 5
+
+
+def test_interleaved_frames_written_signal_needs_writers():
+    with pytest.raises(ValueError, match="At least one"):
+        interleaved_frames_written_signal([])
+
+
+@pytest.mark.parametrize("frames_per_block", [1, 2])
+def test_create_interleaved_vds(tmp_path: Path, frames_per_block: int):
+    create_interleaved_vds(
+        tmp_path / "vds.h5",
+        ["writer1.h5", "writer2.h5"],
+        {"/entry/data/data": ("<u2", (2, 3))},
+        frames_per_block=frames_per_block,
+    )
+    frames = np.arange(8 * 6, dtype="<u2").reshape(8, 2, 3)
+    # Write the blocks of frames that each writer would have received
+    blocks = frames.reshape(-1, frames_per_block, 2, 3)
+    for i in range(2):
+        with h5py.File(tmp_path / f"writer{i + 1}.h5", "w") as file:
+            file["/entry/data/data"] = blocks[i::2].reshape(-1, 2, 3)
+    with h5py.File(tmp_path / "vds.h5", "r") as file:
+        dataset = file["/entry/data/data"]
+        assert isinstance(dataset, h5py.Dataset)
+        assert dataset.is_virtual
+        assert dataset.shape == (8, 2, 3)
+        np.testing.assert_array_equal(dataset[()], frames)
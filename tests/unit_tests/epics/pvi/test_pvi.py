@@ -1,5 +1,9 @@
+import asyncio
+import copy
+from contextlib import contextmanager
 from typing import Annotated as A
 from typing import TypeVar
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bluesky.protocols import HasHints, Hints
@@ -239,3 +243,140 @@ async def test_pvi_x_entry_creates_triggerable_command():
     await device.connect(mock=True)
     # In mock mode the backend is a MockCommandBackend, not PvaCommandBackend
     assert isinstance(device.do_thing, TriggerableCommand)
+
+
+class FakePviServer:
+    """Serves PVI structures from a dict, counting the fetches in flight."""
+
+    def __init__(self, structures: dict[str, dict]):
+        self.structures = structures
+        self.fetched: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def pvget(self, pv: str, timeout: float):
+        self.fetched.append(pv)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Let other fetches start before this one finishes
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        value = MagicMock()
+        value.todict.return_value = copy.deepcopy(self.structures[pv])
+        return {"value": value}
+
+    @contextmanager
+    def serve(self):
+        with patch(
+            "ophyd_async.epics.core._pvi_connector.pvget", side_effect=self.pvget
+        ):
+            yield self
+
+
+@pytest.fixture
+def pvi_server() -> FakePviServer:
+    return FakePviServer(
+        {
+            "TOP:PVI": {
+                "typed": {"d": "TYPED:PVI"},
+                "extra": {"d": "EXTRA:PVI"},
+                "vector": [None, {"d": "VECTOR1:PVI"}, {"d": "VECTOR2:PVI"}],
+            },
+            "TYPED:PVI": {"inner": {"d": "INNER:PVI"}},
+            "EXTRA:PVI": {"deep": {"d": "DEEP:PVI"}},
+            "VECTOR1:PVI": {},
+            "VECTOR2:PVI": {},
+            "INNER:PVI": {},
+            "DEEP:PVI": {},
+        }
+    )
+
+
+class Typed(Device):
+    pass
+
+
+class Top(Device):
+    typed: Typed
+
+
+async def test_pvi_tree_depth_limited_discovery(pvi_server: FakePviServer):
+    with pvi_server.serve():
+        tree = await PviTree.build_device_tree("TOP:PVI", timeout=1, max_depth=1)
+    # Only the top level and the one below it are fetched
+    assert sorted(pvi_server.fetched) == [
+        "EXTRA:PVI",
+        "TOP:PVI",
+        "TYPED:PVI",
+        "VECTOR1:PVI",
+        "VECTOR2:PVI",
+    ]
+    assert tree.sub_devices["typed"].expanded
+    inner = tree.sub_devices["typed"].sub_devices["inner"]
+    assert inner == PviTree(pvi_pv="INNER:PVI", expanded=False)
+    # Expanding fetches the next level down, and leaves those below as placeholders
+    pvi_server.fetched.clear()
+    with pvi_server.serve():
+        extra = await tree.sub_devices["extra"].expand_children(timeout=1)
+    assert pvi_server.fetched == ["DEEP:PVI"]
+    assert extra.sub_devices["deep"] == PviTree(pvi_pv="DEEP:PVI")
+    # Trees that are already expanded are not fetched again
+    pvi_server.fetched.clear()
+    with pvi_server.serve():
+        assert await extra.expand_children(timeout=1) == extra
+    assert pvi_server.fetched == []
+
+
+async def test_pvi_tree_discovered_in_full_without_max_depth(
+    pvi_server: FakePviServer,
+):
+    with pvi_server.serve():
+        tree = await PviTree.build_device_tree("TOP:PVI", timeout=1)
+    assert sorted(pvi_server.fetched) == sorted(pvi_server.structures)
+    assert tree.sub_devices["extra"].sub_devices["deep"].expanded
+
+
+async def test_lazy_pvi_connector_defers_untyped_children(pvi_server: FakePviServer):
+    device = Top(connector=PviDeviceConnector("TOP:", lazy=True), name="top")
+    with pvi_server.serve():
+        await device.connect()
+    # The typed child is connected, so it fetches its own children, but the
+    # untyped ones are only created
+    assert sorted(pvi_server.fetched) == [
+        "EXTRA:PVI",
+        "INNER:PVI",
+        "TOP:PVI",
+        "TYPED:PVI",
+        "VECTOR1:PVI",
+        "VECTOR2:PVI",
+    ]
+    connector = device._connector
+    assert isinstance(connector, PviDeviceConnector)
+    assert connector.deferred_children == {"extra", "vector"}
+    extra = dict(device.children())["extra"]
+    assert extra.name == "top-extra"
+    # Connecting a deferred child later expands its tree
+    pvi_server.fetched.clear()
+    with pvi_server.serve():
+        await extra.connect()
+    assert pvi_server.fetched == ["DEEP:PVI"]
+    assert [name for name, _ in extra.children()] == ["deep"]
+
+
+@pytest.mark.parametrize("max_concurrent_fetches, max_in_flight", [(None, 4), (2, 2)])
+async def test_pvi_connector_limits_concurrent_fetches(
+    pvi_server: FakePviServer, max_concurrent_fetches: int | None, max_in_flight: int
+):
+    device = Top(
+        connector=PviDeviceConnector(
+            "TOP:", max_concurrent_fetches=max_concurrent_fetches
+        ),
+        name="top",
+    )
+    with pvi_server.serve():
+        await device.connect()
+    assert sorted(pvi_server.fetched) == sorted(pvi_server.structures)
+    # TYPED, EXTRA, VECTOR1 and VECTOR2 are all fetched together if not limited
+    assert pvi_server.max_in_flight == max_in_flight
@@ -1,16 +1,19 @@
 import asyncio
 from pathlib import Path
-from unittest.mock import call
+from unittest.mock import call, patch
 
+import h5py
 import pytest
 from bluesky import RunEngine
 
 from ophyd_async.core import (
+    ChunkPolicy,
     StandardDetector,
     StaticFilenameProvider,
     StaticPathProvider,
     TriggerInfo,
     callback_on_mock_execute,
+    callback_on_mock_put,
     init_devices,
     set_mock_value,
     soft_signal_rw,
@@ -27,9 +30,11 @@ class OdinDet(StandardDetector):
         path_provider = StaticPathProvider(StaticFilenameProvider("filename"), tmp_path)
         self.odin = OdinIO(connector=fastcs_connector("PREFIX:"))
         self.bit_depth = soft_signal_rw(int, BIT_DEPTH)
-        self.add_detector_logics(
-            OdinDataLogic(path_provider, self.odin, self.bit_depth)
+        self.frame_period = soft_signal_rw(float, 0.0)
+        self.data_logic = OdinDataLogic(
+            path_provider, self.odin, self.bit_depth, frame_period=self.frame_period
         )
+        self.add_detector_logics(self.data_logic)
         super().__init__(name, connector)
 
 
@@ -111,3 +116,112 @@ async def test_hinted_fields(odin_det: OdinDet):
     set_mock_value(odin_det.odin.writing, True)
     await odin_det.prepare(TriggerInfo())
     assert odin_det.hints == {"fields": ["det"]}
+
+
+async def test_chunk_policy_sets_chunking_and_compression(odin_det: OdinDet):
+    odin = odin_det.odin
+    odin_det.data_logic.chunk_policy = ChunkPolicy(
+        target_chunk_bytes=4 * 768 * 1024 * 2, compression="blosc"
+    )
+    set_mock_value(odin.writing, True)
+    set_mock_value(odin.fp.data_dims_0, 768)
+    set_mock_value(odin.fp.data_dims_1, 1024)
+    await odin_det.prepare(TriggerInfo())
+    assert await odin.fp.data_compression.get_value() == "blosc"
+    assert [
+        await odin.fp.data_chunks_0.get_value(),
+        await odin.fp.data_chunks_1.get_value(),
+        await odin.fp.data_chunks_2.get_value(),
+    ] == [4, 768, 1024]
+
+
+async def test_chunk_policy_limits_chunk_fill_time(odin_det: OdinDet):
+    odin = odin_det.odin
+    # Big enough chunks for 16 frames, but they must fill in half a second
+    odin_det.data_logic.chunk_policy = ChunkPolicy(
+        target_chunk_bytes=16 * 768 * 1024 * 2, max_fill_time=0.5
+    )
+    await odin_det.frame_period.set(0.1)
+    set_mock_value(odin.writing, True)
+    set_mock_value(odin.fp.data_dims_0, 768)
+    set_mock_value(odin.fp.data_dims_1, 1024)
+    await odin_det.prepare(TriggerInfo())
+    assert await odin.fp.data_chunks_0.get_value() == 5
+
+
+async def test_frame_processes_interleaved_in_vds(odin_det: OdinDet, tmp_path: Path):
+    odin = odin_det.odin
+    odin_det.data_logic.create_vds = True
+    set_mock_value(odin.writing, True)
+    set_mock_value(odin.fp.data_dims_0, 2)
+    set_mock_value(odin.fp.data_dims_1, 3)
+    set_mock_value(odin.fp.process_frames_per_block, 2)
+    await odin_det.prepare(TriggerInfo(number_of_events=8))
+    with h5py.File(tmp_path / "filename.h5_vds.h5") as file:
+        dataset = file["/data"]
+        assert isinstance(dataset, h5py.Dataset)
+        assert [source.file_name for source in dataset.virtual_sources()] == [
+            "filename.h5_000001.h5",
+            "filename.h5_000002.h5",
+        ]
+    # Frames are written in blocks of 2 to each process in turn, and are only
+    # collectable when all the frames before them are written
+    set_mock_value(odin.fp[1].frames_written, 4)
+    assert await odin_det.get_index() == 2
+    set_mock_value(odin.fp[2].frames_written, 3)
+    assert await odin_det.get_index() == 7
+
+
+async def test_vds_laid_out_with_block_size_set_in_prepare(
+    odin_det: OdinDet, tmp_path: Path
+):
+    odin = odin_det.odin
+    odin_det.data_logic.create_vds = True
+    set_mock_value(odin.writing, True)
+    set_mock_value(odin.fp.process_frames_per_block, 2)
+
+    # Odin passes the block size on to each of the frame processes
+    def set_frames_per_block(value: int):
+        set_mock_value(odin.fp.process_frames_per_block, value)
+
+    callback_on_mock_put(odin.block_size, set_frames_per_block)
+    await odin_det.prepare(TriggerInfo(number_of_events=8))
+    # All 8 frames fit in the first block, so go to the first process
+    set_mock_value(odin.fp[1].frames_written, 8)
+    assert await odin_det.get_index() == 8
+
+
+async def test_write_rates_per_frame_process(odin_det: OdinDet):
+    odin = odin_det.odin
+    set_mock_value(odin.writing, True)
+    await odin_det.prepare(TriggerInfo())
+    rates = [odin.fp[1].write_rate, odin.fp[2].write_rate]
+    assert [rate.name for rate in rates] == [
+        "det-odin-fp-1-write_rate",
+        "det-odin-fp-2-write_rate",
+    ]
+    with patch("time.time", return_value=10.0) as mock_time:
+        set_mock_value(odin.fp[1].frames_written, 20)
+        mock_time.return_value = 12.0
+        set_mock_value(odin.fp[1].frames_written, 120)
+    assert [await rate.get_value() for rate in rates] == [50.0, 0.0]
+    # Resetting frames written for the next acquisition resets the rate
+    set_mock_value(odin.fp[1].frames_written, 0)
+    assert await rates[0].get_value() == 0.0
+    # Once stopped the rates are no longer updated
+    await odin_det.unstage()
+    with patch("time.time", return_value=10.0) as mock_time:
+        set_mock_value(odin.fp[1].frames_written, 20)
+        mock_time.return_value = 12.0
+        set_mock_value(odin.fp[1].frames_written, 120)
+    assert await rates[0].get_value() == 0.0
+
+
+async def test_only_first_file_referenced_without_vds(
+    odin_det: OdinDet, tmp_path: Path
+):
+    set_mock_value(odin_det.odin.writing, True)
+    await odin_det.prepare(TriggerInfo(number_of_events=8))
+    assert not (tmp_path / "filename.h5_vds.h5").exists()
+    set_mock_value(odin_det.odin.fp.frames_written, 3)
+    assert await odin_det.get_index() == 3
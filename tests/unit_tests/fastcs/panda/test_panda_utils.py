@@ -1,8 +1,15 @@
+import asyncio
+
 import numpy as np
 import yaml
 from bluesky import RunEngine
 
-from ophyd_async.core import YamlSettingsProvider, init_devices
+from ophyd_async.core import (
+    Settings,
+    YamlSettingsProvider,
+    callback_on_mock_put,
+    init_devices,
+)
 from ophyd_async.epics.core import epics_signal_rw
 from ophyd_async.fastcs.core import fastcs_connector
 from ophyd_async.fastcs.panda import (
@@ -145,3 +152,36 @@ async def test_save_load_panda(tmp_path, RE: RunEngine):
         "seq.2.prescale": 0.0,
         "seq.2.enable": "ZERO",
     }
+
+
+async def test_panda_units_applied_before_values():
+    mock_panda = await get_mock_panda()
+    seq = mock_panda.seq[1]
+    settings = Settings(
+        mock_panda,
+        {
+            seq.prescale: 1.0,
+            seq.prescale_units: PandaTimeUnits.S,
+            seq.repeats: 3,
+        },
+    )
+    assert [dict(batch) for batch in settings.apply_batches()] == [
+        {seq.prescale_units: PandaTimeUnits.S, seq.repeats: 3},
+        {seq.prescale: 1.0},
+    ]
+
+
+async def test_apply_panda_settings_applies_introspected_units_first(RE: RunEngine):
+    mock_panda = await get_mock_panda()
+    value, units = epics_signal_rw(int, ""), epics_signal_rw(int, "")
+    mock_panda.phase_2_signal = value
+    mock_panda.phase_2_signal_units = units
+    await asyncio.gather(value.connect(mock=True), units.connect(mock=True))
+    puts = []
+    for signal in (value, units):
+        callback_on_mock_put(signal, lambda v, name=signal.name: puts.append(name))
+    settings: Settings = Settings(mock_panda, {value: 3, units: 1})
+    RE(apply_panda_settings(settings))
+    assert puts == [units.name, value.name]
+    # The ordering is only used for that apply, not registered on the signals
+    assert [dict(batch) for batch in settings.apply_batches()] == [{value: 3, units: 1}]
@@ -1,12 +1,26 @@
+import os
 from pathlib import Path
-from unittest.mock import call
+from unittest.mock import call, patch
 
 import bluesky.plan_stubs as bps
 import numpy as np
 import pytest
 import yaml
 
-from ophyd_async.core import Settings, YamlSettingsProvider, get_mock
+from ophyd_async.core import (
+    BinarySettingsProvider,
+    Device,
+    Settings,
+    SignalR,
+    SignalRW,
+    SoftSignalBackend,
+    YamlSettingsProvider,
+    callback_on_mock_put,
+    get_mock,
+    set_mock_value,
+    settings_hash,
+    soft_signal_rw,
+)
 from ophyd_async.plan_stubs import (
     apply_settings,
     apply_settings_if_different,
@@ -15,6 +29,7 @@ from ophyd_async.plan_stubs import (
     store_settings,
 )
 from ophyd_async.testing import (
+    ExampleEnum,
     ExampleTable,
     OneOfEverythingDevice,
     ParentOfEverythingDevice,
@@ -96,6 +111,68 @@ async def test_store_config_settings(
     RE(my_plan())
 
 
+async def test_binary_settings_match_yaml(
+    RE, parent_device: ParentOfEverythingDevice, tmp_path
+):
+    yaml_provider = YamlSettingsProvider(tmp_path)
+    binary_provider = BinarySettingsProvider(tmp_path)
+
+    def my_plan():
+        yield from store_settings(yaml_provider, "test_file", parent_device)
+        yield from store_settings(binary_provider, "test_file", parent_device)
+        from_yaml = yield from retrieve_settings(
+            yaml_provider, "test_file", parent_device
+        )
+        from_binary = yield from retrieve_settings(
+            binary_provider, "test_file", parent_device
+        )
+        return from_yaml, from_binary
+
+    from_yaml, from_binary = RE(my_plan()).plan_result
+    assert from_yaml.keys() == from_binary.keys()
+    for sig, value in from_binary.items():
+        assert settings_hash(value) == settings_hash(from_yaml[sig]), sig.name
+    # Arrays are read only views of the memory mapped data
+    ndarray = from_binary[parent_device.child.ndarray]
+    assert ndarray.shape == (2, 3)
+    assert not ndarray.flags.writeable
+    assert not from_binary[parent_device.child.table]["a_float"].flags.writeable
+    # And can be applied to the device
+    RE(apply_settings(from_binary))
+    for sig, value in (await parent_device.get_signal_values()).items():
+        assert settings_hash(value) == settings_hash(from_binary[sig]), sig.name
+
+
+async def test_binary_settings_replaced_by_index(tmp_path):
+    provider = BinarySettingsProvider(tmp_path)
+    await provider.store("test_file", {"array": np.arange(3), "value": 1})
+    first = await provider.retrieve("test_file")
+    # If the index can't be replaced the stored settings are as they were
+    replace = os.replace
+
+    def replace_data_only(src, dst):
+        if dst.suffix == ".json":
+            raise OSError("crashed")
+        replace(src, dst)
+
+    with patch("os.replace", side_effect=replace_data_only):
+        with pytest.raises(OSError, match="crashed"):
+            await provider.store("test_file", {"array": np.arange(4), "value": 2})
+    assert settings_hash(await provider.retrieve("test_file")) == settings_hash(first)
+    await provider.store("test_file", {"array": np.arange(5), "value": 3})
+    second = await provider.retrieve("test_file")
+    assert second["array"].tolist() == [0, 1, 2, 3, 4]
+    assert second["value"] == 3
+    # What was retrieved before is still mapped to the old data
+    assert first["array"].tolist() == [0, 1, 2]
+    # The old data file is removed, but not the one from the failed store
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [
+        ".bin",
+        ".bin",
+        ".json",
+    ]
+
+
 async def test_retrieve_and_apply_settings(RE, parent_device: ParentOfEverythingDevice):
     provider = YamlSettingsProvider(TEST_DATA)
     expected_values = await parent_device.get_signal_values()
@@ -179,3 +256,168 @@ async def test_ignored_settings(RE, parent_device: ParentOfEverythingDevice):
         assert m.mock_calls == [call.sig_rw.put("foo")]
 
     RE(my_plan())
+
+
+async def test_apply_settings_if_different_with_provider(
+    RE, parent_device: ParentOfEverythingDevice, tmp_path
+):
+    provider = YamlSettingsProvider(tmp_path)
+    real_get_value = SignalR.get_value
+
+    def my_plan():
+        m = get_mock(parent_device)
+        yield from store_settings(provider, "test_file", parent_device)
+        settings = yield from retrieve_settings(provider, "test_file", parent_device)
+        # Storing does not record anything, so the first apply reads everything
+        assert not provider.applied_hashes("parent")
+        yield from apply_settings_if_different(
+            settings, apply_settings, provider=provider
+        )
+        assert len(provider.applied_hashes("parent")) == len(
+            [value for value in settings.values() if value is not None]
+        )
+        assert parent_device.sig_rw._cache
+        with patch.object(
+            SignalR, "get_value", autospec=True, side_effect=real_get_value
+        ) as get_value:
+            # Everything is known to be on the device, so nothing is read or set
+            yield from apply_settings_if_different(
+                settings, apply_settings, provider=provider
+            )
+            assert get_value.call_count == 0
+            assert not m.mock_calls
+            # Only a changed setting is read and set
+            settings[parent_device.sig_rw] = "foo"
+            yield from apply_settings_if_different(
+                settings, apply_settings, provider=provider
+            )
+            assert get_value.call_count == 1
+            assert m.mock_calls == [call.sig_rw.put("foo")]
+        assert provider.applied_hashes("parent")["sig_rw"] == settings_hash("foo")
+        m.reset_mock()
+        # A change made by something else is seen by the provider's monitor
+        set_mock_value(parent_device.sig_rw, "bar")
+        assert "sig_rw" not in provider.applied_hashes("parent")
+        yield from apply_settings_if_different(
+            settings, apply_settings, provider=provider
+        )
+        assert m.mock_calls == [call.sig_rw.put("foo")]
+        m.reset_mock()
+        # As is a change made by a plan
+        yield from bps.mv(parent_device.sig_rw, "baz")
+        m.reset_mock()
+        yield from apply_settings_if_different(
+            settings, apply_settings, provider=provider
+        )
+        assert m.mock_calls == [call.sig_rw.put("foo")]
+        m.reset_mock()
+        # And everything is read again after forgetting, which stops the monitors
+        provider.forget_applied("parent")
+        assert not parent_device.sig_rw._cache
+        with patch.object(
+            SignalR, "get_value", autospec=True, side_effect=real_get_value
+        ) as get_value:
+            yield from apply_settings_if_different(
+                settings, apply_settings, provider=provider
+            )
+            assert get_value.call_count == len(
+                [value for value in settings.values() if value is not None]
+            )
+        assert not m.mock_calls
+
+    RE(my_plan())
+
+
+class SubclassedSignalRW(SignalRW[str]):
+    pass
+
+
+class DeviceWithSubclassedSignal(Device):
+    def __init__(self, name: str = ""):
+        self.plain = soft_signal_rw(str, "bar")
+        self.subclassed = SubclassedSignalRW(SoftSignalBackend(str, "bar"))
+        super().__init__(name)
+
+
+async def test_apply_settings_if_different_with_provider_and_unwalked_signals(
+    RE, tmp_path
+):
+    provider = YamlSettingsProvider(tmp_path)
+    device = DeviceWithSubclassedSignal("device")
+    await device.connect()
+
+    def my_plan():
+        # walk_rw_signals doesn't find subclasses of SignalRW, so they have no
+        # name to record a hash under and are always read
+        settings = Settings(device, {device.plain: "foo", device.subclassed: "foo"})
+        yield from apply_settings_if_different(
+            settings, apply_settings, provider=provider
+        )
+        assert (yield from bps.rd(device.subclassed)) == "foo"
+        assert set(provider.applied_hashes("device")) == {"plain"}
+
+    RE(my_plan())
+
+
+async def test_settings_hash_normalises_serialised_values(tmp_path):
+    table = ExampleTable(
+        a_bool=np.array([True, False]),
+        a_int=np.array([-1, 2], dtype=np.int32),
+        a_float=np.array([0.1, 2.5]),
+        a_str=["a", "b"],
+        a_enum=[ExampleEnum.A, ExampleEnum.B],
+    )
+    provider = YamlSettingsProvider(tmp_path)
+    await provider.store("test_file", {"table": table})
+    serialised = await provider.retrieve("test_file")
+    assert settings_hash(table) == settings_hash(serialised["table"])
+    assert settings_hash(np.array([1, 2], dtype=np.int8)) == settings_hash([1, 2])
+    assert settings_hash([1, 2]) != settings_hash([1, 3])
+    assert settings_hash("1") != settings_hash(1)
+
+
+class ChainedDevice(Device):
+    def __init__(self, name: str = ""):
+        self.a = soft_signal_rw(int)
+        self.b = soft_signal_rw(int)
+        self.c = soft_signal_rw(int)
+        self.d = soft_signal_rw(int)
+        super().__init__(name)
+        self.apply_after = {self.b: [self.a], self.c: [self.a, self.b]}
+
+
+def test_settings_apply_batches():
+    device = ChainedDevice("device")
+    a, b, c, d = device.a, device.b, device.c, device.d
+    settings = Settings(device, {a: 1, b: 2, c: 3, d: 4})
+    assert [dict(batch) for batch in settings.apply_batches()] == [
+        {a: 1, b: 2, c: 3, d: 4}
+    ]
+    assert [dict(batch) for batch in settings.apply_batches(device.apply_after)] == [
+        {a: 1, d: 4},
+        {b: 2},
+        {c: 3},
+    ]
+    # Dependencies outside the Settings are ignored
+    settings = Settings(device, {c: 3, a: 1})
+    assert [dict(batch) for batch in settings.apply_batches(device.apply_after)] == [
+        {a: 1},
+        {c: 3},
+    ]
+    with pytest.raises(ValueError, match="Circular apply dependencies between"):
+        settings.apply_batches({**device.apply_after, a: [c]})
+
+
+async def test_apply_settings_in_batches_with_one_message(RE):
+    device = ChainedDevice("device")
+    await device.connect(mock=True)
+    puts = []
+    for signal in (device.a, device.b, device.c, device.d):
+        callback_on_mock_put(signal, lambda v, name=signal.name: puts.append(name))
+    messages = []
+    RE.msg_hook = messages.append
+    settings = Settings(device, {device.c: 3, device.b: 2, device.a: 1, device.d: 4})
+    RE(apply_settings(settings, device.apply_after))
+    assert set(puts[:2]) == {"device-a", "device-d"}
+    assert puts[2:] == ["device-b", "device-c"]
+    assert [msg.command for msg in messages] == ["wait_for"]
@@ -10,7 +10,12 @@ import numpy as np
 import pytest
 from bluesky.run_engine import RunEngine
 
-from ophyd_async.core import StaticFilenameProvider, StaticPathProvider, TriggerInfo
+from ophyd_async.core import (
+    ChunkPolicy,
+    StaticFilenameProvider,
+    StaticPathProvider,
+    TriggerInfo,
+)
 from ophyd_async.sim import SimBlobDetector
 from ophyd_async.testing import assert_emitted
 
@@ -130,3 +135,27 @@ async def test_sim_blob_detector_fly(RE: RunEngine, blob_detector: SimBlobDetect
         540424,
         524808,
     ]
+
+
+def test_sim_blob_detector_uses_chunk_policy(RE: RunEngine, tmp_path):
+    path_provider = StaticPathProvider(StaticFilenameProvider("file"), tmp_path)
+    blob_detector = SimBlobDetector(
+        path_provider,
+        chunk_policy=ChunkPolicy(target_chunk_bytes=320 * 240 * 4, compression="gzip"),
+        name="det",
+    )
+    docs = defaultdict(list)
+    RE.subscribe(lambda name, doc: docs[name].append(doc))
+    RE(bp.count([blob_detector], num=1))
+    chunk_shapes = {
+        doc["data_key"]: doc["parameters"]["chunk_shape"]
+        for doc in docs["stream_resource"]
+    }
+    # The sum is small, so its chunks are limited by the 5Hz default frame rate
+    # filling them within a second
+    assert chunk_shapes == {"det": (4, 240, 320), "det-sum": (5,)}
+    with h5py.File(tmp_path / "file.h5") as file:
+        data = file["/entry/data/data"]
+        assert isinstance(data, h5py.Dataset)
+        assert data.chunks == (4, 240, 320)
+        assert data.compression == "gzip"
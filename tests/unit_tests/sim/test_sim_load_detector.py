@@ -0,0 +1,133 @@
+import asyncio
+import os
+import time
+from collections import defaultdict
+
+import bluesky.plan_stubs as bps
+import bluesky.plans as bp
+import bluesky.preprocessors as bpp
+import h5py
+import pytest
+from bluesky.protocols import Reading
+from bluesky.run_engine import RunEngine
+
+from ophyd_async.core import (
+    ChunkPolicy,
+    StaticFilenameProvider,
+    StaticPathProvider,
+    TriggerInfo,
+)
+from ophyd_async.sim import SimLoadDetector
+from ophyd_async.testing import assert_emitted
+
+
+def make_load_detector(
+    tmp_path, frame_rate: float | None, batch_period: float = 0.1
+) -> SimLoadDetector:
+    path_provider = StaticPathProvider(StaticFilenameProvider("file"), tmp_path)
+    return SimLoadDetector(
+        path_provider,
+        width=64,
+        height=48,
+        frame_rate=frame_rate,
+        # 4 frames per chunk
+        chunk_policy=ChunkPolicy(target_chunk_bytes=4 * 64 * 48 * 2),
+        batch_period=batch_period,
+        name="det",
+    )
+
+
+async def write_and_record_images_written(
+    det: SimLoadDetector, number_of_events: int
+) -> list[int]:
+    await det.connect()
+    await det.stage()
+    await det.prepare(TriggerInfo(number_of_events=number_of_events))
+    images_written = []
+
+    def on_reading(reading: dict[str, Reading[int]]):
+        images_written.extend(r["value"] for r in reading.values())
+
+    det.load_generator.images_written.subscribe_reading(on_reading)
+    start = time.monotonic()
+    await det.kickoff()
+    await det.complete()
+    # Frames are not written faster than the frame rate
+    assert time.monotonic() - start >= (number_of_events - 1) / 100
+    await det.unstage()
+    det.load_generator.images_written.clear_sub(on_reading)
+    return images_written
+
+
+def test_sim_load_detector_fly(RE: RunEngine, tmp_path):
+    det = make_load_detector(tmp_path, frame_rate=None)
+
+    @bpp.stage_decorator([det])
+    @bpp.run_decorator()
+    def fly_plan():
+        yield from bps.prepare(det, TriggerInfo(number_of_events=10), wait=True)
+        yield from bps.declare_stream(det, name="primary")
+        yield from bps.kickoff(det, wait=True)
+        yield from bps.collect_while_completing(
+            flyers=[det], dets=[det], flush_period=0.1
+        )
+
+    docs = defaultdict(list)
+    RE.subscribe(lambda name, doc: docs[name].append(doc))
+    RE(fly_plan())
+    assert_emitted(
+        docs, start=1, descriptor=1, stream_resource=1, stream_datum=1, stop=1
+    )
+    assert docs["stream_resource"][0]["parameters"]["chunk_shape"] == (4, 48, 64)
+    assert docs["stream_datum"][0]["indices"] == {"start": 0, "stop": 10}
+    path = docs["stream_resource"][0]["uri"].split("://localhost")[-1]
+    if os.name == "nt":
+        path = path.lstrip("/")
+    with h5py.File(path) as file:
+        data = file["/entry/data/data"]
+        assert isinstance(data, h5py.Dataset)
+        assert data.shape == (10, 48, 64)
+        assert data.dtype == "<u2"
+        assert data.chunks == (4, 48, 64)
+
+
+async def test_sim_load_detector_writes_chunks_at_frame_rate(tmp_path):
+    # Only one frame is due each batch period, so a whole chunk is written
+    det = make_load_detector(tmp_path, frame_rate=100, batch_period=0.01)
+    images_written = await write_and_record_images_written(det, 10)
+    # Whole chunks are written at a time, apart from the last partial chunk
+    assert images_written == [0, 4, 8, 10]
+
+
+async def test_sim_load_detector_writes_frames_due_each_batch_period(tmp_path):
+    # 10 frames are due each batch period, rounded up to 3 whole chunks
+    det = make_load_detector(tmp_path, frame_rate=100, batch_period=0.1)
+    images_written = await write_and_record_images_written(det, 30)
+    assert images_written == [0, 12, 24, 30]
+
+
+@pytest.mark.timeout(5)
+async def test_sim_load_detector_stops_writing_when_unstaged(tmp_path):
+    det = make_load_detector(tmp_path, frame_rate=10)
+    await det.connect()
+    await det.stage()
+    await det.prepare(TriggerInfo(number_of_events=1000))
+    await det.kickoff()
+    await asyncio.sleep(0.5)
+    await det.unstage()
+    assert 4 <= await det.load_generator.images_written.get_value() < 1000
+
+
+def test_sim_load_detector_step_scan(RE: RunEngine, tmp_path):
+    det = make_load_detector(tmp_path, frame_rate=None)
+    docs = defaultdict(list)
+    RE.subscribe(lambda name, doc: docs[name].append(doc))
+    RE(bp.count([det], num=3))
+    assert_emitted(
+        docs, start=1, descriptor=1, stream_resource=1, stream_datum=3, event=3, stop=1
+    )
+    assert [doc["indices"] for doc in docs["stream_datum"]] == [
+        {"start": 0, "stop": 1},
+        {"start": 1, "stop": 2},
+        {"start": 2, "stop": 3},
+    ]
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous budget for the self time of ophyd_async's own modules, excluding
+# the time taken to import their dependencies
+OPHYD_ASYNC_SELF_IMPORT_BUDGET_US = 500_000
+
+
+def _self_import_times_us(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_us, _, name = line.removeprefix("import time:").split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module", ["ophyd_async.core", "ophyd_async.epics.core", "ophyd_async.fastcs.panda"]
+)
+def test_slow_optional_imports_are_deferred(module: str):
+    times = _self_import_times_us(module)
+    assert module in times
+    for deferred in ("aioca", "p4p", "yaml", "stamina"):
+        assert deferred not in times
+    own_time = sum(t for name, t in times.items() if name.startswith("ophyd_async"))
+    assert own_time < OPHYD_ASYNC_SELF_IMPORT_BUDGET_US
+
+
+def test_deferred_transports_are_importable():
+    from ophyd_async.core import YamlSettingsProvider
+    from ophyd_async.epics.core import CaSignalBackend, PvaSignalBackend
+
+    assert YamlSettingsProvider.__module__ == "ophyd_async.core._yaml_settings"
+    assert CaSignalBackend.__module__ == "ophyd_async.epics.core._aioca"
+    assert PvaSignalBackend.__module__ == "ophyd_async.epics.core._p4p"